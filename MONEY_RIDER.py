@@ -1,10 +1,31 @@
 
+import time
+STARTUP_ORIGIN = time.perf_counter()   # cold-start timings are measured from here, imports included
+
 import tkinter as tk
-from tkinter import messagebox, simpledialog, ttk
-from datetime import datetime
+from tkinter import font as tkfont, messagebox, simpledialog, ttk
+from datetime import date, datetime, timedelta
+from collections import Counter, OrderedDict
+from itertools import islice
+from array import array
+import bisect
 import calendar
+import glob
+import gzip
+import hashlib
+import heapq
 import json
+import math
+import mmap
+import operator
 import os
+import queue
+import struct
+import sys
+import threading
+import traceback
+# asyncio, the sync (http/urllib) and fleet (multiprocessing) modules are
+# imported where they are used so they do not slow down every start
 
 # Dynamic Resolution Configuration
 class ResponsiveConfig:
@@ -13,16 +34,15 @@ class ResponsiveConfig:
         self.screen_width = 0
         self.screen_height = 0
         self.dpi_scale = 1.0
-        
-        # Initialize with a temporary window to get screen info
-        temp_root = tk.Tk()
-        temp_root.withdraw()  # Hide the window
-        self.screen_width = temp_root.winfo_screenwidth()
-        self.screen_height = temp_root.winfo_screenheight()
-        temp_root.destroy()
-        
-        # Calculate responsive dimensions
+
+    def measure(self, root):
+        """Size everything for the screen the first window opened on"""
+        # The first real window reports the screen, so importing the module
+        # (e.g. in fleet worker processes) never opens a throwaway Tk
+        self.screen_width = root.winfo_screenwidth()
+        self.screen_height = root.winfo_screenheight()
         self.calculate_responsive_dimensions()
+        FONT_SPECS.update(font_specs(self))
         
     def calculate_responsive_dimensions(self):
         """Calculate responsive dimensions based on screen size"""
@@ -93,55 +113,81 @@ MODERN_COLORS = {
 }
 
 # Dynamic font configuration based on screen resolution
-MODERN_FONTS = {
-    'title': ('Segoe UI', responsive_config.title_font_size, 'bold'),
-    'heading': ('Segoe UI', responsive_config.heading_font_size, 'bold'),
-    'subheading': ('Segoe UI', responsive_config.subheading_font_size, 'bold'),
-    'body': ('Segoe UI', responsive_config.body_font_size),
-    'small': ('Segoe UI', responsive_config.small_font_size)
+def font_specs(config):
+    return {
+        'title': ('Segoe UI', config.title_font_size, 'bold'),
+        'heading': ('Segoe UI', config.heading_font_size, 'bold'),
+        'subheading': ('Segoe UI', config.subheading_font_size, 'bold'),
+        'body': ('Segoe UI', config.body_font_size, 'normal'),
+        'small': ('Segoe UI', config.small_font_size, 'normal'),
+        'button': ('Segoe UI', max(int(14 * config.scale_factor), 12), 'bold'),
+        'entry': ('Segoe UI', max(int(16 * config.scale_factor), 12), 'normal')
+    }
+
+FONT_SPECS = {}   # filled by responsive_config.measure() when the first window opens
+
+# Widgets refer to fonts by name; install_theme() creates them once on the app root
+MODERN_FONTS = {key: f"MoneyRider{key.title()}"
+                for key in ('title', 'heading', 'subheading', 'body', 'small', 'button', 'entry')}
+
+# Button style -> (background, hover background)
+BUTTON_COLORS = {
+    'primary': (MODERN_COLORS['primary'], MODERN_COLORS['primary_dark']),
+    'secondary': (MODERN_COLORS['secondary'], '#6D28D9'),
+    'success': (MODERN_COLORS['success'], '#059669'),
+    'danger': (MODERN_COLORS['danger'], '#DC2626'),
+    'warning': (MODERN_COLORS['warning'], '#D97706'),
+    'default': (MODERN_COLORS['dark'], '#374151')
 }
 
+# Bind tag shared by every hover-highlighted button. The handlers are bound
+# once per root with bind_class, so buttons carry no per-widget closures.
+HOVER_TAG = "MoneyRiderHover"
+
+def _hover_enter(event):
+    event.widget.configure(bg=event.widget.cget('activebackground'))
+
+def _hover_leave(event):
+    event.widget.configure(bg=event.widget.normal_bg)
+
+def set_hover_colors(widget, bg, hover_bg):
+    """Give a tk widget its normal/hover colours and the shared hover bindings"""
+    widget.normal_bg = bg
+    widget.configure(bg=bg, activebackground=hover_bg)
+    if HOVER_TAG not in widget.bindtags():
+        widget.bindtags(widget.bindtags() + (HOVER_TAG,))
+
+def install_theme(root):
+    """Create the named fonts, ttk styles and hover bindings for a Tk root"""
+    # Keep the Font objects alive: Tk deletes a named font when its owner is collected
+    root.theme_fonts = [
+        tkfont.Font(root=root, name=MODERN_FONTS[key], family=family, size=size, weight=weight)
+        for key, (family, size, weight) in FONT_SPECS.items()
+    ]
+
+    style = ttk.Style(root)
+    style.configure('Money.TNotebook', tabposition='n')
+    style.configure('Money.TNotebook.Tab', padding=[20, 10], font=MODERN_FONTS['body'])
+
+    root.bind_class(HOVER_TAG, "<Enter>", _hover_enter)
+    root.bind_class(HOVER_TAG, "<Leave>", _hover_leave)
+    install_scroll_bindings(root)
+
 def create_modern_button(parent, text, command=None, style='primary', width=None, height=None):
     """Create a mobile-friendly styled button with responsive sizing"""
-    if style == 'primary':
-        bg = MODERN_COLORS['primary']
-        hover_bg = MODERN_COLORS['primary_dark']
-        fg = MODERN_COLORS['white']
-    elif style == 'secondary':
-        bg = MODERN_COLORS['secondary']
-        hover_bg = '#6D28D9'
-        fg = MODERN_COLORS['white']
-    elif style == 'success':
-        bg = MODERN_COLORS['success']
-        hover_bg = '#059669'
-        fg = MODERN_COLORS['white']
-    elif style == 'danger':
-        bg = MODERN_COLORS['danger']
-        hover_bg = '#DC2626'
-        fg = MODERN_COLORS['white']
-    elif style == 'warning':
-        bg = MODERN_COLORS['warning']
-        hover_bg = '#D97706'
-        fg = MODERN_COLORS['white']
-    else:  # default
-        bg = MODERN_COLORS['dark']
-        hover_bg = '#374151'
-        fg = MODERN_COLORS['white']
+    bg, hover_bg = BUTTON_COLORS.get(style, BUTTON_COLORS['default'])
+    fg = MODERN_COLORS['white']
     
     # Responsive button sizing
     button_height = responsive_config.button_height if height is None else height
     button_width = responsive_config.button_width if width is None else width
     
-    # Responsive font size for buttons
-    button_font_size = max(int(14 * responsive_config.scale_factor), 12)
-    
     button = tk.Button(
         parent,
         text=text,
-        command=command,
-        bg=bg,
+        command=render_tracer.wrap_command(text, command),
         fg=fg,
-        font=('Segoe UI', button_font_size, 'bold'),
+        font=MODERN_FONTS['button'],
         relief='flat',
         bd=0,
         cursor='hand2',
@@ -149,29 +195,18 @@ def create_modern_button(parent, text, command=None, style='primary', width=None
         height=button_height,
         padx=responsive_config.button_padding_x,
         pady=responsive_config.button_padding_y,
-        activebackground=hover_bg,
         activeforeground=fg
     )
-    
-    def on_enter(e):
-        button.config(bg=hover_bg)
-    
-    def on_leave(e):
-        button.config(bg=bg)
-    
-    button.bind("<Enter>", on_enter)
-    button.bind("<Leave>", on_leave)
+    set_hover_colors(button, bg, hover_bg)
     
     return button
 
 def create_modern_entry(parent, placeholder="", show=None):
     """Create a mobile-friendly styled entry field for dark mode with responsive sizing"""
-    # Responsive font size for entry fields
-    entry_font_size = max(int(16 * responsive_config.scale_factor), 12)
-    
+    # Responsive font size for entry fields (shared named font)
     entry = tk.Entry(
         parent,
-        font=('Segoe UI', entry_font_size),
+        font=MODERN_FONTS['entry'],
         relief='flat',
         bd=2,
         highlightthickness=3,
@@ -229,11 +264,19 @@ def create_scrollable_frame(parent, bg=None):
     
     scrollable_frame = tk.Frame(canvas, bg=bg)
     
-    # Configure scrolling
-    scrollable_frame.bind(
-        "<Configure>",
-        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-    )
+    # Configure scrolling: a burst of <Configure> events while a screen is
+    # being built recomputes the scroll region only once, on the next idle
+    update_pending = []
+
+    def update_scrollregion():
+        update_pending.clear()
+        canvas.configure(scrollregion=canvas.bbox("all"))
+
+    def schedule_scrollregion_update(e):
+        if not update_pending:
+            update_pending.append(canvas.after_idle(update_scrollregion))
+
+    scrollable_frame.bind("<Configure>", schedule_scrollregion_update)
     
     canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
     canvas.configure(yscrollcommand=scrollbar.set)
@@ -242,11 +285,10 @@ def create_scrollable_frame(parent, bg=None):
     canvas.pack(side="left", fill="both", expand=True, padx=(0, 0))
     scrollbar.pack(side="right", fill="y", padx=(0, 0))
     
-    # Bind mousewheel to canvas
-    def _on_mousewheel(event):
-        canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-    
-    canvas.bind_all("<MouseWheel>", _on_mousewheel)
+    # Mouse wheel scrolls whichever container is under the pointer
+    # (see install_scroll_bindings), so nothing is bound globally here
+    canvas.scroll_canvas = canvas
+    scrollable_frame.scroll_canvas = canvas
     
     # Store references for cleanup
     main_frame.canvas = canvas
@@ -255,22 +297,156 @@ def create_scrollable_frame(parent, bg=None):
     
     return main_frame
 
+def _scroll_canvas_under_pointer(root, event):
+    """Find the scroll container canvas under the mouse, if any"""
+    try:
+        widget = root.winfo_containing(event.x_root, event.y_root)
+    except (KeyError, tk.TclError):
+        # Pointer is over a Tk-internal widget such as a combobox popdown
+        return None
+    while widget is not None:
+        canvas = getattr(widget, 'scroll_canvas', None)
+        if canvas is not None:
+            return canvas
+        widget = widget.master
+    return None
+
+def install_scroll_bindings(root):
+    """Route mouse wheel events (Windows/macOS <MouseWheel>, X11 buttons 4/5) to the hovered container"""
+    def on_wheel(event):
+        canvas = _scroll_canvas_under_pointer(root, event)
+        if canvas is None or canvas.yview() == (0.0, 1.0):
+            return
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        else:
+            # Windows reports multiples of 120, macOS small deltas
+            units = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        canvas.yview_scroll(units, "units")
+
+    root.bind_all("<MouseWheel>", on_wheel)
+    root.bind_all("<Button-4>", on_wheel)
+    root.bind_all("<Button-5>", on_wheel)
+
+# ---------------- Render latency tracing ----------------
+# Set MONEY_RIDER_TRACE=trace.json to record how long each screen takes from
+# the button click to the first idle callback. The file uses the Chrome
+# trace-event format, so it can be opened in chrome://tracing or Perfetto.
+TRACE_FILE = os.environ.get("MONEY_RIDER_TRACE")
+
+class RenderTracer:
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = bool(path)
+        self.events = []
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.open_screen = None
+
+    def _now(self):
+        """Microseconds since the tracer was created"""
+        return (time.perf_counter() - self.origin) * 1_000_000
+
+    def _add(self, name, phase, cat, **extra):
+        event = {"name": name, "cat": cat, "ph": phase, "ts": self._now(),
+                 "pid": self.pid, "tid": threading.get_ident()}
+        event.update(extra)
+        self.events.append(event)
+
+    def click(self, label):
+        """Mark the moment a button was pressed"""
+        if self.enabled:
+            self._add(f"click: {label}", "i", "input", s="p")
+
+    def wrap_command(self, label, command):
+        """Wrap a button command so the click is timestamped before it runs"""
+        if not self.enabled or command is None:
+            return command
+
+        def traced_command():
+            self.click(label)
+            return command()
+        return traced_command
+
+    def navigation_start(self, screen):
+        """Open the span that covers a screen from construction to first idle"""
+        if not self.enabled:
+            return
+        if self.open_screen:
+            # Previous screen never reached idle (e.g. it navigated away at once)
+            self._add(self.open_screen, "E", "screen")
+        self.open_screen = screen
+        self._add(screen, "B", "screen")
+
+    def begin(self, section):
+        if self.enabled:
+            self._add(section, "B", "section")
+
+    def end(self, section):
+        if self.enabled:
+            self._add(section, "E", "section")
+
+    def watch_first_idle(self, window):
+        """Close the current screen span on the window's first idle callback"""
+        if not self.enabled or not self.open_screen:
+            return
+        screen = self.open_screen
+
+        def on_idle():
+            if self.open_screen != screen:
+                return
+            self._add("first idle", "i", "idle", s="t")
+            self._add(screen, "E", "screen")
+            self.open_screen = None
+            self.flush()
+        window.after_idle(on_idle)
+
+    def flush(self):
+        if not self.enabled:
+            return
+        try:
+            with open(self.path, "w") as f:
+                json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        except OSError:
+            # Tracing must never break the app
+            pass
+
+render_tracer = RenderTracer(TRACE_FILE)
+
+# ---------------- Startup profiling ----------------
+# Set MONEY_RIDER_STARTUP=1, or run with --profile-startup (which quits once
+# the splash is interactive), to print how long a cold start takes to paint
+# the splash and to have its buttons ready.
+STARTUP_PROFILE = bool(os.environ.get("MONEY_RIDER_STARTUP")) or "--profile-startup" in sys.argv
+
+class StartupProfiler:
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.marks = {}   # name -> ms since STARTUP_ORIGIN
+
+    def mark(self, name):
+        if name in self.marks:
+            return
+        self.marks[name] = (time.perf_counter() - STARTUP_ORIGIN) * 1000
+        if render_tracer.enabled:
+            render_tracer._add(f"startup: {name}", "i", "startup", s="g")
+        if self.enabled and name == "interactive":
+            print(f"Startup: first paint {self.marks['first paint']:.0f} ms, "
+                  f"interactive {self.marks['interactive']:.0f} ms", file=sys.stderr)
+
+startup_profiler = StartupProfiler(STARTUP_PROFILE)
+
 # --- Storage files/folders ---
 ACCOUNTS_FILE = "accounts.json"
 USERS_FOLDER = "users"
-if not os.path.exists(USERS_FOLDER):
-    os.makedirs(USERS_FOLDER)
 
 
 accounts = {}            
 current_user = None
-
-current_entries = []
-current_expenses = []
-undo_stack = []
-redo_stack = []
-undo_expense_stack = []
-redo_expense_stack = []
+# The signed-in rider's ledger and editing state live on rider (a RiderState,
+# see "User sessions"); signing in swaps the whole object
 
 # Navigation history for undo functionality
 navigation_history = []
@@ -278,6 +454,7 @@ navigation_history = []
 def add_to_history(function_name, *args):
     """Add current screen to navigation history"""
     global navigation_history
+    render_tracer.navigation_start(function_name)
     navigation_history.append((function_name, args))
     # Keep only last 10 entries to prevent memory issues
     if len(navigation_history) > 10:
@@ -309,7 +486,7 @@ def navigate_back():
         elif prev_function == 'splash_screen':
             splash_screen()
     else:
-        messagebox.showinfo("Info", "No previous page to go back to")
+        messagebox.showinfo("Info", "No previous page to go back to", parent=get_app_root())
 
 def create_undo_button(parent, command=None, style='warning', width=15):
     """Create a standardized undo button"""
@@ -321,11 +498,214 @@ def create_undo_button(parent, command=None, style='warning', width=15):
                                    style=style, width=width)
     return undo_btn
 
-def add_global_undo_shortcut(window):
-    """Add Ctrl+Z keyboard shortcut for undo functionality"""
-    window.bind('<Control-z>', lambda e: navigate_back())
-    window.bind('<Control-Z>', lambda e: navigate_back())
+def add_global_undo_shortcut(window, undo=None, redo=None):
+    """Add keyboard shortcuts: Alt+Left goes back, Ctrl+Z/Ctrl+Y undo and redo edits.
+
+    Screens without entry editing keep Ctrl+Z as "go back".
+    """
+    def go_back(e):
+        # Keep this window when there is nowhere to go back to
+        if len(navigation_history) >= 2:
+            leave_screen(window)
+        navigate_back()
+
+    window.bind('<Alt-Left>', go_back)
+    if undo is None:
+        window.bind('<Control-z>', go_back)
+        window.bind('<Control-Z>', go_back)
+        return
+    window.bind('<Control-z>', lambda e: undo())
+    if redo is not None:
+        window.bind('<Control-y>', lambda e: redo())
+        window.bind('<Control-Z>', lambda e: redo())  # Ctrl+Shift+Z
+
+# ---------------- Background tasks (asyncio loop beside the Tk mainloop) ----------------
+# Tk owns the main thread, so coroutines run on an asyncio loop in a daemon
+# thread. Everything that must happen on the Tk thread - delivering results
+# to widgets, changing the ledger - goes through a thread-safe queue that the
+# active screen drains every ASYNC_POLL_MS while tasks are pending.
+ASYNC_POLL_MS = 30
+
+def _resolve_future(future, result=None, error=None):
+    if future.cancelled():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
 
+class TkAsyncBridge:
+    """Runs coroutines off the Tk thread and hands their results back to it"""
+    def __init__(self):
+        self.loop = None
+        self.calls = queue.Queue()   # (function, args, asyncio future or None)
+        self.pending = 0             # submitted tasks not yet delivered
+        self.root = None             # window whose after() pumps the queue
+        self._chain = 0
+
+    def _ensure_loop(self):
+        if self.loop is None:
+            import asyncio
+            self.loop = asyncio.new_event_loop()
+            threading.Thread(target=self.loop.run_forever, name="async-bridge", daemon=True).start()
+        return self.loop
+
+    def submit(self, coroutine, on_done=None, on_error=None):
+        """Run a coroutine; on_done(result) or on_error(exception) is called on the Tk thread"""
+        import asyncio
+        self.pending += 1
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop())
+        future.add_done_callback(lambda f: self.calls.put((self._deliver, (f, on_done, on_error), None)))
+        self._start_pump()
+        return future
+
+    def _deliver(self, future, on_done, on_error):
+        self.pending -= 1
+        error = future.exception()
+        if error is not None:
+            if on_error is None:
+                raise error
+            on_error(error)
+        elif on_done is not None:
+            on_done(future.result())
+
+    async def in_tk(self, function, *args):
+        """Await function(*args) run on the Tk thread"""
+        import asyncio
+        future = asyncio.get_running_loop().create_future()
+        self.calls.put((function, args, future))
+        return await future
+
+    def attach(self, root):
+        """Pump from this Tk root; called once the app root exists"""
+        self.root = root
+        if self.pending:
+            self._start_pump()
+
+    def _start_pump(self):
+        # A new chain replaces any running one, so only one pump is ever live
+        self._chain += 1
+        chain = self._chain
+        self.root.after(ASYNC_POLL_MS, lambda: self._pump(chain))
+
+    def _pump(self, chain):
+        if chain != self._chain:
+            return
+        while True:
+            try:
+                function, args, future = self.calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                result = function(*args)
+            except Exception as error:
+                if future is None:
+                    self.root.report_callback_exception(*sys.exc_info())
+                else:
+                    self.loop.call_soon_threadsafe(_resolve_future, future, None, error)
+            else:
+                if future is not None:
+                    self.loop.call_soon_threadsafe(_resolve_future, future, result)
+        if self.pending:
+            try:
+                self.root.after(ASYNC_POLL_MS, lambda: self._pump(chain))
+            except tk.TclError:
+                pass   # The app is closing
+
+async_bridge = TkAsyncBridge()
+
+async def run_blocking(function, *args):
+    """Await a blocking call (file or network I/O) run in the loop's thread pool"""
+    import asyncio
+    return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+async def on_tk_thread(function, *args):
+    """Await function(*args) on the thread that owns the ledger globals"""
+    if threading.current_thread() is threading.main_thread():
+        # Run headless with asyncio.run: this already is that thread
+        return function(*args)
+    return await async_bridge.in_tk(function, *args)
+
+# ---------------- Screen cache (instant back-navigation) ----------------
+# Leaving a cacheable screen hides its window instead of destroying it, so
+# coming back to it (Back button, Alt+Left, "Return to Calendar") only has to
+# refresh the data shown instead of rebuilding every widget. Every screen is
+# a Toplevel of one hidden Tk root, so cached screens share a single Tcl
+# interpreter with its fonts and styles.
+SCREEN_CACHE_SIZE = 4
+CACHEABLE_SCREENS = ('calendar_screen', 'income_screen', 'expenses_screen', 'total_screen')
+screen_cache = OrderedDict()   # (screen, args) -> hidden screen window, oldest first
+app_root = None                # the hidden Tk root, created with the first screen
+
+def get_app_root():
+    """Return the hidden Tk root every screen belongs to, creating it on first use"""
+    global app_root
+    if app_root is None:
+        app_root = tk.Tk()
+        app_root.withdraw()
+        responsive_config.measure(app_root)
+        install_theme(app_root)
+        async_bridge.attach(app_root)
+    return app_root
+
+def new_screen_window(screen, *args):
+    """Create the window for a screen"""
+    window = tk.Toplevel(get_app_root())
+    window.screen_key = (screen, args) if screen in CACHEABLE_SCREENS else None
+    window.left_screen = False
+    window.protocol("WM_DELETE_WINDOW", lambda: quit_app(window))
+    return window
+
+def show_cached_screen(screen, *args):
+    """Re-show a cached screen with refreshed data; returns False on a cache miss"""
+    window = screen_cache.pop((screen, args), None)
+    if window is None:
+        return False
+    window.left_screen = False
+    window.deiconify()
+    refresh = getattr(window, "refresh_screen", None)
+    if refresh is not None:
+        refresh()
+    render_tracer.watch_first_idle(window)
+    return True
+
+def leave_screen(window):
+    """Hide a screen for later reuse, destroying the least recently used one if full"""
+    if window.left_screen:
+        return
+    window.left_screen = True
+    if window.screen_key is None or SCREEN_CACHE_SIZE <= 0:
+        window.destroy()
+        return
+    window.withdraw()
+    old = screen_cache.pop(window.screen_key, None)
+    if old is not None:
+        old.destroy()
+    screen_cache[window.screen_key] = window
+    while len(screen_cache) > SCREEN_CACHE_SIZE:
+        _, evicted = screen_cache.popitem(last=False)
+        evicted.destroy()
+
+def clear_screen_cache():
+    while screen_cache:
+        _, window = screen_cache.popitem()
+        window.destroy()
+
+def quit_app(window):
+    """Close the visible screen, every hidden one and the root so mainloop can end"""
+    global app_root
+    clear_screen_cache()
+    window.destroy()
+    if app_root is not None:
+        app_root.destroy()
+        app_root = None
+
+
+def load_startup_data():
+    """Startup file work, run in the background while the splash paints"""
+    if not os.path.exists(USERS_FOLDER):
+        os.makedirs(USERS_FOLDER)
+    load_accounts()
 
 def load_accounts():
     global accounts
@@ -345,32 +725,1948 @@ def save_accounts():
 def user_file(username):
     return os.path.join(USERS_FOLDER, f"{username}.json")
 
+def user_data_folder(username):
+    """Per-user folder for side files; users/*.json stays one ledger per user"""
+    return os.path.join(USERS_FOLDER, username)
+
 def load_user_data(username):
-    global financial_data
     path = user_file(username)
-    if os.path.exists(path):
+    # The binary snapshot loads much faster; the JSON is read when it is missing or stale
+    rider.financial_data = read_snapshot(username)
+    if rider.financial_data is None and os.path.exists(path):
         try:
             with open(path, "r") as f:
-                financial_data = json.load(f)
+                rider.financial_data = json.load(f)
         except Exception:
-            financial_data = {}
-    else:
-        financial_data = {}
+            rider.financial_data = {}
+        if not isinstance(rider.financial_data, dict):
+            rider.financial_data = {}
+        if normalize_ledger(rider.financial_data):
+            # Repaired days are written back once; later loads use the snapshot
+            save_user_data(username)
+        else:
+            write_snapshot(username)
+    elif rider.financial_data is None:
+        rider.financial_data = {}
+    # Edits saved since the ledger was last written in full are folded in
+    # now, so each session starts a fresh journal
+    replayed = replay_journal(username, rider.financial_data)
+    if replayed is None:
+        os.remove(journal_file(username))
+    elif replayed:
+        save_user_data(username)
+    rider.journal_edits = 0
+    load_archive_index(username)
+    archive_closed_years(username)
+    load_recurring_rules(username)
+    load_budgets(username)
+    load_monthly_target(username)
+    clear_edit_history()
+    load_day_buffers(None)
+    start_ledger_warmup()
 
 def save_user_data(username):
     path = user_file(username)
     with open(path, "w") as f:
-        json.dump(financial_data, f, indent=2)
+        json.dump(rider.financial_data, f, indent=2)
+    write_snapshot(username)
+    # The JSON now holds every journaled edit
+    if os.path.exists(journal_file(username)):
+        os.remove(journal_file(username))
+    rider.journal_edits = 0
+
+# ---------------- Ledger schema (checked once at load, migrated per day) ----------------
+# Every stored day carries "v". A day at LEDGER_SCHEMA_VERSION has float
+# totals that match its [name, float amount] entries, so the rest of the app
+# reads it without converting; unstamped or hand-edited days are migrated the
+# first time they are loaded.
+LEDGER_SCHEMA_VERSION = 1
+
+def _clean_entries(entries):
+    """Valid (name, amount) pairs from a stored entry list; anything unreadable is dropped"""
+    cleaned = []
+    if not isinstance(entries, list):
+        return cleaned
+    for entry in entries:
+        try:
+            name, amount = entry[0], float(entry[1])
+        except (TypeError, ValueError, IndexError, KeyError):
+            continue
+        if math.isfinite(amount):
+            cleaned.append((str(name), amount))
+    return cleaned
+
+def normalize_day(day):
+    """A day in the current schema; days already stamped with it come back unchanged"""
+    if day.get("v") == LEDGER_SCHEMA_VERSION:
+        return day
+    # The entries are the record; the stored totals are recomputed from them
+    return make_day(_clean_entries(day.get("entries")), _clean_entries(day.get("expense_entries")))
+
+def _valid_date_str(date_str):
+    try:
+        return _parse_date_str(date_str).isoformat() == date_str
+    except (TypeError, ValueError):
+        return False
+
+def normalize_ledger(data):
+    """Bring a loaded ledger to the current schema in place; returns how many days changed"""
+    changed = 0
+    for date_str in list(data):
+        if not _valid_date_str(date_str) or not isinstance(data[date_str], dict):
+            del data[date_str]
+            changed += 1
+            continue
+        day = normalize_day(data[date_str])
+        if day is not data[date_str]:
+            data[date_str] = day
+            changed += 1
+    return changed
+
+# ---------------- Entry journal (edits persisted per day, compacted into the JSON) ----------------
+# users/<name>/journal.jsonl: a header line with the size and mtime of the JSON
+# ledger it applies to, then one line per edit - an entry op or a whole day.
+# A full save_user_data rewrites the JSON and removes the journal. A journal
+# whose header no longer matches the JSON was already compacted (the app
+# stopped in between) and is discarded.
+JOURNAL_COMPACT_EDITS = 500
+
+def journal_file(username):
+    return os.path.join(user_data_folder(username), "journal.jsonl")
+
+def _json_stamp(username):
+    try:
+        stat = os.stat(user_file(username))
+    except OSError:
+        return [0, 0]
+    return [stat.st_size, stat.st_mtime_ns]
+
+def ledger_stamp(username):
+    """(size, mtime) that changes whenever the JSON ledger or its journal does"""
+    size, mtime_ns = _json_stamp(username)
+    try:
+        stat = os.stat(journal_file(username))
+    except OSError:
+        return size, mtime_ns
+    return size + stat.st_size, max(mtime_ns, stat.st_mtime_ns)
+
+def apply_entry_op(data, date_str, kind, op, index, entry=None):
+    """Insert, replace or delete one entry of a stored day in place, moving its total by the delta.
+
+    Returns the op that reverses it, like _apply_entry_op.
+    """
+    day = data.get(date_str)
+    if day is None:
+        day = data[date_str] = make_day([], [])
+    key, total = ("entries", "income") if kind == "income" else ("expense_entries", "expenses")
+    op, index, removed = inverse = _apply_entry_op(day[key], op, index,
+                                                   None if entry is None else [entry[0], entry[1]])
+    if removed is not None:
+        inverse = (op, index, tuple(removed))
+        day[total] -= removed[1]
+    if entry is not None:
+        day[total] += entry[1]
+    return inverse
+
+def replay_journal(username, data):
+    """Apply a user's journal to a ledger loaded from its JSON or snapshot.
+
+    Returns the number of records applied, or None if the journal is stale.
+    A torn last line (the app stopped mid-write) ends the replay.
+    """
+    try:
+        with open(journal_file(username), "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return 0
+    try:
+        if json.loads(lines[0])["base"] != _json_stamp(username):
+            return None
+    except (IndexError, ValueError, KeyError):
+        return None
+    applied = 0
+    for line in lines[1:]:
+        try:
+            record = json.loads(line)
+            if "day" in record:
+                if record["day"] is None:
+                    data.pop(record["d"], None)
+                else:
+                    data[record["d"]] = normalize_day(record["day"])
+            else:
+                apply_entry_op(data, record["d"], record["k"], record["op"], record["i"], record.get("e"))
+        except (ValueError, KeyError, IndexError, TypeError):
+            break
+        applied += 1
+    return applied
+
+def append_journal(username, record):
+    """Persist one edit; the whole ledger is only rewritten every JOURNAL_COMPACT_EDITS edits"""
+    path = journal_file(username)
+    folder = user_data_folder(username)
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    if rider.journal_edits == 0 or not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"base": _json_stamp(username)}) + "\n")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+    rider.journal_edits += 1
+    if rider.journal_edits >= JOURNAL_COMPACT_EDITS:
+        save_user_data(username)
+
+# ---------------- Binary ledger snapshot (fast load; JSON stays import/export) ----------------
+# Layout, little-endian; every table is stored column by column so it loads
+# with array.frombytes instead of per-record unpacking:
+#   header   SNAPSHOT_HEADER: magic, version, size and mtime of the JSON it was
+#            written with, string count, day count, entry count, string bytes
+#   strings  uint32 end offset per string, then the UTF-8 names/categories
+#   days     sorted by date, one column each (SNAPSHOT_DAY_COLUMNS): date
+#            ordinal, income, expenses, first entry, income and expense counts
+#   entries  string id and amount columns; each day's income entries are
+#            followed by its expense entries
+SNAPSHOT_MAGIC = b"MRLEDGER"
+SNAPSHOT_VERSION = 3   # 2: written only from normalised ledgers; 3: uint32 entry counts
+SNAPSHOT_HEADER = struct.Struct("<8sHQqIIII")
+SNAPSHOT_DAY_COLUMNS = "IddIII"
+SNAPSHOT_ENTRY_COLUMNS = "Id"
+
+def _column_bytes(typecode, values):
+    column = array(typecode, values)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column.tobytes()
+
+def _read_column(view, position, typecode, count):
+    """Return (array, position after it) for a column starting at position"""
+    column = array(typecode)
+    end = position + column.itemsize * count
+    column.frombytes(view[position:end])
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column, end
+
+def encode_snapshot(data, json_size=0, json_mtime_ns=0):
+    strings = {}   # name -> id, in id order
+    days = [[] for _ in SNAPSHOT_DAY_COLUMNS]
+    name_ids = []
+    amounts = []
+    for date_str in sorted(data):
+        day = data[date_str]
+        income_entries = day["entries"]
+        expense_entries = day["expense_entries"]
+        row = (_parse_date_str(date_str).toordinal(), day["income"], day["expenses"],
+               len(name_ids), len(income_entries), len(expense_entries))
+        for column, value in zip(days, row):
+            column.append(value)
+        for entries in (income_entries, expense_entries):
+            for name, amount in entries:
+                name_ids.append(strings.setdefault(name, len(strings)))
+                amounts.append(amount)
+
+    encoded = [name.encode("utf-8") for name in strings]
+    ends = []
+    position = 0
+    for name in encoded:
+        position += len(name)
+        ends.append(position)
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, json_size, json_mtime_ns,
+                                  len(encoded), len(days[0]), len(name_ids), position)
+    parts = [header, _column_bytes("I", ends)] + encoded
+    parts += [_column_bytes(typecode, column) for typecode, column in zip(SNAPSHOT_DAY_COLUMNS, days)]
+    parts += [_column_bytes("I", name_ids), _column_bytes("d", amounts)]
+    return b"".join(parts)
+
+def decode_snapshot(buffer):
+    """Rebuild a normalised financial_data dict from snapshot bytes; entries come back as tuples"""
+    view = memoryview(buffer)
+    magic, version, _, _, string_count, day_count, entry_count, blob_size = SNAPSHOT_HEADER.unpack_from(view)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError("not a Money Rider ledger snapshot")
+
+    ends, position = _read_column(view, SNAPSHOT_HEADER.size, "I", string_count)
+    blob = bytes(view[position:position + blob_size])
+    position += blob_size
+    strings = [blob[start:end].decode("utf-8") for start, end in zip([0] + ends.tolist(), ends)]
+
+    days = []
+    for typecode in SNAPSHOT_DAY_COLUMNS:
+        column, position = _read_column(view, position, typecode, day_count)
+        days.append(column)
+    name_ids, position = _read_column(view, position, "I", entry_count)
+    amounts, position = _read_column(view, position, "d", entry_count)
+    # Resolving names and pairing them with amounts both run in C
+    entries = list(zip(map(strings.__getitem__, name_ids), amounts))
+
+    data = {}
+    for ordinal, income, expenses, first, income_count, expense_count in zip(*days):
+        middle = first + income_count
+        data[date.fromordinal(ordinal).isoformat()] = {
+            "income": income,
+            "expenses": expenses,
+            "entries": entries[first:middle],
+            "expense_entries": entries[middle:middle + expense_count],
+            "v": LEDGER_SCHEMA_VERSION
+        }
+    return data
+
+def snapshot_file(username):
+    return os.path.join(user_data_folder(username), "ledger.snap")
+
+def write_snapshot(username):
+    folder = user_data_folder(username)
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    stat = os.stat(user_file(username))
+    path = snapshot_file(username)
+    with open(path + ".tmp", "wb") as f:
+        f.write(encode_snapshot(rider.financial_data, stat.st_size, stat.st_mtime_ns))
+    os.replace(path + ".tmp", path)
+
+def read_snapshot(username):
+    """The ledger from its snapshot, or None if there is none or the JSON changed since"""
+    try:
+        with open(snapshot_file(username), "rb") as f:
+            buffer = f.read()
+        json_size, json_mtime_ns = SNAPSHOT_HEADER.unpack_from(buffer)[2:4]
+        stat = os.stat(user_file(username))
+        if (json_size, json_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            # The JSON was replaced or imported by hand; it wins
+            return None
+        return decode_snapshot(buffer)
+    except (OSError, ValueError, struct.error):
+        return None
+
+def synthetic_ledger(days, entries_per_day, start=date(2020, 1, 1)):
+    """A made-up ledger for benchmarks"""
+    names = ["Boundary", "Grab", "Lalamove", "Tip", "Food", "Gas", "Maintenance", "Parking"]
+    data = {}
+    for offset in range(days):
+        income_entries = [[names[(offset + i) % 4], 150.0 + (offset * 7 + i * 13) % 500]
+                          for i in range(entries_per_day // 2)]
+        expense_entries = [[names[4 + (offset + i) % 4], 20.0 + (offset * 11 + i * 5) % 200]
+                           for i in range(entries_per_day - entries_per_day // 2)]
+        data[date.fromordinal(start.toordinal() + offset).isoformat()] = make_day(income_entries, expense_entries)
+    return data
+
+def benchmark_snapshot(day_counts=(365, 1825, 3650), entries_per_day=8, repeats=5):
+    """Compare JSON and snapshot load time and file size on synthetic ledgers"""
+    print(f"{'days':>6} {'json KB':>9} {'snap KB':>9} {'json ms':>9} {'snap ms':>9} {'speedup':>8}")
+    import tempfile
+    with tempfile.TemporaryDirectory() as folder:
+        for days in day_counts:
+            data = synthetic_ledger(days, entries_per_day)
+            json_path = os.path.join(folder, "ledger.json")
+            snap_path = os.path.join(folder, "ledger.snap")
+            with open(json_path, "w") as f:
+                json.dump(data, f, indent=2)
+            with open(snap_path, "wb") as f:
+                f.write(encode_snapshot(data))
+
+            def best(load):
+                timings = []
+                for _ in range(repeats):
+                    started = time.perf_counter()
+                    load()
+                    timings.append(time.perf_counter() - started)
+                return min(timings) * 1000
+
+            def load_json():
+                with open(json_path, "r") as f:
+                    return json.load(f)
+
+            def load_snapshot():
+                with open(snap_path, "rb") as f:
+                    return decode_snapshot(f.read())
+
+            # Same ledger once tuples are written back out as JSON lists
+            assert json.loads(json.dumps(load_snapshot())) == load_json()
+            json_ms = best(load_json)
+            snap_ms = best(load_snapshot)
+            print(f"{days:>6} {os.path.getsize(json_path) / 1024:>9.1f} {os.path.getsize(snap_path) / 1024:>9.1f} "
+                  f"{json_ms:>9.2f} {snap_ms:>9.2f} {json_ms / snap_ms:>7.1f}x")
+
+# ---------------- Year archives (compressed, read-only) ----------------
+# A year is closed once this many days have passed since its 31 December
+ARCHIVE_GRACE_DAYS = 60
+ARCHIVE_CACHE_SIZE = 2
+
+
+def archive_folder(username):
+    return os.path.join(user_data_folder(username), "archive")
+
+def archive_file(username, year):
+    return os.path.join(archive_folder(username), f"{year}.json.gz")
+
+def load_archive_index(username):
+    rider.archived_years.clear()
+    try:
+        with open(os.path.join(archive_folder(username), "index.json"), "r") as f:
+            rider.archive_index = json.load(f)
+    except (OSError, ValueError):
+        rider.archive_index = {}
+
+def save_archive_index(username):
+    with open(os.path.join(archive_folder(username), "index.json"), "w") as f:
+        json.dump(rider.archive_index, f)
+
+def summarize_year(days):
+    """Totals kept in the index so range queries never decompress an archive"""
+    day_totals = {}
+    category_sums = {"income": {}, "expense": {}}
+    name_days = {"income": {}, "expense": {}}
+    for date_str, day in sorted(days.items()):
+        day_totals[date_str] = [day["income"], day["expenses"]]
+        for kind, key in (("income", "entries"), ("expense", "expense_entries")):
+            sums = category_sums[kind]
+            for name, amount in day[key]:
+                sums[name] = sums.get(name, 0.0) + amount
+                dates = name_days[kind].setdefault(name, [])
+                if not dates or dates[-1] != date_str:
+                    dates.append(date_str)
+    return {"day_totals": day_totals, "category_sums": category_sums, "name_days": name_days}
+
+def read_archived_year(year):
+    """Decompress a year's archive, keeping the last few opened in memory"""
+    days = rider.archived_years.get(year)
+    if days is None:
+        with gzip.open(archive_file(current_user, year), "rt", encoding="utf-8") as f:
+            days = json.load(f)
+        # Archives are read-only, so older days are migrated in memory only
+        normalize_ledger(days)
+        rider.archived_years[year] = days
+        if len(rider.archived_years) > ARCHIVE_CACHE_SIZE:
+            rider.archived_years.popitem(last=False)
+    else:
+        rider.archived_years.move_to_end(year)
+    return days
+
+def get_day(date_str, default=None):
+    """A day from the live ledger, falling through to its year's archive"""
+    day = rider.financial_data.get(date_str)
+    if day is None and date_str:
+        summary = rider.archive_index.get(date_str[:4])
+        if summary is not None and date_str in summary["day_totals"]:
+            day = read_archived_year(date_str[:4]).get(date_str)
+    return default if day is None else day
+
+def archive_closed_years(username):
+    """Move closed years out of users/<name>.json into one gzip file per year"""
+    today = date.today()
+    years = sorted({date_str[:4] for date_str in rider.financial_data
+                    if (today - date(int(date_str[:4]), 12, 31)).days > ARCHIVE_GRACE_DAYS})
+    if not years:
+        return []
+    os.makedirs(archive_folder(username), exist_ok=True)
+    for year in years:
+        days = {date_str: day for date_str, day in rider.financial_data.items() if date_str[:4] == year}
+        if year in rider.archive_index:
+            # Left over from an interrupted run; the live copy wins
+            days = {**read_archived_year(year), **days}
+        path = archive_file(username, year)
+        with gzip.open(path + ".tmp", "wt", encoding="utf-8") as f:
+            json.dump(days, f)
+        os.replace(path + ".tmp", path)
+        rider.archive_index[year] = summarize_year(days)
+        rider.archived_years.pop(year, None)
+    # The archives and index are complete before the live copies are dropped
+    save_archive_index(username)
+    for date_str in [date_str for date_str in rider.financial_data if date_str[:4] in years]:
+        del rider.financial_data[date_str]
+    save_user_data(username)
+    return years
+
+def restore_archived_year(username, year):
+    """Bring an archived year back into the live ledger so it can be edited"""
+    days = read_archived_year(year)
+    for date_str, day in days.items():
+        if date_str not in rider.financial_data:
+            rider.financial_data[date_str] = day
+            if rider.budget_tracker.spent is not None:
+                for name, amount in day["expense_entries"]:
+                    rider.budget_tracker._add(date_str, name, amount)
+    save_user_data(username)
+    del rider.archive_index[year]
+    rider.archived_years.pop(year, None)
+    save_archive_index(username)
+    os.remove(archive_file(username, year))
+
+# ---------------- Columnar ledger file (memory-mapped, read-only) ----------------
+# Layout, native little-endian so columns can be cast straight from the map:
+#   header   COLUMNAR_HEADER: magic, version, size and mtime of the JSON it was
+#            built from, string count, day count, income and expense entry counts,
+#            string bytes; padded to 8 bytes
+#   amounts  float64 per entry
+#   dates    uint32 date ordinal per entry
+#   days     uint32 ordinal per day with data
+#   category uint32 string id per entry
+#   kind     uint8 per entry, 0 income / 1 expense
+#   strings  uint32 end offsets, then the UTF-8 names/categories
+# Entries are sorted by kind and then date, so one kind's amounts over a date
+# range are a single contiguous slice.
+COLUMNAR_MAGIC = b"MRCOLUMN"
+COLUMNAR_VERSION = 1
+COLUMNAR_HEADER = struct.Struct("<8sHQqIIIII")
+COLUMNAR_KINDS = ("income", "expense")
+
+def _pad8(size):
+    return (size + 7) // 8 * 8
+
+def encode_columnar(data, json_size=0, json_mtime_ns=0):
+    strings = {}
+    rows = ([], [])   # per kind: (ordinal, category id, amount)
+    days = []
+    for date_str in sorted(data):
+        day = data[date_str]
+        ordinal = _parse_date_str(date_str).toordinal()
+        days.append(ordinal)
+        for kind, key in enumerate(("entries", "expense_entries")):
+            for name, amount in day.get(key, []):
+                rows[kind].append((ordinal, strings.setdefault(name, len(strings)), float(amount)))
+    entries = rows[0] + rows[1]
+
+    encoded = [name.encode("utf-8") for name in strings]
+    ends = []
+    position = 0
+    for name in encoded:
+        position += len(name)
+        ends.append(position)
+    header = COLUMNAR_HEADER.pack(COLUMNAR_MAGIC, COLUMNAR_VERSION, json_size, json_mtime_ns,
+                                  len(encoded), len(days), len(rows[0]), len(rows[1]), position)
+    return b"".join([
+        header, bytes(_pad8(len(header)) - len(header)),
+        array("d", [amount for _, _, amount in entries]).tobytes(),
+        array("I", [ordinal for ordinal, _, _ in entries]).tobytes(),
+        array("I", days).tobytes(),
+        array("I", [name_id for _, name_id, _ in entries]).tobytes(),
+        bytes([0] * len(rows[0]) + [1] * len(rows[1])),
+        array("I", ends).tobytes()] + encoded)
+
+class ColumnarLedger:
+    """A columnar ledger file opened with mmap; sums run over memoryview slices"""
+    def __init__(self, path):
+        if sys.byteorder != "little":
+            raise ValueError("columnar ledgers are little-endian only")
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views = []
+        (magic, version, self.json_size, self.json_mtime_ns, string_count, day_count,
+         self.income_count, self.expense_count, blob_size) = COLUMNAR_HEADER.unpack_from(self._map)
+        if magic != COLUMNAR_MAGIC or version != COLUMNAR_VERSION:
+            self.close()
+            raise ValueError("not a Money Rider columnar ledger")
+
+        entry_count = self.income_count + self.expense_count
+        position = _pad8(COLUMNAR_HEADER.size)
+        self.amounts, position = self._column(position, "d", entry_count)
+        self.dates, position = self._column(position, "I", entry_count)
+        self.days, position = self._column(position, "I", day_count)
+        self.categories, position = self._column(position, "I", entry_count)
+        self.kinds, position = self._column(position, "B", entry_count)
+        ends, position = self._column(position, "I", string_count)
+        blob = self._map[position:position + blob_size]
+        self.strings = [blob[start:end].decode("utf-8") for start, end in zip([0] + ends.tolist(), ends)]
+
+    def _column(self, position, typecode, count):
+        end = position + struct.calcsize(typecode) * count
+        view = memoryview(self._map)[position:end].cast(typecode)
+        self._views.append(view)
+        return view, end
+
+    def close(self):
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _slice(self, kind, start_date_str, end_date_str):
+        """Entry index bounds of one kind within an inclusive date range"""
+        base, count = (0, self.income_count) if kind == "income" else (self.income_count, self.expense_count)
+        start = _parse_date_str(start_date_str).toordinal()
+        end = _parse_date_str(end_date_str).toordinal()
+        lo = bisect.bisect_left(self.dates, start, base, base + count)
+        hi = bisect.bisect_right(self.dates, end, lo, base + count)
+        return lo, hi
+
+    def range_totals(self, start_date_str, end_date_str):
+        """Return (income, expenses, days with data), like LedgerAggregates.range_totals"""
+        totals = []
+        for kind in COLUMNAR_KINDS:
+            lo, hi = self._slice(kind, start_date_str, end_date_str)
+            totals.append(sum(self.amounts[lo:hi], 0.0))
+        days = (bisect.bisect_right(self.days, _parse_date_str(end_date_str).toordinal()) -
+                bisect.bisect_left(self.days, _parse_date_str(start_date_str).toordinal()))
+        return totals[0], totals[1], max(days, 0)
+
+    def category_totals(self, kind, start_date_str, end_date_str):
+        """Return {name: amount} for one kind within an inclusive date range"""
+        lo, hi = self._slice(kind, start_date_str, end_date_str)
+        sums = {}
+        for name_id, amount in zip(self.categories[lo:hi], self.amounts[lo:hi]):
+            sums[name_id] = sums.get(name_id, 0.0) + amount
+        return {self.strings[name_id]: amount for name_id, amount in sums.items()}
+
+def columnar_file(username):
+    return os.path.join(user_data_folder(username), "ledger.cols")
+
+def check_columnar_ledger(days=1000, entries_per_day=8):
+    """Check that the columnar reader and the in-memory aggregates total ranges alike"""
+    data = synthetic_ledger(days, entries_per_day, start=date(2026, 1, 1))
+    aggregates = LedgerAggregates.build(data.items())
+    ranges = [("2026-01-01", "2028-12-31"), ("2026-03-15", "2026-04-14"), ("2027-02-01", "2027-02-28"),
+              ("2026-06-30", "2026-06-30"), ("2025-01-01", "2025-12-31"), ("2029-01-01", "2029-12-31"),
+              ("2027-07-01", "2027-06-01")]
+    import tempfile
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "ledger.cols")
+        with open(path, "wb") as f:
+            f.write(encode_columnar(data))
+        with ColumnarLedger(path) as ledger:
+            for start, end in ranges:
+                expected = aggregates.range_totals(start, end)
+                got = ledger.range_totals(start, end)
+                same = (got[2] == expected[2] and
+                        all(math.isclose(a, b, abs_tol=1e-6) for a, b in zip(got[:2], expected[:2])))
+                print(f"{start} to {end}: {'ok' if same else 'MISMATCH'} {got} {expected}")
+                assert same, (start, end, got, expected)
+
+def read_full_ledger(username):
+    """Every day of a user's ledger, live and archived, without touching the globals"""
+    data = read_snapshot(username)
+    if data is None:
+        try:
+            with open(user_file(username), "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        # Same migration as load_user_data, for riders not signed in since the upgrade
+        normalize_ledger(data)
+    replay_journal(username, data)
+    try:
+        with open(os.path.join(archive_folder(username), "index.json"), "r") as f:
+            years = json.load(f)
+    except (OSError, ValueError):
+        years = {}
+    for year in years:
+        with gzip.open(archive_file(username, year), "rt", encoding="utf-8") as f:
+            days = json.load(f)
+        normalize_ledger(days)
+        for date_str, day in days.items():
+            data.setdefault(date_str, day)
+    return data
+
+def open_columnar_ledger(username):
+    """Open a user's columnar file, rebuilding it first if the ledger changed since"""
+    path = columnar_file(username)
+    stamp = ledger_stamp(username)
+    try:
+        with open(path, "rb") as f:
+            fresh = COLUMNAR_HEADER.unpack(f.read(COLUMNAR_HEADER.size))[2:4] == stamp
+    except (OSError, struct.error):
+        fresh = False
+    if not fresh:
+        folder = user_data_folder(username)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        with open(path + ".tmp", "wb") as f:
+            f.write(encode_columnar(read_full_ledger(username), *stamp))
+        os.replace(path + ".tmp", path)
+    return ColumnarLedger(path)
+
+# ---------------- Incremental backups (only changed days) ----------------
+BACKUPS_FOLDER = "backups"
+
+# Day dicts are replaced on save, so an unchanged object keeps its hash; entry
+# edits change a day in place and drop its cached hash (mark_day_dirty)
+_day_hash_cache = {}   # date_str -> (day dict, hash)
+
+def backup_folder(username):
+    return os.path.join(BACKUPS_FOLDER, username)
+
+def day_content_hash(day):
+    """Content hash of a day; ints and floats, lists and tuples hash alike"""
+    canonical = json.dumps([float(day.get("income", 0)), float(day.get("expenses", 0)),
+                            [[name, float(amount)] for name, amount in day.get("entries", [])],
+                            [[name, float(amount)] for name, amount in day.get("expense_entries", [])]])
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+def day_hash(date_str, day):
+    """day_content_hash of a ledger day, cached while the day object is unchanged"""
+    cached = _day_hash_cache.get(date_str)
+    if cached is not None and cached[0] is day:
+        return cached[1]
+    digest = day_content_hash(day)
+    _day_hash_cache[date_str] = (day, digest)
+    return digest
+
+def _backup_manifest_file(username):
+    return os.path.join(backup_folder(username), "manifest.json")
+
+def list_backups(username):
+    """Backup points (timestamps), oldest first"""
+    try:
+        names = os.listdir(backup_folder(username))
+    except OSError:
+        return []
+    return sorted(name[:-len(".json.gz")] for name in names if name.endswith(".json.gz"))
+
+def backup_ledger(username):
+    """Write the days changed since the last backup to a new timestamped delta.
+
+    The first backup holds every day and is the base the later deltas are
+    replayed onto. Returns (timestamp, changed days, deleted days), or None
+    when nothing changed.
+    """
+    try:
+        with open(_backup_manifest_file(username), "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {"hashes": {}, "archived": []}
+    hashes = manifest["hashes"]
+    changed = {}
+
+    def compare(date_str, day):
+        digest = day_hash(date_str, day)
+        if hashes.get(date_str) != digest:
+            changed[date_str] = day
+            hashes[date_str] = digest
+
+    for date_str, day in rider.financial_data.items():
+        compare(date_str, day)
+    # Archives are read-only: each archived year is compared once, when first seen
+    for year in rider.archive_index:
+        if year not in manifest["archived"]:
+            for date_str, day in read_archived_year(year).items():
+                compare(date_str, day)
+    manifest["archived"] = sorted(rider.archive_index)
+    deleted = [date_str for date_str in hashes
+               if date_str not in rider.financial_data and date_str[:4] not in rider.archive_index]
+    for date_str in deleted:
+        del hashes[date_str]
+    if not changed and not deleted:
+        return None
+
+    os.makedirs(backup_folder(username), exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+    with gzip.open(os.path.join(backup_folder(username), f"{stamp}.json.gz"), "wt", encoding="utf-8") as f:
+        json.dump({"days": changed, "deleted": deleted}, f)
+    # The manifest only moves on once the delta is safely written
+    with open(_backup_manifest_file(username), "w") as f:
+        json.dump(manifest, f)
+    return stamp, len(changed), len(deleted)
+
+def replay_backups(username, until=None):
+    """The ledger as of a backup point: the base with every later delta applied in order"""
+    days = {}
+    for stamp in list_backups(username):
+        if until is not None and stamp > until:
+            break
+        with gzip.open(os.path.join(backup_folder(username), f"{stamp}.json.gz"), "rt", encoding="utf-8") as f:
+            delta = json.load(f)
+        days.update(delta["days"])
+        for date_str in delta["deleted"]:
+            days.pop(date_str, None)
+    return days
+
+def restore_backup(username, stamp):
+    """Replace the ledger with its state at a backup point; the current state is backed up first"""
+    backup_ledger(username)
+    rider.financial_data = dict(sorted(replay_backups(username, stamp).items()))
+    normalize_ledger(rider.financial_data)
+    # Archived years change too, so the next backup compares them again
+    with open(_backup_manifest_file(username), "r") as f:
+        manifest = json.load(f)
+    manifest["archived"] = []
+    with open(_backup_manifest_file(username), "w") as f:
+        json.dump(manifest, f)
+    # The restored ledger is complete, so the old year archives are dropped;
+    # closed years are archived again by load_user_data
+    for year in list(rider.archive_index):
+        os.remove(archive_file(username, year))
+        del rider.archive_index[year]
+    rider.archived_years.clear()
+    if os.path.exists(archive_folder(username)):
+        save_archive_index(username)
+    save_user_data(username)
+    load_user_data(username)
+
+# ---------------- Delta sync between devices ----------------
+# Every synced day carries a version vector {device id: edit count}. A device
+# pulls the days the server changed since its last sync point, merges them
+# with its own changes, bumps its counter on the days it changed and pushes
+# only those. The server accepts a day only if its vector dominates the one
+# it holds; a rejected device pulls again and merges.
+SYNC_SERVER_URL = os.environ.get("MONEY_RIDER_SYNC_URL", "http://127.0.0.1:8765")
+SYNC_SERVER_FOLDER = "sync_server"
+
+def _vv_dominates(a, b):
+    """True if version vector a has seen everything b has"""
+    return all(a.get(device, 0) >= count for device, count in b.items())
+
+def _vv_merge(a, b):
+    return {device: max(a.get(device, 0), b.get(device, 0)) for device in set(a) | set(b)}
+
+def merge_entry_lists(base, local, remote):
+    """Entry-level three-way merge: additions and removals from both sides are kept.
+
+    An entry appears (local + remote - base) times, so an entry deleted on
+    one device stays deleted and one edited on a single device keeps the
+    edit; if both devices edit the same entry differently, both versions stay.
+    """
+    def counts(entries):
+        return Counter((name, float(amount)) for name, amount in entries)
+    base_counts, local_counts, remote_counts = counts(base), counts(local), counts(remote)
+    wanted = {entry: local_counts[entry] + remote_counts[entry] - base_counts[entry]
+              for entry in set(local_counts) | set(remote_counts)}
+    merged = []
+    for name, amount in list(local) + list(remote):
+        entry = (name, float(amount))
+        if wanted[entry] > 0:
+            merged.append(entry)
+            wanted[entry] -= 1
+    return merged
+
+def merge_days(base, local, remote):
+    """Merge two concurrent versions of a day; None stands for a deleted day"""
+    base, local, remote = base or {}, local or {}, remote or {}
+    entries = merge_entry_lists(base.get("entries", []), local.get("entries", []), remote.get("entries", []))
+    expenses = merge_entry_lists(base.get("expense_entries", []), local.get("expense_entries", []),
+                                 remote.get("expense_entries", []))
+    return make_day(entries, expenses) if entries or expenses else None
+
+def sync_state_file(username):
+    return os.path.join(user_data_folder(username), "sync.json")
+
+def load_sync_state(username):
+    try:
+        with open(sync_state_file(username), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # base/hashes: each day as the server last had it
+        import uuid
+        return {"device": uuid.uuid4().hex[:12], "last_seq": 0, "versions": {}, "base": {}, "hashes": {}}
+
+def save_sync_state(username, state):
+    folder = user_data_folder(username)
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    with open(sync_state_file(username), "w") as f:
+        json.dump(state, f)
+
+def _sync_request(path, payload=None):
+    import urllib.request
+    data = None if payload is None else json.dumps(payload).encode("utf-8")
+    request = urllib.request.Request(SYNC_SERVER_URL + path, data=data,
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.load(response)
+
+def apply_remote_days(days):
+    """Write days received from another device into the ledger and everything derived from it"""
+    for date_str, day in days.items():
+        if date_str[:4] in rider.archive_index:
+            restore_archived_year(current_user, date_str[:4])
+        old_day = rider.financial_data.get(date_str)
+        if day is None:
+            rider.financial_data.pop(date_str, None)
+        else:
+            # The other device may run an older version of the app
+            day = rider.financial_data[date_str] = normalize_day(day)
+        if old_day is not None or day is not None:
+            update_ledger_aggregates(date_str, old_day, day)
+    # Positions on the undo stacks and budget totals may no longer line up
+    rider.budget_tracker.spent = None
+    clear_edit_history()
+    if rider.current_buffer_date in days:
+        load_day_buffers(rider.current_buffer_date)
+    save_user_data(current_user)
+
+def _check_signed_in(username):
+    if username != current_user:
+        raise RuntimeError(f"{username} signed out during the sync")
+
+def _apply_synced_days(username, days, seen):
+    """apply_remote_days, first merging again any day edited here since seen (its copy) was taken"""
+    _check_signed_in(username)
+    days = dict(days)
+    for date_str, day in days.items():
+        if date_str[:4] in rider.archive_index:
+            continue   # Archived days cannot be edited in the meantime
+        live = rider.financial_data.get(date_str)
+        before = seen.get(date_str)
+        if (None if live is None else day_hash(date_str, live)) != \
+                (None if before is None else day_content_hash(before)):
+            days[date_str] = merge_days(before, live, day)
+    apply_remote_days(days)
+
+def _local_changes(username, hashes):
+    """Days whose content differs from what the server last had, copied so later edits cannot reach them"""
+    _check_signed_in(username)
+    changed = {date_str: {**day, "entries": list(day["entries"]),
+                          "expense_entries": list(day["expense_entries"])}
+               for date_str, day in rider.financial_data.items()
+               if hashes.get(date_str) != day_hash(date_str, day)}
+    for date_str in hashes:
+        if date_str not in rider.financial_data and date_str[:4] not in rider.archive_index:
+            changed[date_str] = None
+    return changed
+
+def sync_ledger(username, rounds=3):
+    """Exchange the days changed since the last sync; returns (sent, received, merged)"""
+    import asyncio
+    return asyncio.run(sync_ledger_async(username, rounds))
+
+async def sync_ledger_async(username, rounds=3):
+    """sync_ledger as a coroutine: network round trips never block the Tk thread"""
+    import urllib.parse
+    state = load_sync_state(username)
+    versions, base, hashes = state["versions"], state["base"], state["hashes"]
+    sent = received = merged = 0
+    path = f"/sync/{urllib.parse.quote(username)}"
+
+    for _ in range(rounds):
+        changed = await on_tk_thread(_local_changes, username, hashes)
+
+        pulled = await run_blocking(_sync_request, f"{path}/changes?since={state['last_seq']}")
+        incoming = {}
+        seen = {}   # Each incoming day as this device had it when changed was taken
+        for date_str, remote in pulled["days"].items():
+            if _vv_dominates(versions.get(date_str, {}), remote["vv"]):
+                continue   # Already seen, e.g. our own push coming back
+            # Unchanged days matched what the server last had
+            seen[date_str] = changed[date_str] if date_str in changed else base.get(date_str)
+            if date_str in changed:
+                day = merge_days(base.get(date_str), changed[date_str], remote["day"])
+                changed[date_str] = day
+                merged += 1
+            else:
+                day = remote["day"]
+                received += 1
+            incoming[date_str] = day
+            versions[date_str] = _vv_merge(versions.get(date_str, {}), remote["vv"])
+            if remote["day"] is None:
+                base.pop(date_str, None)
+                hashes.pop(date_str, None)
+            else:
+                base[date_str] = remote["day"]
+                hashes[date_str] = day_content_hash(remote["day"])
+        if incoming:
+            await on_tk_thread(_apply_synced_days, username, incoming, seen)
+        state["last_seq"] = pulled["seq"]
+
+        # Days that now match the server need not be pushed
+        push = []
+        for date_str, day in changed.items():
+            if hashes.get(date_str) == (None if day is None else day_content_hash(day)):
+                continue
+            vv = dict(versions.get(date_str, {}))
+            vv[state["device"]] = vv.get(state["device"], 0) + 1
+            push.append({"date": date_str, "day": day, "vv": vv})
+        if not push:
+            break
+        result = await run_blocking(_sync_request, f"{path}/push", {"days": push})
+        accepted = set(result["accepted"])
+        for item in push:
+            if item["date"] in accepted:
+                date_str, day = item["date"], item["day"]
+                versions[date_str] = item["vv"]
+                if day is None:
+                    base.pop(date_str, None)
+                    hashes.pop(date_str, None)
+                else:
+                    base[date_str] = day
+                    hashes[date_str] = day_content_hash(day)
+        sent += len(accepted)
+        if not result["rejected"]:
+            break
+        # Someone pushed in between: pull their version and merge again
+
+    save_sync_state(username, state)
+    return sent, received, merged
+
+class SyncServerHandler:
+    """Reference sync server: one JSON store per user under SYNC_SERVER_FOLDER.
+
+    Mixed into http.server's request handler by run_sync_server, so the app
+    itself never imports http.server.
+    """
+    lock = threading.Lock()
+
+    def _route(self):
+        import urllib.parse
+        parts = urllib.parse.urlsplit(self.path)
+        segments = [urllib.parse.unquote(s) for s in parts.path.strip("/").split("/")]
+        if len(segments) != 3 or segments[0] != "sync" or os.path.basename(segments[1]) != segments[1] \
+                or segments[1] in ("", ".", ".."):
+            return None, None, None
+        return segments[1], segments[2], urllib.parse.parse_qs(parts.query)
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def _store_path(username):
+        return os.path.join(SYNC_SERVER_FOLDER, f"{username}.json")
+
+    def _load_store(self, username):
+        try:
+            with open(self._store_path(username), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"seq": 0, "days": {}}   # days: date -> {"day", "vv", "seq"}
+
+    def do_GET(self):
+        username, action, query = self._route()
+        if action != "changes":
+            return self._reply(404, {"error": "unknown route"})
+        since = int(query.get("since", ["0"])[0])
+        with self.lock:
+            store = self._load_store(username)
+        days = {date_str: {"day": item["day"], "vv": item["vv"]}
+                for date_str, item in store["days"].items() if item["seq"] > since}
+        self._reply(200, {"seq": store["seq"], "days": days})
+
+    def do_POST(self):
+        username, action, _ = self._route()
+        if action != "push":
+            return self._reply(404, {"error": "unknown route"})
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        accepted, rejected = [], []
+        with self.lock:
+            store = self._load_store(username)
+            for item in payload.get("days", []):
+                current = store["days"].get(item["date"])
+                if current is not None and not _vv_dominates(item["vv"], current["vv"]):
+                    rejected.append(item["date"])
+                    continue
+                store["seq"] += 1
+                store["days"][item["date"]] = {"day": item["day"], "vv": item["vv"], "seq": store["seq"]}
+                accepted.append(item["date"])
+            os.makedirs(SYNC_SERVER_FOLDER, exist_ok=True)
+            with open(self._store_path(username), "w") as f:
+                json.dump(store, f)
+        self._reply(200, {"seq": store["seq"], "accepted": accepted, "rejected": rejected})
+
+    def log_message(self, format, *args):
+        pass
+
+def run_sync_server(port=8765):
+    """Serve sync requests on localhost until interrupted"""
+    import http.server
+    handler = type("SyncRequestHandler", (SyncServerHandler, http.server.BaseHTTPRequestHandler), {})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", port), handler)
+    print(f"Money Rider sync server on http://127.0.0.1:{port}/ (data in {SYNC_SERVER_FOLDER}/)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+# ---------------- Fleet aggregation (all riders, in parallel) ----------------
+def rider_range_totals(username, start_date_str, end_date_str):
+    """One rider's (username, (income, expenses, days with data), error) for a range; runs in a worker process"""
+    try:
+        with open_columnar_ledger(username) as ledger:
+            income, expenses, days = ledger.range_totals(start_date_str, end_date_str)
+        try:
+            with open(recurring_file(username), "r") as f:
+                rules = RecurringRules(json.load(f))
+        except (OSError, ValueError):
+            rules = RecurringRules()
+        recurring_income, recurring_expenses = rules.range_totals(start_date_str, end_date_str)
+    except Exception as error:
+        # One unreadable ledger (say a missing year archive) must not sink the whole report
+        return username, None, f"{type(error).__name__}: {error}"
+    return username, (income + recurring_income, expenses + recurring_expenses, days), None
+
+def fleet_range_totals(start_date_str, end_date_str, max_workers=None):
+    """Totals of every users/*.json ledger for a range, one worker process per core.
+
+    Returns (rows, combined, skipped): rows of (username, income, expenses, net, days),
+    combined (income, expenses, net, days) and skipped (username, error) for
+    riders whose ledger could not be read.
+    """
+    usernames = sorted(os.path.basename(path)[:-len(".json")]
+                       for path in glob.glob(os.path.join(USERS_FOLDER, "*.json")))
+    workers = max_workers or os.cpu_count() or 1
+    # A few chunks per worker keeps the pool busy without a round trip per rider
+    chunksize = max(1, len(usernames) // (workers * 4))
+    # Spawned, not forked: the calendar starts this from a worker thread of the Tk
+    # process, and forking a multi-threaded process can deadlock the child
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        results = list(pool.map(rider_range_totals, usernames,
+                                [start_date_str] * len(usernames), [end_date_str] * len(usernames),
+                                chunksize=chunksize))
+    rows = [(username, totals[0], totals[1], totals[0] - totals[1], totals[2])
+            for username, totals, error in results if totals is not None]
+    skipped = [(username, error) for username, totals, error in results if totals is None]
+    total_income = sum(row[1] for row in rows)
+    total_expenses = sum(row[2] for row in rows)
+    return rows, (total_income, total_expenses, total_income - total_expenses, sum(row[4] for row in rows)), skipped
+
+def print_fleet_report(start_date_str, end_date_str):
+    rows, combined, skipped = fleet_range_totals(start_date_str, end_date_str)
+    print(f"Fleet totals {start_date_str} to {end_date_str}")
+    print(f"{'rider':<20} {'days':>5} {'income':>12} {'expenses':>12} {'net':>12}")
+    for username, income, expenses, net, days in rows + [("ALL RIDERS",) + combined]:
+        print(f"{username:<20} {days:>5} {income:>12,.2f} {expenses:>12,.2f} {net:>12,.2f}")
+    for username, error in skipped:
+        print(f"skipped {username}: {error}", file=sys.stderr)
+
+# ---------------- Distribution sketches (mergeable per-month histograms) ----------------
+# Amounts fall into logarithmic buckets whose bounds grow by SKETCH_GROWTH, so a
+# percentile read from a sketch is within 1% of the exact value. Buckets are
+# fixed, so two sketches merge by adding counts and a day can be taken back out.
+SKETCH_GROWTH = 1.02
+SKETCH_LOG_GROWTH = math.log(SKETCH_GROWTH)
+SKETCH_MIN_AMOUNT = 0.01   # anything smaller counts as zero
+
+class DistributionSketch:
+    """Fixed-bucket histogram of amounts that can be merged and updated by deltas"""
+    __slots__ = ("counts", "count")
+
+    def __init__(self):
+        self.counts = {}   # signed bucket index -> values in that bucket
+        self.count = 0
+
+    @staticmethod
+    def bucket(value):
+        magnitude = abs(value)
+        if magnitude < SKETCH_MIN_AMOUNT:
+            return 0
+        index = 1 + math.ceil(math.log(magnitude / SKETCH_MIN_AMOUNT) / SKETCH_LOG_GROWTH)
+        return index if value > 0 else -index
+
+    @staticmethod
+    def bucket_value(index):
+        """The amount a bucket stands for (its bounds are at most 2% apart)"""
+        if index == 0:
+            return 0.0
+        upper = SKETCH_MIN_AMOUNT * SKETCH_GROWTH ** (abs(index) - 1)
+        value = upper * 2 / (1 + SKETCH_GROWTH)
+        return value if index > 0 else -value
+
+    def add(self, value, weight=1):
+        index = self.bucket(value)
+        count = self.counts.get(index, 0) + weight
+        if count:
+            self.counts[index] = count
+        else:
+            del self.counts[index]
+        self.count += weight
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        return self
+
+    def quantiles(self, qs):
+        """Approximate values at each fraction in qs (ascending), or None when empty"""
+        if not self.count:
+            return [None] * len(qs)
+        results = []
+        buckets = iter(sorted(self.counts.items()))
+        index, seen = next(buckets)
+        for q in qs:
+            rank = q * (self.count - 1)
+            while seen <= rank:
+                next_index, count = next(buckets)
+                index = next_index
+                seen += count
+            results.append(self.bucket_value(index))
+        return results
+
+PERCENTILES = ((0.1, "p10"), (0.5, "Median"), (0.9, "p90"))
+
+
+# ---------------- Ledger aggregates (warmed up in the background) ----------------
+class LedgerAggregates:
+    """Precomputed month totals, category sums and a sorted date index"""
+    def __init__(self):
+        self.day_totals = {}       # "YYYY-MM-DD" -> (income, expenses)
+        self.month_totals = {}     # "YYYY-MM" -> [income, expenses, days with data]
+        self.category_sums = {"income": {}, "expense": {}}
+        self.name_days = {"income": {}, "expense": {}}   # name -> {date: entries with that name}
+        self.date_index = []       # sorted "YYYY-MM-DD" keys
+        self.month_sketches = {}   # "YYYY-MM" -> (daily net sketch, daily expenses sketch)
+        self.forecasts = {}        # ("YYYY-MM", as-of date) -> fitted forecast models
+
+    @classmethod
+    def build(cls, items, year_summaries=()):
+        aggregates = cls()
+        for date_str, day in items:
+            aggregates._add_day(date_str, day, 1)
+        for summary in year_summaries:
+            aggregates._add_year_summary(summary)
+        aggregates.date_index = sorted(aggregates.day_totals)
+        return aggregates
+
+    def _add_day(self, date_str, day, sign):
+        income = day["income"]
+        expenses = day["expenses"]
+        if sign > 0:
+            self.day_totals[date_str] = (income, expenses)
+        month = self.month_totals.setdefault(date_str[:7], [0.0, 0.0, 0])
+        month[0] += sign * income
+        month[1] += sign * expenses
+        month[2] += sign
+        self._sketch_day(date_str, income, expenses, sign)
+
+        for kind, key in (("income", "entries"), ("expense", "expense_entries")):
+            for name, amount in day[key]:
+                self._count_entry(kind, date_str, name, amount, sign)
+
+    def _count_entry(self, kind, date_str, name, amount, sign):
+        sums = self.category_sums[kind]
+        sums[name] = sums.get(name, 0.0) + sign * amount
+        days = self.name_days[kind].setdefault(name, {})
+        days[date_str] = days.get(date_str, 0) + sign
+        if not days[date_str]:
+            del days[date_str]
+
+    def _add_year_summary(self, summary):
+        """Merge an archived year from its index entry, without decompressing it"""
+        for date_str, (income, expenses) in summary["day_totals"].items():
+            self.day_totals[date_str] = (income, expenses)
+            month = self.month_totals.setdefault(date_str[:7], [0.0, 0.0, 0])
+            month[0] += income
+            month[1] += expenses
+            month[2] += 1
+            self._sketch_day(date_str, income, expenses, 1)
+        for kind, sums in summary["category_sums"].items():
+            for name, amount in sums.items():
+                self.category_sums[kind][name] = self.category_sums[kind].get(name, 0.0) + amount
+        for kind, names in summary.get("name_days", {}).items():
+            for name, dates in names.items():
+                days = self.name_days[kind].setdefault(name, {})
+                for date_str in dates:
+                    days[date_str] = days.get(date_str, 0) + 1
+
+    def _sketch_day(self, date_str, income, expenses, sign):
+        sketches = self.month_sketches.get(date_str[:7])
+        if sketches is None:
+            sketches = self.month_sketches[date_str[:7]] = (DistributionSketch(), DistributionSketch())
+        sketches[0].add(income - expenses, sign)
+        sketches[1].add(expenses, sign)
+
+    def apply_day_change(self, date_str, old_day, new_day):
+        """Swap one day's contribution for its new contents"""
+        self.forecasts.clear()
+        if old_day is not None:
+            self._add_day(date_str, old_day, -1)
+        if new_day is None:
+            # The day was deleted (e.g. by a sync from another device)
+            if old_day is not None:
+                del self.day_totals[date_str]
+                del self.date_index[bisect.bisect_left(self.date_index, date_str)]
+            return
+        self._add_day(date_str, new_day, 1)
+        if old_day is None:
+            bisect.insort(self.date_index, date_str)
+
+    def apply_entry_change(self, date_str, kind, removed=None, added=None):
+        """Move every total by one entry edit in O(1); removed/added are (name, amount)"""
+        self.forecasts.clear()
+        delta = (added[1] if added else 0.0) - (removed[1] if removed else 0.0)
+        old = self.day_totals.get(date_str)
+        if old is None:
+            # The edit created the day
+            old = (0.0, 0.0)
+            bisect.insort(self.date_index, date_str)
+            self.month_totals.setdefault(date_str[:7], [0.0, 0.0, 0])[2] += 1
+        else:
+            self._sketch_day(date_str, old[0], old[1], -1)
+        new = (old[0] + delta, old[1]) if kind == "income" else (old[0], old[1] + delta)
+        self.day_totals[date_str] = new
+        self._sketch_day(date_str, new[0], new[1], 1)
+        self.month_totals[date_str[:7]][0 if kind == "income" else 1] += delta
+        if removed is not None:
+            self._count_entry(kind, date_str, removed[0], removed[1], -1)
+        if added is not None:
+            self._count_entry(kind, date_str, added[0], added[1], 1)
+
+    def range_totals(self, start_date_str, end_date_str):
+        """Return (income, expenses, days with data) for an inclusive date range"""
+        lo = bisect.bisect_left(self.date_index, start_date_str)
+        hi = bisect.bisect_right(self.date_index, end_date_str)
+        total_income = 0.0
+        total_expenses = 0.0
+        for date_str in self.date_index[lo:hi]:
+            income, expenses = self.day_totals[date_str]
+            total_income += income
+            total_expenses += expenses
+        # A reversed range has hi < lo; it holds no days, as in ColumnarLedger
+        return total_income, total_expenses, max(hi - lo, 0)
+
+    def distribution(self, start_date_str, end_date_str):
+        """Merged (daily net, daily expenses) sketches for an inclusive range.
+
+        Months wholly inside the range contribute their stored sketch; only
+        the days of a partly covered first or last month are added one by one.
+        """
+        net = DistributionSketch()
+        expenses_sketch = DistributionSketch()
+        for month, (month_net, month_expenses) in self.month_sketches.items():
+            first, last = month + "-01", month + "-31"
+            if last < start_date_str or first > end_date_str:
+                continue
+            if first >= start_date_str and last <= end_date_str:
+                net.merge(month_net)
+                expenses_sketch.merge(month_expenses)
+                continue
+            lo = bisect.bisect_left(self.date_index, max(first, start_date_str))
+            hi = bisect.bisect_right(self.date_index, min(last, end_date_str))
+            for date_str in self.date_index[lo:hi]:
+                income, expenses = self.day_totals[date_str]
+                net.add(income - expenses)
+                expenses_sketch.add(expenses)
+        return net, expenses_sketch
+
+    def month_summary(self, year, month):
+        return self.month_totals.get(f"{year}-{month:02d}", [0.0, 0.0, 0])
+
+    def day_net(self, date_str):
+        """Income minus expenses for a day, or None if nothing was saved"""
+        totals = self.day_totals.get(date_str)
+        if totals is None:
+            return None
+        return totals[0] - totals[1]
+
+    def largest_day_net(self, start_date_str, end_date_str):
+        """Largest absolute daily net in an inclusive range (heatmap colour scale)"""
+        lo = bisect.bisect_left(self.date_index, start_date_str)
+        hi = bisect.bisect_right(self.date_index, end_date_str)
+        largest = 0.0
+        for date_str in self.date_index[lo:hi]:
+            income, expenses = self.day_totals[date_str]
+            largest = max(largest, abs(income - expenses))
+        return largest
+
+    def grouped_totals(self, ranges, grouping=None):
+        """Totals for several inclusive ranges, optionally split into buckets.
+
+        ranges is a list of (start_date_str, end_date_str); grouping is a key
+        of RANGE_GROUPINGS. Every bucket of every range comes out of a single
+        pass over the date index. Returns rows of
+        (range index, bucket label, income, expenses, days with data).
+        """
+        if not ranges:
+            return []
+        bucket_of = RANGE_GROUPINGS[grouping]
+        lo = bisect.bisect_left(self.date_index, min(start for start, _ in ranges))
+        hi = bisect.bisect_right(self.date_index, max(end for _, end in ranges))
+
+        buckets = {}   # (range index, (sort key, label)) -> [income, expenses, days]
+        for date_str in self.date_index[lo:hi]:
+            income, expenses = self.day_totals[date_str]
+            bucket = bucket_of(date_str)
+            for i, (start, end) in enumerate(ranges):
+                if start <= date_str <= end:
+                    totals = buckets.setdefault((i, bucket), [0.0, 0.0, 0])
+                    totals[0] += income
+                    totals[1] += expenses
+                    totals[2] += 1
+
+        return [(i, bucket[1], totals[0], totals[1], totals[2])
+                for (i, bucket), totals in sorted(buckets.items())]
+
+def _parse_date_str(date_str):
+    return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+
+def _iso_week_bucket(date_str):
+    iso_year, iso_week, _ = _parse_date_str(date_str).isocalendar()
+    return (iso_year, iso_week), f"{iso_year}-W{iso_week:02d}"
+
+def _weekday_bucket(date_str):
+    weekday = _parse_date_str(date_str).weekday()
+    return weekday, calendar.day_name[weekday]
+
+# Bucket functions return (sort key, label) for a "YYYY-MM-DD" key
+RANGE_GROUPINGS = {
+    None: lambda date_str: (0, "All days"),
+    'day': lambda date_str: (date_str, date_str),
+    'week': _iso_week_bucket,
+    'month': lambda date_str: (date_str[:7], date_str[:7]),
+    'weekday': _weekday_bucket
+}
 
+# rider.ledger_aggregates is published by the warm-up thread in a single
+# assignment; readers never see a half-built object. After publishing, only
+# the Tk thread updates it.
+ledger_generation = 0
+aggregates_lock = threading.Lock()
+
+def start_ledger_warmup():
+    """Precompute aggregates for the freshly loaded ledger in a background thread"""
+    global ledger_generation
+    with aggregates_lock:
+        ledger_generation += 1
+        generation = ledger_generation
+        rider.ledger_aggregates = None
+    # Edits made while this runs restart it: whole days are replaced, so the
+    # copy keeps the old ones (update_ledger_aggregates), and entry edits that
+    # change a day in place abandon this build first (mutate_entry)
+    state = rider
+    items = list(state.financial_data.items())
+    year_summaries = list(state.archive_index.values())
+
+    def warm_up():
+        aggregates = LedgerAggregates.build(items, year_summaries)
+        with aggregates_lock:
+            if generation == ledger_generation and state.ledger_aggregates is None:
+                state.ledger_aggregates = aggregates
+
+    threading.Thread(target=warm_up, name="ledger-warmup", daemon=True).start()
+
+def get_ledger_aggregates():
+    """Return the warmed-up aggregates, building them now if the warm-up is not done"""
+    aggregates = rider.ledger_aggregates
+    if aggregates is not None:
+        return aggregates
+    aggregates = LedgerAggregates.build(list(rider.financial_data.items()), list(rider.archive_index.values()))
+    with aggregates_lock:
+        if rider.ledger_aggregates is None:
+            rider.ledger_aggregates = aggregates
+        return rider.ledger_aggregates
+
+def update_ledger_aggregates(date_str, old_day, new_day):
+    """Keep the aggregates in step with a saved day"""
+    if rider.ledger_aggregates is not None:
+        rider.ledger_aggregates.apply_day_change(date_str, old_day, new_day)
+    else:
+        # A warm-up is still running on an older snapshot; start it again
+        start_ledger_warmup()
+
+
+# ---------------- Entry queries (date index, category index or full scan) ----------------
+ENTRY_KINDS = (("income", "entries"), ("expense", "expense_entries"))
+# Walking the date index only pays off below this share of all days
+DATE_INDEX_SELECTIVITY = 0.5
+
+def plan_entry_query(aggregates, start=None, end=None, kind=None, name=None):
+    """Pick the access path touching the fewest days: ("scan" | "date" | "category", days)"""
+    total = len(aggregates.date_index)
+    lo = bisect.bisect_left(aggregates.date_index, start) if start else 0
+    hi = bisect.bisect_right(aggregates.date_index, end) if end else total
+    plans = [("scan", total)]
+    if hi - lo < total * DATE_INDEX_SELECTIVITY:
+        plans.append(("date", hi - lo))
+    if name is not None:
+        kinds = [kind] if kind else ["income", "expense"]
+        plans.append(("category", sum(len(aggregates.name_days[k].get(name, ())) for k in kinds)))
+    return min(plans, key=lambda plan: plan[1])
+
+def query_entries(start=None, end=None, kind=None, name=None, text=None,
+                  min_amount=None, max_amount=None):
+    """Lazily yield (date_str, kind, name, amount) for entries matching every given filter.
+
+    Dates are inclusive "YYYY-MM-DD" strings; kind is "income" or "expense";
+    name is an exact category/source and can use the category index, while
+    text matches names case-insensitively anywhere. Amount bounds are inclusive.
+    """
+    aggregates = get_ledger_aggregates()
+    path, _ = plan_entry_query(aggregates, start, end, kind, name)
+    if path == "category":
+        dates = set()
+        for entry_kind in ([kind] if kind else ["income", "expense"]):
+            dates.update(aggregates.name_days[entry_kind].get(name, ()))
+        days = sorted(dates)
+    elif path == "date":
+        lo = bisect.bisect_left(aggregates.date_index, start) if start else 0
+        hi = bisect.bisect_right(aggregates.date_index, end) if end else len(aggregates.date_index)
+        days = aggregates.date_index[lo:hi]
+    else:
+        days = list(aggregates.date_index)
+    text = text.lower() if text else None
+
+    for date_str in days:
+        if (start and date_str < start) or (end and date_str > end):
+            continue
+        day = get_day(date_str)
+        if day is None:
+            continue
+        for entry_kind, key in ENTRY_KINDS:
+            if kind and entry_kind != kind:
+                continue
+            for entry_name, amount in day[key]:
+                if ((name is not None and entry_name != name) or
+                        (text and text not in entry_name.lower()) or
+                        (min_amount is not None and amount < min_amount) or
+                        (max_amount is not None and amount > max_amount)):
+                    continue
+                yield date_str, entry_kind, entry_name, amount
+
+def parse_entry_search(text):
+    """Turn search box text into query_entries() filters.
+
+    Understands "income", "expense(s)", ">500", "<100", "over 500",
+    "under 100", "since 2026-03-01" and "until 2026-06-30"; the remaining
+    words are a name, matched exactly if it is a known category or source.
+    Raises ValueError for a malformed number or date.
+    """
+    filters = {}
+    words = []
+    tokens = text.split()
+    i = 0
+    while i < len(tokens):
+        token = tokens[i].lower()
+        if token in ("income", "expense", "expenses"):
+            filters["kind"] = "income" if token == "income" else "expense"
+        elif token[:1] in "<>" and len(token) > 1:
+            bound = float(token.lstrip("<>=").replace(",", "").lstrip("₱"))
+            filters["min_amount" if token[0] == ">" else "max_amount"] = bound
+        elif token in ("over", "under", "since", "until") and i + 1 < len(tokens):
+            i += 1
+            value = tokens[i]
+            if token in ("over", "under"):
+                filters["min_amount" if token == "over" else "max_amount"] = float(value.replace(",", "").lstrip("₱"))
+            else:
+                filters["start" if token == "since" else "end"] = datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+        else:
+            words.append(tokens[i])
+        i += 1
+
+    if words:
+        phrase = " ".join(words)
+        aggregates = get_ledger_aggregates()
+        known = {entry_name.lower(): entry_name
+                 for entry_kind, _ in ENTRY_KINDS for entry_name in aggregates.name_days[entry_kind]}
+        if phrase.lower() in known:
+            filters["name"] = known[phrase.lower()]
+        else:
+            filters["text"] = phrase
+    return filters
+
+# ---------------- Top-N reports (bounded heaps) ----------------
+def top_expenses(start_date_str, end_date_str, n=20):
+    """The n biggest expense entries in a range, largest first.
+
+    Entries stream from query_entries() through heapq.nlargest, which keeps a
+    heap of at most n items: O(entries log n) time, O(n) memory.
+    """
+    return heapq.nlargest(n, query_entries(start_date_str, end_date_str, kind="expense"),
+                          key=lambda entry: entry[3])
+
+def top_earning_days(start_date_str, end_date_str, n=20):
+    """The n days with the most income in a range as (date_str, income, expenses), best first"""
+    aggregates = get_ledger_aggregates()
+    lo = bisect.bisect_left(aggregates.date_index, start_date_str)
+    hi = bisect.bisect_right(aggregates.date_index, end_date_str)
+    days = ((date_str,) + aggregates.day_totals[date_str] for date_str in aggregates.date_index[lo:hi])
+    return heapq.nlargest(n, days, key=lambda day: day[1])
+
+# ---------------- Recurring entries (expanded lazily, never stored per day) ----------------
+RECURRING_FREQUENCIES = ("daily", "weekdays", "weekly", "monthly")
+
+def _monthly_occurrence(year, month, day_of_month):
+    """The rule's day in a month, clamped to the month's last day (e.g. the 31st in April is the 30th)"""
+    return date(year, month, min(day_of_month, calendar.monthrange(year, month)[1]))
+
+def _weekdays_through(ordinal):
+    """Number of Mon-Fri days from date.fromordinal(1), a Monday, through ordinal"""
+    weeks, rest = divmod(ordinal, 7)
+    return weeks * 5 + min(rest, 5)
+
+def occurrence_count(rule, start, end):
+    """How many times a rule fires between two dates (inclusive), in closed form"""
+    first = _parse_date_str(rule["start"])
+    lo = max(start, first)
+    hi = min(end, _parse_date_str(rule["end"])) if rule.get("end") else end
+    if lo > hi:
+        return 0
+    frequency = rule["frequency"]
+    if frequency == "daily":
+        return (hi - lo).days + 1
+    if frequency == "weekdays":
+        return _weekdays_through(hi.toordinal()) - _weekdays_through(lo.toordinal() - 1)
+    if frequency == "weekly":
+        first_hit = lo.toordinal() + (first.weekday() - lo.weekday()) % 7
+        return (hi.toordinal() - first_hit) // 7 + 1 if first_hit <= hi.toordinal() else 0
+    # monthly: one hit per calendar month, minus the edge months where it falls outside
+    count = (hi.year * 12 + hi.month) - (lo.year * 12 + lo.month) + 1
+    if _monthly_occurrence(lo.year, lo.month, first.day) < lo:
+        count -= 1
+    if _monthly_occurrence(hi.year, hi.month, first.day) > hi:
+        count -= 1
+    return max(count, 0)
+
+class RecurringRules:
+    """A user's repeating entries, e.g. a daily gas budget or a weekly boundary fee"""
+    def __init__(self, rules=None):
+        self.rules = rules or []   # dicts: kind, name, amount, frequency, start, end
+
+    def add(self, kind, name, amount, frequency, start, end=None):
+        rule = {"kind": kind, "name": name, "amount": float(amount),
+                "frequency": frequency, "start": start, "end": end}
+        self.rules.append(rule)
+        return rule
+
+    def remove(self, index):
+        return self.rules.pop(index)
+
+    def entries_on(self, date_str):
+        """Virtual (name, amount) entries for one day: (income entries, expense entries)"""
+        day = _parse_date_str(date_str)
+        entries = {"income": [], "expense": []}
+        for rule in self.rules:
+            if occurrence_count(rule, day, day):
+                entries[rule["kind"]].append((rule["name"], rule["amount"]))
+        return entries["income"], entries["expense"]
+
+    def range_totals(self, start_date_str, end_date_str):
+        """Return (income, expenses) the rules add to an inclusive date range"""
+        if not self.rules:
+            return 0.0, 0.0
+        start = _parse_date_str(start_date_str)
+        end = _parse_date_str(end_date_str)
+        totals = {"income": 0.0, "expense": 0.0}
+        for rule in self.rules:
+            totals[rule["kind"]] += rule["amount"] * occurrence_count(rule, start, end)
+        return totals["income"], totals["expense"]
+
+    @staticmethod
+    def describe(rule):
+        until = f" until {rule['end']}" if rule.get("end") else ""
+        return f"{rule['name']} ₱{rule['amount']:,.2f} {rule['frequency']} from {rule['start']}{until}"
+
+
+def recurring_file(username):
+    return os.path.join(user_data_folder(username), "recurring.json")
+
+def load_recurring_rules(username):
+    try:
+        with open(recurring_file(username), "r") as f:
+            rider.recurring_rules = RecurringRules(json.load(f))
+    except (OSError, ValueError):
+        rider.recurring_rules = RecurringRules()
+
+def save_recurring_rules(username):
+    folder = user_data_folder(username)
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    with open(recurring_file(username), "w") as f:
+        json.dump(rider.recurring_rules.rules, f, indent=2)
+
+# ---------------- Budgets (running totals per window, updated by deltas) ----------------
+# Window key for a "YYYY-MM-DD" date in each budget period
+BUDGET_PERIODS = {
+    'day': lambda date_str: date_str,
+    'week': lambda date_str: _iso_week_bucket(date_str)[1],
+    'month': lambda date_str: date_str[:7]
+}
+
+class BudgetTracker:
+    """Spending limits such as "Gas ≤ ₱1,500 per week", checked in O(1) per edit"""
+    def __init__(self, budgets=None):
+        self.budgets = budgets or []   # dicts: category, period, limit
+        self.by_category = {}
+        for budget in self.budgets:
+            self.by_category.setdefault(budget["category"], []).append(budget)
+        self.spent = None              # (category, period, window) -> amount, built on first use
+
+    def add(self, category, period, limit):
+        budget = {"category": category, "period": period, "limit": float(limit)}
+        self.budgets.append(budget)
+        self.by_category.setdefault(category, []).append(budget)
+        # A new category or period needs counters the old scan did not keep
+        self.spent = None
+        return budget
+
+    def remove(self, index):
+        budget = self.budgets.pop(index)
+        self.by_category[budget["category"]].remove(budget)
+        return budget
+
+    def _counters(self):
+        """Running totals, built from the ledger once and then kept up to date by deltas"""
+        if self.spent is None:
+            self.spent = {}
+            for date_str, day in rider.financial_data.items():
+                for name, amount in day["expense_entries"]:
+                    self._add(date_str, name, amount)
+        return self.spent
+
+    def _add(self, date_str, category, amount):
+        """Add amount to every window of the category's budgets; returns {key: old total}"""
+        before = {}
+        for budget in self.by_category.get(category, ()):
+            key = (category, budget["period"], BUDGET_PERIODS[budget["period"]](date_str))
+            if key not in before:
+                before[key] = self.spent.get(key, 0.0)
+                self.spent[key] = before[key] + amount
+        return before
+
+    def window_spent(self, budget, date_str):
+        key = (budget["category"], budget["period"], BUDGET_PERIODS[budget["period"]](date_str))
+        return self._counters().get(key, 0.0)
+
+    def apply_entry_change(self, date_str, removed=None, added=None):
+        """Apply one expense edit; return (budget, spent) for every limit it pushed past"""
+        spent = self._counters()
+        before = {}
+        for entry, sign in ((removed, -1), (added, 1)):
+            if entry is not None:
+                for key, old in self._add(date_str, entry[0], sign * float(entry[1])).items():
+                    before.setdefault(key, old)
+
+        alerts = []
+        for category in {entry[0] for entry in (removed, added) if entry is not None}:
+            for budget in self.by_category.get(category, ()):
+                key = (category, budget["period"], BUDGET_PERIODS[budget["period"]](date_str))
+                if before[key] <= budget["limit"] < spent[key]:
+                    alerts.append((budget, spent[key]))
+        return alerts
+
+    @staticmethod
+    def describe(budget):
+        return f"{budget['category']} ≤ ₱{budget['limit']:,.2f} per {budget['period']}"
+
+
+def budgets_file(username):
+    return os.path.join(user_data_folder(username), "budgets.json")
+
+def load_budgets(username):
+    try:
+        with open(budgets_file(username), "r") as f:
+            rider.budget_tracker = BudgetTracker(json.load(f))
+    except (OSError, ValueError):
+        rider.budget_tracker = BudgetTracker()
+
+def save_budgets(username):
+    folder = user_data_folder(username)
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    with open(budgets_file(username), "w") as f:
+        json.dump(rider.budget_tracker.budgets, f, indent=2)
+
+def warn_budget_alerts(parent, alerts):
+    """Tell the rider which budgets the last expense pushed over the limit"""
+    if alerts:
+        lines = [f"{budget['category']}: ₱{spent:,.2f} spent of ₱{budget['limit']:,.2f} this {budget['period']}"
+                 for budget, spent in alerts]
+        messagebox.showwarning("Over Budget", "\n".join(lines), parent=parent)
+
+# ---------------- Earnings forecast (moving average, smoothing, weekday pattern) ----------------
+FORECAST_HISTORY_DAYS = 84    # twelve weeks of daily net feed every model
+FORECAST_WINDOW_DAYS = 28     # moving-average window
+FORECAST_ALPHA = 0.3          # exponential smoothing weight of the newest day
+FORECAST_MODELS = ("Moving average", "Exponential smoothing", "Weekday pattern")
+# Smoothing weights, newest day first, normalised so a flat series forecasts itself
+_smoothing_weights = array('d', (FORECAST_ALPHA * (1 - FORECAST_ALPHA) ** k
+                                 for k in range(FORECAST_HISTORY_DAYS)))
+_smoothing_weights = array('d', (weight / sum(_smoothing_weights) for weight in _smoothing_weights))
+
+def daily_net_series(aggregates, first, last):
+    """Daily net from first through last as an array, 0 for days without entries"""
+    series = array('d', bytes(8 * ((last - first).days + 1)))
+    lo = bisect.bisect_left(aggregates.date_index, first.isoformat())
+    hi = bisect.bisect_right(aggregates.date_index, last.isoformat())
+    origin = first.toordinal()
+    for date_str in aggregates.date_index[lo:hi]:
+        income, expenses = aggregates.day_totals[date_str]
+        series[_parse_date_str(date_str).toordinal() - origin] = income - expenses
+    return series
+
+def fit_forecast_models(aggregates, as_of):
+    """Predicted net per weekday (Mon..Sun) from each model, fitted on the days through as_of"""
+    if not aggregates.date_index or aggregates.date_index[0] > as_of.isoformat():
+        return None
+    # A new rider's history starts at their first entry, not with weeks of zeros
+    first = max(as_of.toordinal() - FORECAST_HISTORY_DAYS + 1,
+                _parse_date_str(aggregates.date_index[0]).toordinal())
+    first = date.fromordinal(first)
+    series = daily_net_series(aggregates, first, as_of)
+
+    window = series[-FORECAST_WINDOW_DAYS:]
+    moving_average = sum(window) / len(window)
+    weights = _smoothing_weights[:len(series)]
+    smoothed = sum(map(operator.mul, weights, reversed(series))) / sum(weights)
+    weekday_pattern = []
+    for weekday in range(7):
+        same_weekday = series[(weekday - first.weekday()) % 7::7]
+        weekday_pattern.append(sum(same_weekday) / len(same_weekday) if same_weekday else moving_average)
+    return ([moving_average] * 7, [smoothed] * 7, weekday_pattern)
+
+def _weekday_counts(first, last):
+    """How many of each weekday (Mon..Sun) fall from first through last"""
+    days = (last - first).days + 1
+    if days <= 0:
+        return [0] * 7
+    weeks, rest = divmod(days, 7)
+    counts = [weeks] * 7
+    for offset in range(rest):
+        counts[(first.weekday() + offset) % 7] += 1
+    return counts
+
+def forecast_month(year, month, as_of=None):
+    """Actual and projected net for a month and its quarter.
+
+    Returns {"as_of", "month_end", "quarter_end", "month_actual",
+    "quarter_actual", "projections": [(model, month net, quarter net)]};
+    projections are None when there is no history yet. Model fits are cached
+    on the ledger aggregates per (month, as_of) and dropped on any edit.
+    """
+    aggregates = get_ledger_aggregates()
+    month_start = date(year, month, 1)
+    month_end = date(year, month, calendar.monthrange(year, month)[1])
+    quarter_month = (month - 1) // 3 * 3 + 1
+    quarter_start = date(year, quarter_month, 1)
+    quarter_end = date(year, quarter_month + 2, calendar.monthrange(year, quarter_month + 2)[1])
+    # Everything up to as_of is actual; the rest of the quarter is projected
+    as_of = min(as_of or date.today(), quarter_end)
+
+    key = (f"{year}-{month:02d}", as_of)
+    fitted = aggregates.forecasts.get(key)
+    if fitted is None:
+        fitted = aggregates.forecasts[key] = fit_forecast_models(aggregates, as_of)
+
+    def actual(start, end):
+        if start > end:
+            return 0.0
+        income, expenses, _ = aggregates.range_totals(start.isoformat(), end.isoformat())
+        recurring_income, recurring_expenses = rider.recurring_rules.range_totals(start.isoformat(), end.isoformat())
+        return income + recurring_income - expenses - recurring_expenses
+
+    def projected(pattern, start, end):
+        start = max(as_of + timedelta(days=1), start)
+        if start > end:
+            return 0.0
+        counts = _weekday_counts(start, end)
+        # Recurring rules are known exactly, so they are added rather than predicted
+        recurring_income, recurring_expenses = rider.recurring_rules.range_totals(start.isoformat(), end.isoformat())
+        return sum(map(operator.mul, counts, pattern)) + recurring_income - recurring_expenses
+
+    month_actual = actual(month_start, min(as_of, month_end))
+    quarter_actual = actual(quarter_start, as_of)
+    projections = None
+    if fitted is not None:
+        projections = [(model, month_actual + projected(pattern, month_start, month_end),
+                        quarter_actual + projected(pattern, quarter_start, quarter_end))
+                       for model, pattern in zip(FORECAST_MODELS, fitted)]
+    return {"as_of": as_of, "month_end": month_end, "quarter_end": quarter_end,
+            "month_actual": month_actual, "quarter_actual": quarter_actual,
+            "projections": projections}
+
+
+def forecast_file(username):
+    return os.path.join(user_data_folder(username), "forecast.json")
+
+def load_monthly_target(username):
+    try:
+        with open(forecast_file(username), "r") as f:
+            rider.monthly_target = json.load(f).get("monthly_target")
+    except (OSError, ValueError, AttributeError):
+        rider.monthly_target = None
+
+def save_monthly_target(username):
+    folder = user_data_folder(username)
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    with open(forecast_file(username), "w") as f:
+        json.dump({"monthly_target": rider.monthly_target}, f, indent=2)
+
+
+# ---------------- User sessions (recently signed-in ledgers kept in memory) ----------------
+# On a shared phone or kiosk riders sign in and out all day. Everything that
+# belongs to one rider lives on a RiderState; signing out parks the whole
+# object in a UserSession and signing back in swaps it back as rider instead
+# of re-reading the files, unless the ledger or its journal changed on disk since.
+SESSION_CACHE_SIZE = 4
+session_cache = OrderedDict()   # username -> UserSession, least recently used first
+
+class RiderState:
+    """The signed-in rider's ledger, derived data and editing state"""
+    def __init__(self):
+        self.financial_data = {}
+        self.archive_index = {}              # "YYYY" -> {"day_totals": ..., "category_sums": ...}
+        self.archived_years = OrderedDict()  # "YYYY" -> day dicts of recently opened archives
+        self.recurring_rules = RecurringRules()
+        self.budget_tracker = BudgetTracker()
+        self.monthly_target = None           # net the rider aims for each month, or None
+        self.ledger_aggregates = None
+        self.journal_edits = 0               # records in the rider's journal
+        # Editing buffers of the day on screen and the undo/redo stacks
+        self.current_entries = []
+        self.current_expenses = []
+        self.current_buffer_date = None
+        self.edit_sequence = 0
+        self.undo_stack = []
+        self.redo_stack = []
+        self.undo_expense_stack = []
+        self.redo_expense_stack = []
+
+rider = RiderState()
+
+class UserSession:
+    """One rider's RiderState while another rider is signed in"""
+    def __init__(self, username):
+        self.username = username
+        self.state = None
+        self.stamp = None   # ledger_stamp() when the state was parked
+
+    def park(self):
+        global rider
+        self.state = rider
+        self.stamp = ledger_stamp(self.username)
+        # Nothing done for the next rider can reach the parked state
+        rider = RiderState()
+
+    def resume(self):
+        global rider, ledger_generation
+        rider = self.state
+        with aggregates_lock:
+            # A warm-up still running for the previous rider must not publish here
+            ledger_generation += 1
+        if rider.ledger_aggregates is None:
+            start_ledger_warmup()
+
+def sign_in(username):
+    """Make username the current user, reusing their parked session when it is still valid"""
+    global current_user
+    if current_user is not None:
+        parked = session_cache.get(current_user) or UserSession(current_user)
+        parked.park()
+        session_cache[current_user] = parked
+    if current_user != username:
+        # Hidden screens belong to the previous rider
+        clear_screen_cache()
+    current_user = username
+    session = session_cache.pop(username, None)
+    if session is not None and session.stamp == ledger_stamp(username):
+        session.resume()
+    else:
+        load_user_data(username)
+        session = UserSession(username)
+    session_cache[username] = session
+    while len(session_cache) > SESSION_CACHE_SIZE:
+        session_cache.popitem(last=False)
 
-load_accounts()
 
+startup_loaded = False   # accounts read and storage folders made
 
 def splash_screen():
     # Add to navigation history
     add_to_history('splash_screen')
     
-    splash = tk.Tk()
+    splash = new_screen_window('splash_screen')
     splash.title("Money Rider - Financial Tracker")
     splash.configure(bg=MODERN_COLORS['background'])
     splash.resizable(False, False)
@@ -385,6 +2681,7 @@ def splash_screen():
                        pady=responsive_config.padding_large)
 
     # Header section
+    render_tracer.begin("splash header")
     header_frame = create_modern_frame(main_container, MODERN_COLORS['background'])
     header_frame.pack(pady=(responsive_config.padding_medium, responsive_config.padding_large))
 
@@ -415,8 +2712,10 @@ def splash_screen():
                        bg=MODERN_COLORS['background'], 
                        fg=MODERN_COLORS['text_secondary'])
     subtitle.pack(pady=responsive_config.padding_small)
+    render_tracer.end("splash header")
 
     # Button container with responsive spacing
+    render_tracer.begin("splash buttons")
     button_frame = create_modern_frame(main_container, MODERN_COLORS['background'])
     button_frame.pack(pady=responsive_config.padding_large)
 
@@ -432,6 +2731,42 @@ def splash_screen():
                                             command=lambda:[splash.destroy(), create_account_screen()],
                                             style='secondary', width=responsive_button_width)
     create_account_btn.pack(pady=responsive_config.padding_medium)
+    render_tracer.end("splash buttons")
+
+    # The splash paints first; accounts are read in the background and the
+    # buttons come alive once they are in
+    ready = {"painted": False}
+
+    def become_interactive():
+        login_btn.config(state=tk.NORMAL)
+        create_account_btn.config(state=tk.NORMAL)
+        startup_profiler.mark("interactive")
+        if "--profile-startup" in sys.argv:
+            quit_app(splash)
+
+    def painted():
+        startup_profiler.mark("first paint")
+        ready["painted"] = True
+        if startup_loaded:
+            become_interactive()
+
+    def loaded(_):
+        global startup_loaded
+        startup_loaded = True
+        if ready["painted"]:
+            become_interactive()
+
+    def load_failed(error):
+        # Without its users folder the app cannot sign anyone in, so say why and close
+        traceback.print_exception(type(error), error, error.__traceback__)
+        messagebox.showerror("Error", f"Could not load the rider accounts:\n{error}", parent=splash)
+        quit_app(splash)
+
+    if not startup_loaded:
+        login_btn.config(state=tk.DISABLED)
+        create_account_btn.config(state=tk.DISABLED)
+        async_bridge.submit(run_blocking(load_startup_data), loaded, load_failed)
+    splash.after_idle(painted)
 
     # Footer - responsive styling
     footer_frame = create_modern_frame(main_container, MODERN_COLORS['background'])
@@ -444,6 +2779,7 @@ def splash_screen():
                           fg=MODERN_COLORS['text_secondary'])
     footer_text.pack()
 
+    render_tracer.watch_first_idle(splash)
     splash.mainloop()
 
 # ---------------- Create Account ----------------
@@ -451,7 +2787,7 @@ def create_account_screen():
     # Add to navigation history
     add_to_history('create_account_screen')
     
-    create = tk.Tk()
+    create = new_screen_window('create_account_screen')
     create.title("Create Account - Money Rider")
     create.configure(bg=MODERN_COLORS['background'])
     create.resizable(False, False)
@@ -466,6 +2802,7 @@ def create_account_screen():
                        pady=responsive_config.padding_large)
 
     # Header - responsive styling
+    render_tracer.begin("create account header")
     header_frame = create_modern_frame(main_container, MODERN_COLORS['background'])
     header_frame.pack(pady=(0, responsive_config.padding_medium))
 
@@ -480,8 +2817,10 @@ def create_account_screen():
                        bg=MODERN_COLORS['background'], 
                        fg=MODERN_COLORS['text_secondary'])
     subtitle.pack(pady=responsive_config.padding_tiny)
+    render_tracer.end("create account header")
 
     # Form container - responsive card style
+    render_tracer.begin("create account form")
     form_frame = create_modern_frame(main_container, MODERN_COLORS['card'])
     form_frame.pack(fill=tk.X, pady=responsive_config.padding_large)
     form_frame.configure(relief='solid', bd=2)
@@ -507,7 +2846,7 @@ def create_account_screen():
                                                    padx=responsive_config.padding_medium, 
                                                    pady=(responsive_config.padding_medium, responsive_config.padding_small))
     
-    password_var = tk.StringVar()
+    password_var = tk.StringVar(create)
     password_entry = create_modern_entry(form_frame, show="*")
     password_entry.config(textvariable=password_var)
     password_entry.pack(fill=tk.X, 
@@ -532,21 +2871,24 @@ def create_account_screen():
         username = username_entry.get().strip()
         password = password_var.get()
         if not username or not password:
-            messagebox.showerror("Error", "Please fill in all fields")
+            messagebox.showerror("Error", "Please fill in all fields", parent=create)
             return
         if username in accounts:
-            messagebox.showerror("Error", "Username already exists")
+            messagebox.showerror("Error", "Username already exists", parent=create)
             return
         accounts[username] = password
         save_accounts()
         # create user data file (empty financial_data)
         with open(user_file(username), "w") as f:
             json.dump({}, f)
-        messagebox.showinfo("Success", "Account created successfully! Please sign in.")
+        messagebox.showinfo("Success", "Account created successfully! Please sign in.", parent=create)
         create.destroy()
         splash_screen()
 
+    render_tracer.end("create account form")
+
     # Button container - responsive styling
+    render_tracer.begin("create account buttons")
     button_frame = create_modern_frame(main_container, MODERN_COLORS['background'])
     button_frame.pack(pady=responsive_config.padding_medium)
 
@@ -561,13 +2903,18 @@ def create_account_screen():
                                   command=lambda: [create.destroy(), splash_screen()],
                                   style='secondary', width=responsive_button_width)
     back_btn.pack(pady=responsive_config.padding_small)
+    render_tracer.end("create account buttons")
+
+    render_tracer.watch_first_idle(create)
 
 # ---------------- Login ----------------
 def login_screen():
     # Add to navigation history
     add_to_history('login_screen')
+    # Signing in (or out) starts a fresh session: drop the previous user's screens
+    clear_screen_cache()
     
-    login = tk.Tk()
+    login = new_screen_window('login_screen')
     login.title("Sign In - Money Rider")
     login.configure(bg=MODERN_COLORS['background'])
     login.resizable(False, False)
@@ -582,6 +2929,7 @@ def login_screen():
                        pady=responsive_config.padding_large)
 
     # Header - responsive styling
+    render_tracer.begin("login header")
     header_frame = create_modern_frame(main_container, MODERN_COLORS['background'])
     header_frame.pack(pady=(0, responsive_config.padding_medium))
 
@@ -596,8 +2944,10 @@ def login_screen():
                        bg=MODERN_COLORS['background'], 
                        fg=MODERN_COLORS['text_secondary'])
     subtitle.pack(pady=responsive_config.padding_tiny)
+    render_tracer.end("login header")
 
     # Form container - responsive card style
+    render_tracer.begin("login form")
     form_frame = create_modern_frame(main_container, MODERN_COLORS['card'])
     form_frame.pack(fill=tk.X, pady=responsive_config.padding_large)
     form_frame.configure(relief='solid', bd=2)
@@ -623,7 +2973,7 @@ def login_screen():
                                                    padx=responsive_config.padding_medium, 
                                                    pady=(responsive_config.padding_medium, responsive_config.padding_small))
     
-    password_var = tk.StringVar()
+    password_var = tk.StringVar(login)
     password_entry = create_modern_entry(form_frame, show="*")
     password_entry.config(textvariable=password_var)
     password_entry.pack(fill=tk.X, 
@@ -648,16 +2998,17 @@ def login_screen():
         username = username_entry.get().strip()
         password = password_var.get()
         if username in accounts and accounts[username] == password:
-            # load this user's data
-            global current_user, financial_data
-            current_user = username
-            load_user_data(current_user)
+            # load this user's data (instant if they signed in recently)
+            sign_in(username)
             login.destroy()
             calendar_screen()
         else:
-            messagebox.showerror("Error", "Invalid username or password!")
+            messagebox.showerror("Error", "Invalid username or password!", parent=login)
+
+    render_tracer.end("login form")
 
     # Button container - responsive styling
+    render_tracer.begin("login buttons")
     button_frame = create_modern_frame(main_container, MODERN_COLORS['background'])
     button_frame.pack(pady=responsive_config.padding_small)
 
@@ -672,6 +3023,7 @@ def login_screen():
                                   command=lambda: [login.destroy(), splash_screen()],
                                   style='secondary', width=responsive_button_width)
     back_btn.pack(pady=responsive_config.padding_small)
+    render_tracer.end("login buttons")
 
     # Add global undo shortcut
     add_global_undo_shortcut(login)
@@ -679,12 +3031,113 @@ def login_screen():
     # Focus on username entry
     username_entry.focus()
 
+    render_tracer.watch_first_idle(login)
+
+# ---------------- Canvas calendar (month grid and year heatmap) ----------------
+def _blend_color(start, end, t):
+    """Mix two '#RRGGBB' colours; t=0 gives start, t=1 gives end"""
+    a = [int(start[i:i + 2], 16) for i in (1, 3, 5)]
+    b = [int(end[i:i + 2], 16) for i in (1, 3, 5)]
+    return "#" + "".join(f"{round(x + (y - x) * t):02X}" for x, y in zip(a, b))
+
+def net_heat_color(net, scale):
+    """Fill and text colour for a day's net: mint when empty, deeper green or red as it grows"""
+    if net is None:
+        return MODERN_COLORS['light'], MODERN_COLORS['dark']
+    strength = min(abs(net) / scale, 1.0) if scale else 1.0
+    target = MODERN_COLORS['primary_dark'] if net >= 0 else MODERN_COLORS['danger']
+    fill = _blend_color(MODERN_COLORS['light'], target, 0.35 + 0.65 * strength)
+    text = MODERN_COLORS['white'] if strength > 0.4 else MODERN_COLORS['dark']
+    return fill, text
+
+class CalendarCanvas:
+    """Month grids drawn on one tk.Canvas; clicks are hit-tested by arithmetic
+
+    on_day_click is called as on_day_click(year, month, day).
+    """
+    def __init__(self, canvas, on_day_click):
+        self.canvas = canvas
+        self.on_day_click = on_day_click
+        self.layouts = []   # (x, y, cell_w, cell_h, year, month, weeks)
+        canvas.bind("<Button-1>", self._on_click)
+        canvas.bind("<Motion>", self._on_motion)
+        canvas.bind("<Leave>", lambda e: canvas.itemconfigure("hover", state="hidden"))
+
+    def clear(self):
+        self.canvas.delete("all")
+        self.layouts = []
+
+    def draw_month(self, year, month, x, y, cell_w, cell_h, aggregates, scale,
+                   title=None, weekday_labels=None, day_font=None, today=None):
+        """Draw one month with its top-left corner at (x, y); returns the height used"""
+        canvas = self.canvas
+        top = y
+        if title:
+            canvas.create_text(x + cell_w * 7 / 2, top, text=title, anchor="n",
+                               fill=MODERN_COLORS['text_primary'], font=MODERN_FONTS['small'])
+            top += cell_h + 2
+        if weekday_labels:
+            for col, label in enumerate(weekday_labels):
+                canvas.create_text(x + (col + 0.5) * cell_w, top + cell_h / 2, text=label,
+                                   fill=MODERN_COLORS['text_primary'],
+                                   font=day_font or MODERN_FONTS['small'])
+            top += cell_h
+
+        weeks = calendar.monthcalendar(year, month)
+        for row, week in enumerate(weeks):
+            for col, day in enumerate(week):
+                if day == 0:
+                    continue
+                x0 = x + col * cell_w
+                y0 = top + row * cell_h
+                fill, text = net_heat_color(aggregates.day_net(f"{year}-{month:02d}-{day:02d}"), scale)
+                is_today = today is not None and (year, month, day) == (today.year, today.month, today.day)
+                canvas.create_rectangle(x0 + 1, y0 + 1, x0 + cell_w - 1, y0 + cell_h - 1, fill=fill,
+                                        outline=MODERN_COLORS['warning'] if is_today else "",
+                                        width=3 if is_today else 1)
+                if day_font:
+                    canvas.create_text(x0 + cell_w / 2, y0 + cell_h / 2, text=str(day),
+                                       fill=text, font=day_font)
+
+        self.layouts.append((x, top, cell_w, cell_h, year, month, weeks))
+        return top + len(weeks) * cell_h - y
+
+    def day_at(self, px, py):
+        """Return (year, month, day, cell x, cell y, cell_w, cell_h) at a canvas point, or None"""
+        for x, y, cell_w, cell_h, year, month, weeks in self.layouts:
+            col = int((px - x) // cell_w)
+            row = int((py - y) // cell_h)
+            if px >= x and py >= y and col < 7 and row < len(weeks) and weeks[row][col]:
+                return year, month, weeks[row][col], x + col * cell_w, y + row * cell_h, cell_w, cell_h
+        return None
+
+    def _on_motion(self, event):
+        hit = self.day_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if hit is None:
+            self.canvas.itemconfigure("hover", state="hidden")
+            self.canvas.config(cursor="")
+            return
+        x0, y0, cell_w, cell_h = hit[3:]
+        if not self.canvas.find_withtag("hover"):
+            self.canvas.create_rectangle(0, 0, 0, 0, outline=MODERN_COLORS['white'], width=2, tags="hover")
+        self.canvas.coords("hover", x0 + 1, y0 + 1, x0 + cell_w - 1, y0 + cell_h - 1)
+        self.canvas.itemconfigure("hover", state="normal")
+        self.canvas.tag_raise("hover")
+        self.canvas.config(cursor="hand2")
+
+    def _on_click(self, event):
+        hit = self.day_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if hit is not None:
+            self.on_day_click(*hit[:3])
+
 # ---------------- Calendar Screen (same layout/flow as original) ----------------
 def calendar_screen():
     # Add to navigation history
     add_to_history('calendar_screen')
+    if show_cached_screen('calendar_screen'):
+        return
     
-    cal = tk.Tk()
+    cal = new_screen_window('calendar_screen')
     cal.title("Money Rider - Calendar")
     cal.configure(bg=MODERN_COLORS['background'])
     cal.resizable(False, False)
@@ -697,8 +3150,8 @@ def calendar_screen():
     current_month = current_date.month
 
     # Define variables for month/year selection
-    month_var = tk.StringVar()
-    year_var = tk.StringVar()
+    month_var = tk.StringVar(cal)
+    year_var = tk.StringVar(cal)
 
     def show_saved_data(date_str, day):
         # Create a popup window to display saved data
@@ -718,9 +3171,10 @@ def calendar_screen():
                  font=("Bubblegum Sans", 14)).pack(pady=5)
 
         # Get the saved data (if missing, show zeros)
-        data = financial_data.get(date_str, {"income": 0.0, "expenses": 0.0, "entries": [], "expense_entries": []})
+        data = get_day(date_str, {"income": 0.0, "expenses": 0.0, "entries": [], "expense_entries": []})
 
         # Summary frame
+        render_tracer.begin("saved data summary")
         summary_frame = tk.Frame(main_frame, bg="#2C2C2C", bd=2, relief=tk.RIDGE)
         summary_frame.pack(fill=tk.X, padx=10, pady=15)
 
@@ -752,8 +3206,10 @@ def calendar_screen():
         tk.Label(net_frame, text=f"₱{net_total:,.2f}", bg="#2C2C2C",
                  fg="#4CAF50" if net_total >= 0 else "#F44336",
                  font=("Bubblegum Sans", 16, "bold")).pack(side=tk.RIGHT)
+        render_tracer.end("saved data summary")
 
         # Details frame
+        render_tracer.begin("saved data notebook")
         details_frame = tk.Frame(main_frame, bg="#1C1C1C")
         details_frame.pack(fill=tk.BOTH, expand=True, pady=10)
 
@@ -790,6 +3246,7 @@ def calendar_screen():
         else:
             tk.Label(expense_tab, text="No expense data", bg="#1C1C1C", fg="white",
                      font=("Bubblegum Sans", 14)).pack(pady=20)
+        render_tracer.end("saved data notebook")
 
         # Button frame
         button_frame = tk.Frame(main_frame, bg="#1C1C1C")
@@ -797,7 +3254,7 @@ def calendar_screen():
 
         # View/edit button (go to main entry screen for that day)
         edit_btn = create_modern_button(button_frame, "✏️ View/Edit", 
-                                       command=lambda: [popup.destroy(), cal.destroy(), income_screen(day, current_year, current_month)],
+                                       command=lambda: [popup.destroy(), leave_screen(cal), income_screen(day, current_year, current_month)],
                                        style='primary', width=12)
         edit_btn.pack(side=tk.LEFT, padx=5)
 
@@ -807,22 +3264,291 @@ def calendar_screen():
                                         style='secondary', width=12)
         close_btn.pack(side=tk.LEFT, padx=5)
 
-    def go_to_income(day):
-        global current_entries, current_expenses
-
+    def go_to_income(day, year=None, month=None):
+        year = year or current_year
+        month = month or current_month
         # Save current date for later reference
-        selected_date = f"{current_year}-{current_month:02d}-{day:02d}"
+        selected_date = f"{year}-{month:02d}-{day:02d}"
 
         # Load entries for this date (if exist) into buffers
-        if selected_date in financial_data:
-            daydata = financial_data[selected_date]
-            current_entries = [(e[0], float(e[1])) for e in daydata.get("entries", [])]
-            current_expenses = [(e[0], float(e[1])) for e in daydata.get("expense_entries", [])]
+        load_day_buffers(selected_date)
+        leave_screen(cal)
+        income_screen(day, year, month)
+
+    # Widgets that refresh_calendar() updates in place
+    grid_widgets = {'month_canvas': None, 'month_summary': None}
+
+    def month_summary_text():
+        month_income, month_expenses, _ = get_ledger_aggregates().month_summary(current_year, current_month)
+        last_day = calendar.monthrange(current_year, current_month)[1]
+        recurring_income, recurring_expenses = rider.recurring_rules.range_totals(
+            f"{current_year}-{current_month:02d}-01", f"{current_year}-{current_month:02d}-{last_day:02d}")
+        month_income += recurring_income
+        month_expenses += recurring_expenses
+        month_net = month_income - month_expenses
+        return f"Month net: ₱{month_net:,.2f}  (₱{month_income:,.2f} in / ₱{month_expenses:,.2f} out)"
+
+    def draw_month_canvas():
+        """(Re)draw the month grid, coloured by each day's net"""
+        month_canvas = grid_widgets['month_canvas']
+        canvas = month_canvas.canvas
+        cell_w = canvas.cell_w
+        cell_h = canvas.cell_h
+        aggregates = get_ledger_aggregates()
+        last_day = calendar.monthrange(current_year, current_month)[1]
+        scale = aggregates.largest_day_net(f"{current_year}-{current_month:02d}-01",
+                                           f"{current_year}-{current_month:02d}-{last_day:02d}")
+        month_canvas.clear()
+        height = month_canvas.draw_month(current_year, current_month, 0, 0, cell_w, cell_h,
+                                         aggregates, scale,
+                                         weekday_labels=["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+                                         day_font=MODERN_FONTS['body'], today=current_date)
+        canvas.config(height=height)
+
+    def refresh_calendar():
+        """Update a cached calendar for data changed while it was hidden"""
+        if grid_widgets['month_canvas'] is not None:
+            draw_month_canvas()
+        if grid_widgets['month_summary'] is not None:
+            grid_widgets['month_summary'].config(text=month_summary_text())
+
+    def show_year_view(year):
+        """Year at a glance: twelve small month heatmaps on one canvas"""
+        popup = tk.Toplevel(cal)
+        popup.title("Year at a Glance")
+        popup.configure(bg=MODERN_COLORS['background'])
+        popup.transient(cal)
+
+        cell = max(int(14 * responsive_config.scale_factor), 11)
+        gap = cell
+        block_w = 7 * cell
+        block_h = 9 * cell + 2
+        canvas = tk.Canvas(popup, bg=MODERN_COLORS['background'], highlightthickness=0,
+                           width=3 * block_w + 4 * gap, height=4 * block_h + 5 * gap)
+
+        def open_day(y, m, d):
+            popup.destroy()
+            go_to_income(d, y, m)
+
+        year_canvas = CalendarCanvas(canvas, open_day)
+        shown = {'year': year}
+
+        header = create_modern_frame(popup, MODERN_COLORS['background'])
+        header.pack(fill=tk.X, pady=responsive_config.padding_small)
+        year_label = tk.Label(header, font=MODERN_FONTS['subheading'],
+                              bg=MODERN_COLORS['background'], fg=MODERN_COLORS['text_primary'])
+
+        def draw_year():
+            render_tracer.begin("year heatmap")
+            shown_year = shown['year']
+            aggregates = get_ledger_aggregates()
+            scale = aggregates.largest_day_net(f"{shown_year}-01-01", f"{shown_year}-12-31")
+            year_label.config(text=str(shown_year))
+            year_canvas.clear()
+            for index in range(12):
+                row, col = divmod(index, 3)
+                year_canvas.draw_month(shown_year, index + 1,
+                                       gap + col * (block_w + gap), gap + row * (block_h + gap),
+                                       cell, cell, aggregates, scale,
+                                       title=calendar.month_name[index + 1],
+                                       weekday_labels="MTWTFSS", today=current_date)
+            render_tracer.end("year heatmap")
+
+        def switch_year(step):
+            shown['year'] += step
+            draw_year()
+
+        create_modern_button(header, "◀", command=lambda: switch_year(-1),
+                             style='secondary', width=3).pack(side=tk.LEFT, padx=10)
+        create_modern_button(header, "▶", command=lambda: switch_year(1),
+                             style='secondary', width=3).pack(side=tk.RIGHT, padx=10)
+        year_label.pack(expand=True)
+
+        canvas.pack(padx=responsive_config.padding_small)
+        tk.Label(popup, text="Darker green: larger positive net  •  Red: net loss",
+                 font=MODERN_FONTS['small'], bg=MODERN_COLORS['background'],
+                 fg=MODERN_COLORS['text_secondary']).pack(pady=responsive_config.padding_small)
+        draw_year()
+
+    cal.refresh_screen = refresh_calendar
+
+    def show_search_results(search_text):
+        """Results of the calendar search box, fetched from the lazy query a page at a time"""
+        try:
+            filters = parse_entry_search(search_text)
+        except ValueError:
+            messagebox.showerror("Search", "Amounts must be numbers and dates YYYY-MM-DD", parent=cal)
+            return
+        if not filters:
+            return
+        path, days = plan_entry_query(get_ledger_aggregates(), filters.get("start"), filters.get("end"),
+                                      filters.get("kind"), filters.get("name"))
+        results = query_entries(**filters)
+
+        result_window = tk.Toplevel(cal)
+        result_window.title("Search Entries")
+        result_window.configure(bg=MODERN_COLORS['light'])
+        result_window.geometry("560x480")
+
+        status_label = tk.Label(result_window, font=MODERN_FONTS['small'],
+                                bg=MODERN_COLORS['light'], fg=MODERN_COLORS['dark'])
+        status_label.pack(pady=(10, 5))
+
+        columns = ("date", "kind", "name", "amount")
+        table = ttk.Treeview(result_window, columns=columns, show="headings", height=16)
+        for column, heading, width in (("date", "Date", 100), ("kind", "Type", 80),
+                                       ("name", "Name", 200), ("amount", "Amount", 110)):
+            table.heading(column, text=heading)
+            table.column(column, width=width, anchor='e' if column == "amount" else 'w')
+        table.pack(fill=tk.BOTH, expand=True, padx=20)
+
+        shown = [0]
+        page_size = 100
+
+        def load_more():
+            page = list(islice(results, page_size))
+            for date_str, kind, name, amount in page:
+                table.insert("", tk.END, values=(date_str, kind.title(), name, f"₱{amount:,.2f}"))
+            shown[0] += len(page)
+            status_label.config(text=f"{shown[0]} match(es)  •  {path} access over {days} day(s)")
+            if len(page) < page_size:
+                more_btn.config(state='disabled')
+
+        def open_selected(e=None):
+            sel = table.selection()
+            if sel:
+                year, month, day = map(int, table.item(sel[0], "values")[0].split("-"))
+                result_window.destroy()
+                go_to_income(day, year, month)
+
+        table.bind('<Double-Button-1>', open_selected)
+        more_btn = create_modern_button(result_window, "Load more", command=load_more,
+                                        style='secondary', width=15)
+        more_btn.pack(pady=10)
+        load_more()
+
+    def show_top_reports():
+        """Biggest expenses and best earning days for this month, this year or all time"""
+        popup = tk.Toplevel(cal)
+        popup.title("Top Reports")
+        popup.configure(bg=MODERN_COLORS['light'])
+        popup.geometry("560x520")
+
+        controls = create_modern_frame(popup, MODERN_COLORS['light'])
+        controls.pack(pady=10)
+        scopes = {
+            "This month": (f"{current_year}-{current_month:02d}-01",
+                           f"{current_year}-{current_month:02d}-{calendar.monthrange(current_year, current_month)[1]:02d}"),
+            "This year": (f"{current_year}-01-01", f"{current_year}-12-31"),
+            "All time": ("0000-01-01", "9999-12-31")
+        }
+        scope_var = tk.StringVar(popup, value="This year")
+        count_var = tk.StringVar(popup, value="20")
+        tk.Label(controls, text="Top", font=MODERN_FONTS['body'],
+                 bg=MODERN_COLORS['light'], fg=MODERN_COLORS['dark']).pack(side=tk.LEFT)
+        count_menu = ttk.Combobox(controls, values=["10", "20", "50", "100"], textvariable=count_var,
+                                  state="readonly", font=MODERN_FONTS['body'], width=4)
+        count_menu.pack(side=tk.LEFT, padx=5)
+        scope_menu = ttk.Combobox(controls, values=list(scopes), textvariable=scope_var,
+                                  state="readonly", font=MODERN_FONTS['body'], width=11)
+        scope_menu.pack(side=tk.LEFT, padx=5)
+
+        report_notebook = ttk.Notebook(popup, style='Money.TNotebook')
+        report_notebook.pack(fill=tk.BOTH, expand=True, padx=20)
+        tables = {}
+        for key, title, columns in (
+                ("expenses", "💸 Biggest Expenses", (("date", "Date", 100), ("name", "Category", 200), ("amount", "Amount", 120))),
+                ("days", "💰 Top Earning Days", (("date", "Date", 100), ("income", "Income", 110),
+                                                ("expenses", "Expenses", 110), ("net", "Net", 110)))):
+            tab = create_modern_frame(report_notebook, MODERN_COLORS['card'])
+            report_notebook.add(tab, text=title)
+            table = ttk.Treeview(tab, columns=[c[0] for c in columns], show="headings", height=15)
+            for column, heading, width in columns:
+                table.heading(column, text=heading)
+                table.column(column, width=width, anchor='w' if column in ("date", "name") else 'e')
+            table.pack(fill=tk.BOTH, expand=True)
+            tables[key] = table
+
+        def fill_reports(e=None):
+            start, end = scopes[scope_var.get()]
+            n = int(count_var.get())
+            for table in tables.values():
+                table.delete(*table.get_children())
+            for date_str, _, name, amount in top_expenses(start, end, n):
+                tables["expenses"].insert("", tk.END, values=(date_str, name, f"₱{amount:,.2f}"))
+            for date_str, income, expenses in top_earning_days(start, end, n):
+                tables["days"].insert("", tk.END, values=(date_str, f"₱{income:,.2f}", f"₱{expenses:,.2f}",
+                                                          f"₱{income - expenses:,.2f}"))
+
+        scope_menu.bind("<<ComboboxSelected>>", fill_reports)
+        count_menu.bind("<<ComboboxSelected>>", fill_reports)
+        create_modern_button(popup, "Close", command=popup.destroy,
+                             style='primary', width=15).pack(pady=10)
+        fill_reports()
+
+    def backup_now():
+        result = backup_ledger(current_user)
+        if result is None:
+            messagebox.showinfo("Backup", "Nothing changed since the last backup.", parent=cal)
         else:
-            current_entries = []
-            current_expenses = []
-        cal.destroy()
-        income_screen(day, current_year, current_month)
+            _, changed, deleted = result
+            messagebox.showinfo("Backup", f"Backed up {changed} changed and {deleted} deleted day(s).", parent=cal)
+
+    def sync_now():
+        # The exchange runs in the background; the calendar stays usable meanwhile
+        sync_btn.config(state=tk.DISABLED, text="🔄 Syncing...")
+
+        def synced(result):
+            sync_btn.config(state=tk.NORMAL, text="🔄 Sync")
+            refresh_calendar()
+            sent, received, merged = result
+            messagebox.showinfo("Sync", f"Sent {sent} day(s), received {received}, merged {merged}.", parent=cal)
+
+        def failed(error):
+            sync_btn.config(state=tk.NORMAL, text="🔄 Sync")
+            # Sign-outs and malformed replies end up here too, not just network errors
+            traceback.print_exception(type(error), error, error.__traceback__)
+            messagebox.showerror("Sync", f"Could not sync with {SYNC_SERVER_URL}:\n{error}", parent=cal)
+
+        async_bridge.submit(sync_ledger_async(current_user), synced, failed)
+
+    def show_restore_dialog():
+        points = list_backups(current_user)
+        if not points:
+            messagebox.showinfo("Restore", "No backups yet.", parent=cal)
+            return
+        popup = tk.Toplevel(cal)
+        popup.title("Restore Backup")
+        popup.configure(bg=MODERN_COLORS['background'])
+        popup.transient(cal)
+
+        tk.Label(popup, text="Restore the ledger as it was at:", 
+                font=MODERN_FONTS['subheading'], 
+                bg=MODERN_COLORS['background'], 
+                fg=MODERN_COLORS['text_primary']).pack(padx=20, pady=(15, 5))
+        points_listbox = tk.Listbox(popup, height=10, width=32,
+                                    font=MODERN_FONTS['body'],
+                                    bg=MODERN_COLORS['white'], 
+                                    fg=MODERN_COLORS['dark'],
+                                    selectbackground=MODERN_COLORS['primary'])
+        for stamp in reversed(points):
+            points_listbox.insert(tk.END, datetime.strptime(stamp, "%Y%m%dT%H%M%S%f").strftime("%Y-%m-%d %H:%M:%S"))
+        points_listbox.pack(padx=20, pady=5)
+
+        def restore_selected():
+            sel = points_listbox.curselection()
+            if not sel:
+                messagebox.showinfo("Restore", "No backup selected", parent=popup)
+                return
+            if not messagebox.askyesno("Confirm", "Replace the ledger with this backup?\n"
+                                       "The current data is backed up first.", parent=popup):
+                return
+            restore_backup(current_user, points[len(points) - 1 - sel[0]])
+            popup.destroy()
+            refresh_calendar()
+
+        create_modern_button(popup, "⏪ Restore", command=restore_selected,
+                             style='warning', width=15).pack(pady=(5, 15))
 
     def create_calendar_grid():
         for widget in cal.winfo_children():
@@ -838,6 +3564,7 @@ def calendar_screen():
         scrollable_content = cal_frame.scrollable_frame
 
         # Header with title and controls
+        render_tracer.begin("calendar header")
         header_frame = create_modern_frame(scrollable_content, MODERN_COLORS['background'])
         header_frame.pack(fill=tk.X, pady=(0, responsive_config.padding_large))
 
@@ -873,94 +3600,47 @@ def calendar_screen():
         year_menu.grid(row=0, column=1, padx=5, pady=5)
         year_menu.bind("<<ComboboxSelected>>", lambda e: change_year())
 
+        # Month summary from the precomputed month totals
+        month_summary_label = tk.Label(header_frame,
+                                       text=month_summary_text(),
+                                       font=MODERN_FONTS['small'],
+                                       bg=MODERN_COLORS['background'],
+                                       fg=MODERN_COLORS['text_secondary'])
+        month_summary_label.pack(pady=(responsive_config.padding_tiny, 0))
+        grid_widgets['month_summary'] = month_summary_label
+
+        # Entry search, e.g. "expenses over 500 Maintenance since 2026-03-01"
+        search_row = create_modern_frame(header_frame, MODERN_COLORS['background'])
+        search_row.pack(fill=tk.X, pady=(responsive_config.padding_small, 0))
+        search_var = tk.StringVar(cal)
+        search_entry = create_modern_entry(search_row)
+        search_entry.config(textvariable=search_var)
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        search_entry.bind('<Return>', lambda e: show_search_results(search_var.get()))
+        create_modern_button(search_row, "🔍", command=lambda: show_search_results(search_var.get()),
+                             style='secondary', width=3).pack(side=tk.LEFT)
+        render_tracer.end("calendar header")
+
         # Calendar container
+        render_tracer.begin("calendar day grid")
         calendar_container = create_modern_frame(scrollable_content, MODERN_COLORS['card'])
         calendar_container.pack(fill=tk.BOTH, expand=True, 
                                pady=responsive_config.padding_small, 
                                padx=responsive_config.padding_tiny)
         calendar_container.configure(relief='solid', bd=1)
 
-        # Days of week header
-        days_frame = create_modern_frame(calendar_container, MODERN_COLORS['card'])
-        days_frame.pack(fill=tk.X, padx=5, pady=10)
-
-        days_of_week = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        for col, day in enumerate(days_of_week):
-            day_label = tk.Label(days_frame, text=day, 
-                               bg=MODERN_COLORS['card'], 
-                               fg=MODERN_COLORS['text_primary'],
-                               font=MODERN_FONTS['body'])
-            day_label.grid(row=0, column=col, padx=1, pady=5, sticky='ew')
-        
-        # Configure grid weights for weekday headers to match calendar grid
-        for i in range(7):
-            days_frame.grid_columnconfigure(i, weight=1)
-
-        # Calendar days grid
-        days_grid_frame = create_modern_frame(calendar_container, MODERN_COLORS['card'])
-        days_grid_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=(0, 10))
-        
-        month_cal = calendar.monthcalendar(current_year, current_month)
-        for row, week in enumerate(month_cal):
-            for col, day in enumerate(week):
-                if day == 0:
-                    # Empty space for days not in the month
-                    empty_label = tk.Label(days_grid_frame, text="", 
-                                         bg=MODERN_COLORS['white'])
-                    empty_label.grid(row=row+1, column=col, padx=1, pady=1, sticky='nsew')
-                    continue
-
-                date_str = f"{current_year}-{current_month:02d}-{day:02d}"
-
-                # Determine button style
-                if (day == current_date.day and
-                    current_month == current_date.month and
-                    current_year == current_date.year):
-                    # Current day
-                    day_bg = MODERN_COLORS['primary']
-                    day_fg = MODERN_COLORS['white']
-                elif date_str in financial_data:
-                    # Days with data
-                    day_bg = MODERN_COLORS['success']
-                    day_fg = MODERN_COLORS['white']
-                else:
-                    # Regular days
-                    day_bg = MODERN_COLORS['light']
-                    day_fg = MODERN_COLORS['dark']
-
-                day_button = tk.Button(days_grid_frame, text=str(day), 
-                                     bg=day_bg, fg=day_fg,
-                                     font=MODERN_FONTS['body'],
-                                     relief='flat', bd=1,
-                                     cursor='hand2',
-                                     command=lambda d=day: go_to_income(d))
-                day_button.grid(row=row + 1, column=col, padx=1, pady=1, sticky='nsew')
-                
-                # Add hover effect
-                def create_hover_effect(btn, original_bg):
-                    def on_enter(e):
-                        if original_bg == MODERN_COLORS['primary']:
-                            btn.config(bg=MODERN_COLORS['primary_dark'])
-                        elif original_bg == MODERN_COLORS['success']:
-                            btn.config(bg='#059669')
-                        else:
-                            btn.config(bg=MODERN_COLORS['border'])
-                    
-                    def on_leave(e):
-                        btn.config(bg=original_bg)
-                    
-                    btn.bind("<Enter>", on_enter)
-                    btn.bind("<Leave>", on_leave)
-                
-                create_hover_effect(day_button, day_bg)
-
-        # Configure grid weights for proper sizing
-        for i in range(7):
-            days_grid_frame.grid_columnconfigure(i, weight=1)
-        for i in range(6):
-            days_grid_frame.grid_rowconfigure(i, weight=1)
+        # Weekday header and day cells share one canvas; refresh_calendar() redraws it
+        month_canvas = tk.Canvas(calendar_container, bg=MODERN_COLORS['card'], highlightthickness=0,
+                                 width=responsive_config.window_width - 60)
+        month_canvas.cell_w = (responsive_config.window_width - 60) // 7
+        month_canvas.cell_h = max(int(44 * responsive_config.scale_factor), 32)
+        month_canvas.pack(padx=5, pady=10)
+        grid_widgets['month_canvas'] = CalendarCanvas(month_canvas, lambda y, m, d: go_to_income(d, y, m))
+        draw_month_canvas()
+        render_tracer.end("calendar day grid")
 
         # Date range calculation section
+        render_tracer.begin("date range calculator")
         range_container = create_modern_frame(scrollable_content, MODERN_COLORS['background'])
         range_container.pack(fill=tk.X, pady=15, padx=5)
 
@@ -1025,53 +3705,152 @@ def calendar_screen():
         end_year.grid(row=1, column=3, sticky="ew", padx=2, pady=5)
         end_year.set(str(current_year))
 
-        def calculate_range():
-            try:
-                # Get start date components
-                start_d = int(start_day.get())
-                start_m = list(calendar.month_name).index(start_month.get())
-                start_y = int(start_year.get())
+        # Grouping row
+        tk.Label(date_input_frame, text="Group by:", 
+                font=MODERN_FONTS['body'], 
+                bg=MODERN_COLORS['white'], 
+                fg=MODERN_COLORS['dark']).grid(row=2, column=0, sticky="w", padx=(0, 5), pady=5)
 
-                # Get end date components
-                end_d = int(end_day.get())
-                end_m = list(calendar.month_name).index(end_month.get())
-                end_y = int(end_year.get())
+        grouping_choices = {"None": None, "Day": 'day', "ISO Week": 'week',
+                            "Month": 'month', "Weekday": 'weekday'}
+        group_by = ttk.Combobox(date_input_frame, values=list(grouping_choices), width=15,
+                                font=MODERN_FONTS['body'], state="readonly")
+        group_by.grid(row=2, column=1, columnspan=3, sticky="ew", padx=2, pady=5)
+        group_by.set("None")
 
-                # Create date strings for comparison
-                start_date_str = f"{start_y}-{start_m:02d}-{start_d:02d}"
-                end_date_str = f"{end_y}-{end_m:02d}-{end_d:02d}"
+        # Ranges queued with "Add Range" are compared side by side
+        queued_ranges = []
+        queued_label = tk.Label(range_frame, text="", 
+                               font=MODERN_FONTS['small'], 
+                               bg=MODERN_COLORS['card'], 
+                               fg=MODERN_COLORS['text_secondary'],
+                               justify='left')
+        queued_label.pack(fill=tk.X, padx=10)
+
+        def read_range():
+            """Return the (start, end) date strings picked in the From/To boxes"""
+            # Get start date components
+            start_d = int(start_day.get())
+            start_m = list(calendar.month_name).index(start_month.get())
+            start_y = int(start_year.get())
+
+            # Get end date components
+            end_d = int(end_day.get())
+            end_m = list(calendar.month_name).index(end_month.get())
+            end_y = int(end_year.get())
+
+            # The day boxes offer 1-31 for every month; "April 31" means the month's last day
+            start_d = min(start_d, calendar.monthrange(start_y, start_m)[1])
+            end_d = min(end_d, calendar.monthrange(end_y, end_m)[1])
+
+            # Create date strings for comparison
+            return f"{start_y}-{start_m:02d}-{start_d:02d}", f"{end_y}-{end_m:02d}-{end_d:02d}"
+
+        def show_queued_ranges():
+            queued_label.config(text="\n".join(f"Range {i + 1}: {start} to {end}"
+                                               for i, (start, end) in enumerate(queued_ranges)))
+
+        def add_range():
+            try:
+                selected = read_range()
+            except ValueError:
+                messagebox.showerror("Error", "Invalid date selection", parent=cal)
+                return
+            if selected[0] > selected[1]:
+                messagebox.showerror("Error", "Start date must be before end date", parent=cal)
+                return
+            if selected not in queued_ranges:
+                queued_ranges.append(selected)
+            show_queued_ranges()
+
+        def clear_ranges():
+            queued_ranges.clear()
+            show_queued_ranges()
+
+        def show_grouped_results(ranges, grouping):
+            rows = get_ledger_aggregates().grouped_totals(ranges, grouping)
+            # Recurring rules are totalled per range, not split into buckets
+            recurring_rows = [(start, end) + rider.recurring_rules.range_totals(start, end)
+                              for start, end in ranges] if rider.recurring_rules.rules else []
+
+            result_window = tk.Toplevel(cal)
+            result_window.title("Date Range Results")
+            result_window.configure(bg=MODERN_COLORS['light'])
+            result_window.geometry("640x480")
+
+            result_container = create_modern_frame(result_window, MODERN_COLORS['light'])
+            result_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+            tk.Label(result_container, text="Range Comparison", 
+                    font=MODERN_FONTS['heading'], 
+                    bg=MODERN_COLORS['light'], 
+                    fg=MODERN_COLORS['dark']).pack(pady=(0, 10))
+
+            columns = ("range", "bucket", "days", "income", "expenses", "net")
+            table = ttk.Treeview(result_container, columns=columns, show="headings", height=14)
+            for column, heading, width in (("range", "Range", 170), ("bucket", "Group", 100),
+                                           ("days", "Days", 50), ("income", "Income", 90),
+                                           ("expenses", "Expenses", 90), ("net", "Net", 90)):
+                table.heading(column, text=heading)
+                table.column(column, width=width, anchor='w' if column in ("range", "bucket") else 'e')
+            table.pack(fill=tk.BOTH, expand=True)
+
+            for i, bucket, income, expenses, days in rows:
+                start, end = ranges[i]
+                table.insert("", tk.END, values=(f"{start} to {end}", bucket, days,
+                                                 f"₱{income:,.2f}", f"₱{expenses:,.2f}",
+                                                 f"₱{income - expenses:,.2f}"))
+            if not rows:
+                table.insert("", tk.END, values=("No data in the selected ranges", "", "", "", "", ""))
+            for start, end, income, expenses in recurring_rows:
+                table.insert("", tk.END, values=(f"{start} to {end}", "↻ Recurring", "",
+                                                 f"₱{income:,.2f}", f"₱{expenses:,.2f}",
+                                                 f"₱{income - expenses:,.2f}"))
+
+            close_btn = create_modern_button(result_container, "Close", 
+                                           command=result_window.destroy,
+                                           style='primary', width=15)
+            close_btn.pack(pady=10)
+
+        def calculate_range():
+            try:
+                start_date_str, end_date_str = read_range()
 
                 # Validate date range
                 if start_date_str > end_date_str:
-                    messagebox.showerror("Error", "Start date must be before end date")
+                    messagebox.showerror("Error", "Start date must be before end date", parent=cal)
                     return
 
-                # Calculate totals
-                total_income = 0.0
-                total_expenses = 0.0
-                days_with_data = 0
+                # Several ranges or a grouping go to the comparison table
+                ranges = list(queued_ranges)
+                if (start_date_str, end_date_str) not in ranges:
+                    ranges.append((start_date_str, end_date_str))
+                grouping = grouping_choices[group_by.get()]
+                if len(ranges) > 1 or grouping is not None:
+                    show_grouped_results(ranges, grouping)
+                    return
 
-                for date_str in sorted(financial_data.keys()):
-                    if start_date_str <= date_str <= end_date_str:
-                        data = financial_data[date_str]
-                        total_income += float(data.get("income", 0))
-                        total_expenses += float(data.get("expenses", 0))
-                        days_with_data += 1
+                # Calculate totals from the warmed-up date index
+                total_income, total_expenses, days_with_data = \
+                    get_ledger_aggregates().range_totals(start_date_str, end_date_str)
+                recurring_income, recurring_expenses = rider.recurring_rules.range_totals(start_date_str, end_date_str)
+                total_income += recurring_income
+                total_expenses += recurring_expenses
 
                 net_total = total_income - total_expenses
 
                 # Display results in modern window
                 result_window = tk.Toplevel(cal)
                 result_window.title("Date Range Results")
-                result_window.geometry("500x400")
+                result_window.geometry("500x440")
                 result_window.configure(bg=MODERN_COLORS['light'])
                 result_window.resizable(False, False)
 
                 # Center the result window
                 result_window.update_idletasks()
                 x = (result_window.winfo_screenwidth() // 2) - (500 // 2)
-                y = (result_window.winfo_screenheight() // 2) - (400 // 2)
-                result_window.geometry(f"500x400+{x}+{y}")
+                y = (result_window.winfo_screenheight() // 2) - (440 // 2)
+                result_window.geometry(f"500x440+{x}+{y}")
 
                 # Main container
                 result_container = create_modern_frame(result_window, MODERN_COLORS['light'])
@@ -1099,6 +3878,7 @@ def calendar_screen():
                 # Results
                 results = [
                     ("Days with data", str(days_with_data), MODERN_COLORS['dark']),
+                    ("Recurring (included)", f"₱{recurring_income - recurring_expenses:,.2f}", MODERN_COLORS['dark']),
                     ("Total Income", f"₱{total_income:,.2f}", MODERN_COLORS['success']),
                     ("Total Expenses", f"₱{total_expenses:,.2f}", MODERN_COLORS['danger']),
                     ("Net Total", f"₱{net_total:,.2f}", MODERN_COLORS['success'] if net_total >= 0 else MODERN_COLORS['danger'])
@@ -1125,7 +3905,21 @@ def calendar_screen():
                 close_btn.pack(pady=20)
 
             except ValueError:
-                messagebox.showerror("Error", "Invalid date selection")
+                messagebox.showerror("Error", "Invalid date selection", parent=cal)
+
+        # Range queue buttons
+        queue_row = create_modern_frame(range_frame, MODERN_COLORS['card'])
+        queue_row.pack(pady=(10, 0))
+
+        add_range_btn = create_modern_button(queue_row, "➕ Add Range", 
+                                           command=add_range,
+                                           style='secondary', width=10)
+        add_range_btn.pack(side=tk.LEFT, padx=5)
+
+        clear_ranges_btn = create_modern_button(queue_row, "Clear", 
+                                              command=clear_ranges,
+                                              style='warning', width=8)
+        clear_ranges_btn.pack(side=tk.LEFT, padx=5)
 
         # Calculate button
         calc_button = create_modern_button(range_frame, "Calculate Range", 
@@ -1133,46 +3927,188 @@ def calendar_screen():
                                          style='primary', width=20)
         calc_button.pack(pady=10)
 
+        def show_distribution():
+            try:
+                start_date_str, end_date_str = read_range()
+            except ValueError:
+                messagebox.showerror("Error", "Invalid date selection", parent=cal)
+                return
+            if start_date_str > end_date_str:
+                messagebox.showerror("Error", "Start date must be before end date", parent=cal)
+                return
+            net_sketch, expenses_sketch = get_ledger_aggregates().distribution(start_date_str, end_date_str)
+
+            result_window = tk.Toplevel(cal)
+            result_window.title("Daily Distribution")
+            result_window.configure(bg=MODERN_COLORS['light'])
+            result_window.geometry("480x260")
+
+            tk.Label(result_window, text=f"{start_date_str} to {end_date_str} ({net_sketch.count} days)", 
+                    font=MODERN_FONTS['subheading'], 
+                    bg=MODERN_COLORS['light'], 
+                    fg=MODERN_COLORS['dark']).pack(pady=10)
+
+            columns = ("series",) + tuple(label for _, label in PERCENTILES)
+            table = ttk.Treeview(result_window, columns=columns, show="headings", height=2)
+            table.heading("series", text="Per day")
+            table.column("series", width=120, anchor='w')
+            for _, label in PERCENTILES:
+                table.heading(label, text=label)
+                table.column(label, width=100, anchor='e')
+            table.pack(fill=tk.X, padx=20)
+            fractions = [q for q, _ in PERCENTILES]
+            for series, sketch in (("Net", net_sketch), ("Expenses", expenses_sketch)):
+                values = sketch.quantiles(fractions)
+                table.insert("", tk.END, values=(series,) + tuple(
+                    "—" if value is None else f"₱{value:,.2f}" for value in values))
+
+            create_modern_button(result_window, "Close", command=result_window.destroy,
+                                 style='primary', width=15).pack(pady=15)
+
+        distribution_button = create_modern_button(range_frame, "📊 Daily Distribution", 
+                                                 command=show_distribution,
+                                                 style='secondary', width=20)
+        distribution_button.pack(pady=(0, 10))
+
+        def show_fleet_totals():
+            try:
+                start_date_str, end_date_str = read_range()
+            except ValueError:
+                messagebox.showerror("Error", "Invalid date selection", parent=cal)
+                return
+            if start_date_str > end_date_str:
+                messagebox.showerror("Error", "Start date must be before end date", parent=cal)
+                return
+            # Every rider's file is read in the background; the calendar stays responsive
+            cal.config(cursor="watch")
+            fleet_button.config(state=tk.DISABLED)
+
+            def done(result):
+                cal.config(cursor="")
+                fleet_button.config(state=tk.NORMAL)
+                show_fleet_window(start_date_str, end_date_str, *result)
+
+            def failed(error):
+                cal.config(cursor="")
+                fleet_button.config(state=tk.NORMAL)
+                traceback.print_exception(type(error), error, error.__traceback__)
+                messagebox.showerror("Fleet Totals", f"Could not total the riders:\n{error}", parent=cal)
+
+            async_bridge.submit(run_blocking(fleet_range_totals, start_date_str, end_date_str), done, failed)
+
+        def show_fleet_window(start_date_str, end_date_str, rows, combined, skipped):
+            result_window = tk.Toplevel(cal)
+            result_window.title("Fleet Totals")
+            result_window.configure(bg=MODERN_COLORS['light'])
+            result_window.geometry("560x480")
+
+            tk.Label(result_window, text=f"All riders, {start_date_str} to {end_date_str}", 
+                    font=MODERN_FONTS['subheading'], 
+                    bg=MODERN_COLORS['light'], 
+                    fg=MODERN_COLORS['dark']).pack(pady=10)
+
+            columns = ("rider", "days", "income", "expenses", "net")
+            table = ttk.Treeview(result_window, columns=columns, show="headings", height=16)
+            for column, heading, width in (("rider", "Rider", 140), ("days", "Days", 60),
+                                           ("income", "Income", 110), ("expenses", "Expenses", 110),
+                                           ("net", "Net", 110)):
+                table.heading(column, text=heading)
+                table.column(column, width=width, anchor='w' if column == "rider" else 'e')
+            table.pack(fill=tk.BOTH, expand=True, padx=20)
+            for username, income, expenses, net, days in rows + [("All riders",) + combined]:
+                table.insert("", tk.END, values=(username, days, f"₱{income:,.2f}",
+                                                 f"₱{expenses:,.2f}", f"₱{net:,.2f}"))
+            for username, error in skipped:
+                table.insert("", tk.END, values=(f"⚠ {username}", "", "skipped", "", ""))
+            if skipped:
+                tk.Label(result_window, text="Not counted: " + "; ".join(f"{username} ({error})" for username, error in skipped),
+                        font=MODERN_FONTS['small'], 
+                        bg=MODERN_COLORS['light'], 
+                        fg=MODERN_COLORS['danger'], wraplength=520, justify='left').pack(padx=20, pady=(5, 0))
+
+            create_modern_button(result_window, "Close", command=result_window.destroy,
+                                 style='primary', width=15).pack(pady=10)
+
+        # Only the shop's admin account sees every rider
+        if current_user == "admin":
+            fleet_button = create_modern_button(range_frame, "🏍 Fleet Totals", 
+                                              command=show_fleet_totals,
+                                              style='secondary', width=20)
+            fleet_button.pack(pady=(0, 10))
+        render_tracer.end("date range calculator")
+
         # Navigation buttons - responsive styling
+        render_tracer.begin("calendar buttons")
         nav_frame = create_modern_frame(scrollable_content, MODERN_COLORS['background'])
         nav_frame.pack(pady=responsive_config.padding_large)
 
         # Undo button - responsive sizing
         responsive_button_width = max(int(20 * responsive_config.scale_factor), 15)
         undo_btn = create_undo_button(nav_frame, 
-                                     command=lambda: [cal.destroy(), navigate_back()],
+                                     command=lambda: [leave_screen(cal), navigate_back()],
                                      style='warning', width=responsive_button_width)
         undo_btn.pack(pady=responsive_config.padding_tiny)
 
+        # Year heatmap
+        year_btn = create_modern_button(nav_frame, "📅 Year at a Glance",
+                                        command=lambda: show_year_view(current_year),
+                                        style='secondary', width=responsive_button_width)
+        year_btn.pack(pady=responsive_config.padding_tiny)
+
+        # Biggest expenses / best days
+        top_btn = create_modern_button(nav_frame, "🏆 Top Reports",
+                                       command=show_top_reports,
+                                       style='secondary', width=responsive_button_width)
+        top_btn.pack(pady=responsive_config.padding_tiny)
+
+        # Incremental backup/restore and device sync
+        backup_row = create_modern_frame(nav_frame, MODERN_COLORS['background'])
+        backup_row.pack(pady=responsive_config.padding_tiny)
+        create_modern_button(backup_row, "💾 Backup", command=backup_now,
+                             style='secondary', width=responsive_button_width // 2).pack(side=tk.LEFT, padx=2)
+        create_modern_button(backup_row, "⏪ Restore", command=show_restore_dialog,
+                             style='secondary', width=responsive_button_width // 2).pack(side=tk.LEFT, padx=2)
+        sync_btn = create_modern_button(backup_row, "🔄 Sync", command=sync_now,
+                                        style='secondary', width=responsive_button_width // 2)
+        sync_btn.pack(side=tk.LEFT, padx=2)
+
         # Sign out button with responsive styling
         signout_btn = create_modern_button(nav_frame, "🚪 Sign Out", 
                                           command=lambda: [cal.destroy(), login_screen()],
                                           style='danger', width=responsive_button_width)
         signout_btn.pack(pady=responsive_config.padding_tiny)
+        render_tracer.end("calendar buttons")
 
     def change_month():
         nonlocal current_month
         selected_month = month_var.get()
         current_month = list(calendar.month_name).index(selected_month)
+        render_tracer.navigation_start("calendar month switch")
         create_calendar_grid()
+        render_tracer.watch_first_idle(cal)
 
     def change_year():
         nonlocal current_year
         current_year = int(year_var.get())
+        render_tracer.navigation_start("calendar year switch")
         create_calendar_grid()
+        render_tracer.watch_first_idle(cal)
 
     # Add global undo shortcut
     add_global_undo_shortcut(cal)
 
     create_calendar_grid()
+    render_tracer.watch_first_idle(cal)
     cal.mainloop()
 
 # ---------------- Income Screen (keeps original layout, Edit/Delete implemented) ----------------
 def income_screen(day, year, month):
     # Add to navigation history
     add_to_history('income_screen', day, year, month)
+    if show_cached_screen('income_screen', day, year, month):
+        return
     
-    inc = tk.Tk()
+    inc = new_screen_window('income_screen', day, year, month)
     inc.title("Financial Tracking - Money Rider")
     inc.configure(bg=MODERN_COLORS['background'])
     inc.resizable(False, False)
@@ -1188,22 +4124,26 @@ def income_screen(day, year, month):
     
     floating_font_size = max(int(16 * responsive_config.scale_factor), 12)
     floating_undo_btn = tk.Button(floating_undo_frame, text="←", 
-                                 command=lambda: [inc.destroy(), navigate_back()],
+                                 command=lambda: [leave_screen(inc), navigate_back()],
                                  bg=MODERN_COLORS['primary'], fg=MODERN_COLORS['white'],
                                  font=('Segoe UI', floating_font_size, 'bold'), relief='flat', bd=0,
                                  cursor='hand2', activebackground=MODERN_COLORS['primary_dark'])
     floating_undo_btn.pack(fill=tk.BOTH, expand=True)
 
-    name_var = tk.StringVar()
-    income_var = tk.StringVar()
+    name_var = tk.StringVar(inc)
+    income_var = tk.StringVar(inc)
     
     # Expense variables
-    expense_var = tk.StringVar()
-    amount_var = tk.StringVar()
+    expense_var = tk.StringVar(inc)
+    amount_var = tk.StringVar(inc)
 
     # Store the current date
     current_date_str = f"{year}-{month:02d}-{day:02d}"
 
+    # Make sure the editing buffers hold this day's entries
+    if rider.current_buffer_date != current_date_str:
+        load_day_buffers(current_date_str)
+
     # Main container with responsive padding and scrolling
     main_container = create_scrollable_frame(inc, MODERN_COLORS['background'])
     main_container.pack(fill=tk.BOTH, expand=True, 
@@ -1214,6 +4154,7 @@ def income_screen(day, year, month):
     scrollable_content = main_container.scrollable_frame
 
     # Header section
+    render_tracer.begin("income header")
     header_frame = create_modern_frame(scrollable_content, MODERN_COLORS['background'])
     header_frame.pack(fill=tk.X, pady=(0, responsive_config.padding_large))
 
@@ -1236,22 +4177,19 @@ def income_screen(day, year, month):
     # Undo button at the top for better visibility
     responsive_button_width = max(int(15 * responsive_config.scale_factor), 12)
     top_undo_btn = create_undo_button(header_frame, 
-                                     command=lambda: [inc.destroy(), navigate_back()],
+                                     command=lambda: [leave_screen(inc), navigate_back()],
                                      style='warning', width=responsive_button_width)
     top_undo_btn.pack(pady=responsive_config.padding_tiny)
+    render_tracer.end("income header")
 
     # Input section with responsive cards
+    render_tracer.begin("income input notebook")
     input_frame = create_modern_frame(scrollable_content, MODERN_COLORS['background'])
     input_frame.pack(fill=tk.X, pady=(0, responsive_config.padding_medium))
     
-    # Create notebook for tabs with mobile styling
-    notebook = ttk.Notebook(input_frame)
+    # Create notebook for tabs with mobile styling (see install_theme)
+    notebook = ttk.Notebook(input_frame, style='Money.TNotebook')
     notebook.pack(fill=tk.X)
-    
-    # Style the notebook for mobile look
-    style = ttk.Style()
-    style.configure('TNotebook', tabposition='n')
-    style.configure('TNotebook.Tab', padding=[20, 10], font=MODERN_FONTS['body'])
 
     # Income tab with mobile card styling
     income_tab = create_modern_frame(notebook, MODERN_COLORS['card'])
@@ -1297,23 +4235,22 @@ def income_screen(day, year, month):
         name = name_var.get().strip()
         income = income_var.get().strip()
         if not name or not income:
-            messagebox.showinfo("Error", "Please fill in all fields!")
+            messagebox.showinfo("Error", "Please fill in all fields!", parent=inc)
             return
 
         try:
             income_val = float(income)
         except ValueError:
-            messagebox.showerror("Error", "Amount must be a valid number")
+            messagebox.showerror("Error", "Amount must be a valid number", parent=inc)
             return
 
         entry = (name, income_val)
-        current_entries.append(entry)
+        # autosave to user's financial_data (undoable)
+        edit_day_entry("income", current_date_str, "insert", len(rider.current_entries), entry)
         # Format with modern styling
         income_listbox.insert(tk.END, f"{name:<30} ₱{income_val:>10,.2f}")
         name_var.set("")
         income_var.set("")
-        # autosave to user's financial_data
-        save_data(current_date_str)
 
     def enter_expense():
         category = category_var.get()
@@ -1321,22 +4258,23 @@ def income_screen(day, year, month):
             category = custom_var.get().strip()
         amount = amount_var.get().strip()
         if not category or not amount:
-            messagebox.showinfo("Error", "Please fill in all fields!")
+            messagebox.showinfo("Error", "Please fill in all fields!", parent=inc)
             return
         try:
             amount_val = float(amount)
         except ValueError:
-            messagebox.showerror("Error", "Amount must be a valid number")
+            messagebox.showerror("Error", "Amount must be a valid number", parent=inc)
             return
 
         entry = (category, amount_val)
-        current_expenses.append(entry)
+        # autosave to user's financial_data (undoable)
+        alerts = edit_day_entry("expense", current_date_str, "insert", len(rider.current_expenses), entry)
         # Format with modern styling
         expense_listbox.insert(tk.END, f"{category:<30} ₱{amount_val:>10,.2f}")
         amount_var.set("")
         custom_var.set("")
-        # autosave to user's financial_data
-        save_data(current_date_str)
+        warn_budget_alerts(inc, alerts)
+        refresh_budget_list()
 
     # Add Income button with responsive styling
     responsive_button_width = max(int(25 * responsive_config.scale_factor), 20)
@@ -1365,7 +4303,7 @@ def income_screen(day, year, month):
                                                    pady=(responsive_config.padding_medium, responsive_config.padding_tiny))
     
     # Category dropdown with responsive styling
-    category_var = tk.StringVar()
+    category_var = tk.StringVar(inc)
     categories = ["Food", "Gas", "Maintenance", "Other"]
     cat_menu = ttk.Combobox(expense_card, values=categories, textvariable=category_var, 
                            state="readonly", font=MODERN_FONTS['body'])
@@ -1375,7 +4313,7 @@ def income_screen(day, year, month):
     cat_menu.set(categories[0])
 
     # Custom category entry (hidden by default)
-    custom_var = tk.StringVar()
+    custom_var = tk.StringVar(inc)
     custom_entry = create_modern_entry(expense_card)
     custom_entry.config(textvariable=custom_var)
     
@@ -1409,6 +4347,187 @@ def income_screen(day, year, month):
                                          style='success', width=responsive_button_width)
     add_expense_btn.pack(pady=(0, responsive_config.padding_medium))
 
+    # Recurring tab: rules are expanded on demand, never copied into each day
+    recurring_tab = create_modern_frame(notebook, MODERN_COLORS['card'])
+    notebook.add(recurring_tab, text="↻ Recurring")
+
+    recurring_card = create_modern_frame(recurring_tab, MODERN_COLORS['card'])
+    recurring_card.pack(fill=tk.X, 
+                       padx=responsive_config.padding_medium, 
+                       pady=responsive_config.padding_medium)
+    recurring_card.configure(relief='solid', bd=1)
+
+    rule_kind_var = tk.StringVar(inc, value="Expense")
+    rule_name_var = tk.StringVar(inc)
+    rule_amount_var = tk.StringVar(inc)
+    rule_frequency_var = tk.StringVar(inc, value=RECURRING_FREQUENCIES[0])
+    rule_end_var = tk.StringVar(inc)
+
+    rule_form = create_modern_frame(recurring_card, MODERN_COLORS['card'])
+    rule_form.pack(fill=tk.X, padx=responsive_config.padding_medium, pady=responsive_config.padding_small)
+    for row, label in enumerate(("Type", "Name", "Amount (₱)", "Repeats", "Until (optional)")):
+        tk.Label(rule_form, text=label, 
+                font=MODERN_FONTS['body'], 
+                bg=MODERN_COLORS['card'], 
+                fg=MODERN_COLORS['text_primary']).grid(row=row, column=0, sticky='w', pady=2)
+    ttk.Combobox(rule_form, values=["Income", "Expense"], textvariable=rule_kind_var,
+                 state="readonly", font=MODERN_FONTS['body'], width=14).grid(row=0, column=1, sticky='ew', pady=2)
+    rule_name_entry = create_modern_entry(rule_form)
+    rule_name_entry.config(textvariable=rule_name_var)
+    rule_name_entry.grid(row=1, column=1, sticky='ew', pady=2)
+    rule_amount_entry = create_modern_entry(rule_form)
+    rule_amount_entry.config(textvariable=rule_amount_var)
+    rule_amount_entry.grid(row=2, column=1, sticky='ew', pady=2)
+    ttk.Combobox(rule_form, values=list(RECURRING_FREQUENCIES), textvariable=rule_frequency_var,
+                 state="readonly", font=MODERN_FONTS['body'], width=14).grid(row=3, column=1, sticky='ew', pady=2)
+    rule_end_entry = create_modern_entry(rule_form)
+    rule_end_entry.config(textvariable=rule_end_var)
+    rule_end_entry.grid(row=4, column=1, sticky='ew', pady=2)
+    rule_form.grid_columnconfigure(1, weight=1)
+
+    rules_listbox = tk.Listbox(recurring_card, height=4,
+                               font=MODERN_FONTS['small'],
+                               bg=MODERN_COLORS['white'], 
+                               fg=MODERN_COLORS['dark'],
+                               selectbackground=MODERN_COLORS['primary'],
+                               relief='flat', bd=0, highlightthickness=0)
+
+    def refresh_rules_list():
+        rules_listbox.delete(0, tk.END)
+        for rule in rider.recurring_rules.rules:
+            marker = "+" if rule["kind"] == "income" else "−"
+            rules_listbox.insert(tk.END, f"{marker} {RecurringRules.describe(rule)}")
+
+    def add_recurring_rule():
+        name = rule_name_var.get().strip()
+        amount = rule_amount_var.get().strip()
+        end = rule_end_var.get().strip() or None
+        if not name or not amount:
+            messagebox.showinfo("Error", "Please fill in the name and amount!", parent=inc)
+            return
+        try:
+            amount_val = float(amount)
+            if end is not None:
+                end = datetime.strptime(end, "%Y-%m-%d").strftime("%Y-%m-%d")
+        except ValueError:
+            messagebox.showerror("Error", "Amount must be a number and the end date YYYY-MM-DD", parent=inc)
+            return
+        if end is not None and end < current_date_str:
+            messagebox.showerror("Error", "End date must not be before this day", parent=inc)
+            return
+        rider.recurring_rules.add(rule_kind_var.get().lower(), name, amount_val,
+                            rule_frequency_var.get(), current_date_str, end)
+        save_recurring_rules(current_user)
+        rule_name_var.set("")
+        rule_amount_var.set("")
+        rule_end_var.set("")
+        refresh_rules_list()
+        refresh_recurring_today()
+
+    def remove_recurring_rule():
+        sel = rules_listbox.curselection()
+        if not sel:
+            messagebox.showinfo("Error", "No recurring entry selected", parent=inc)
+            return
+        if not messagebox.askyesno("Confirm", "Stop this recurring entry on every day?", parent=inc):
+            return
+        rider.recurring_rules.remove(sel[0])
+        save_recurring_rules(current_user)
+        refresh_rules_list()
+        refresh_recurring_today()
+
+    add_rule_btn = create_modern_button(recurring_card, "➕ Add Recurring", 
+                                      command=add_recurring_rule,
+                                      style='success', width=responsive_button_width)
+    add_rule_btn.pack(pady=(0, responsive_config.padding_small))
+    rules_listbox.pack(fill=tk.X, padx=responsive_config.padding_medium)
+    remove_rule_btn = create_modern_button(recurring_card, "🗑 Remove Selected", 
+                                         command=remove_recurring_rule,
+                                         style='danger', width=responsive_button_width)
+    remove_rule_btn.pack(pady=responsive_config.padding_small)
+
+    # Budgets tab: limits per category and period, checked on every expense edit
+    budget_tab = create_modern_frame(notebook, MODERN_COLORS['card'])
+    notebook.add(budget_tab, text="🎯 Budgets")
+
+    budget_card = create_modern_frame(budget_tab, MODERN_COLORS['card'])
+    budget_card.pack(fill=tk.X, 
+                    padx=responsive_config.padding_medium, 
+                    pady=responsive_config.padding_medium)
+    budget_card.configure(relief='solid', bd=1)
+
+    budget_category_var = tk.StringVar(inc, value=categories[1])
+    budget_period_var = tk.StringVar(inc, value="week")
+    budget_limit_var = tk.StringVar(inc)
+
+    budget_form = create_modern_frame(budget_card, MODERN_COLORS['card'])
+    budget_form.pack(fill=tk.X, padx=responsive_config.padding_medium, pady=responsive_config.padding_small)
+    for row, label in enumerate(("Category", "Per", "Limit (₱)")):
+        tk.Label(budget_form, text=label, 
+                font=MODERN_FONTS['body'], 
+                bg=MODERN_COLORS['card'], 
+                fg=MODERN_COLORS['text_primary']).grid(row=row, column=0, sticky='w', pady=2)
+    # Any category name can be typed, not only the dropdown ones
+    ttk.Combobox(budget_form, values=categories[:-1], textvariable=budget_category_var,
+                 font=MODERN_FONTS['body'], width=14).grid(row=0, column=1, sticky='ew', pady=2)
+    ttk.Combobox(budget_form, values=list(BUDGET_PERIODS), textvariable=budget_period_var,
+                 state="readonly", font=MODERN_FONTS['body'], width=14).grid(row=1, column=1, sticky='ew', pady=2)
+    budget_limit_entry = create_modern_entry(budget_form)
+    budget_limit_entry.config(textvariable=budget_limit_var)
+    budget_limit_entry.grid(row=2, column=1, sticky='ew', pady=2)
+    budget_form.grid_columnconfigure(1, weight=1)
+
+    budget_listbox = tk.Listbox(budget_card, height=4,
+                                font=MODERN_FONTS['small'],
+                                bg=MODERN_COLORS['white'], 
+                                fg=MODERN_COLORS['dark'],
+                                selectbackground=MODERN_COLORS['primary'],
+                                relief='flat', bd=0, highlightthickness=0)
+
+    def refresh_budget_list():
+        budget_listbox.delete(0, tk.END)
+        for i, budget in enumerate(rider.budget_tracker.budgets):
+            spent = rider.budget_tracker.window_spent(budget, current_date_str)
+            budget_listbox.insert(tk.END, f"{BudgetTracker.describe(budget)}  (₱{spent:,.2f} used)")
+            if spent > budget["limit"]:
+                budget_listbox.itemconfig(i, fg=MODERN_COLORS['danger'])
+
+    def add_budget():
+        category = budget_category_var.get().strip()
+        limit = budget_limit_var.get().strip()
+        if not category or not limit:
+            messagebox.showinfo("Error", "Please fill in the category and limit!", parent=inc)
+            return
+        try:
+            limit_val = float(limit)
+        except ValueError:
+            messagebox.showerror("Error", "Limit must be a valid number", parent=inc)
+            return
+        rider.budget_tracker.add(category, budget_period_var.get(), limit_val)
+        save_budgets(current_user)
+        budget_limit_var.set("")
+        refresh_budget_list()
+
+    def remove_budget():
+        sel = budget_listbox.curselection()
+        if not sel:
+            messagebox.showinfo("Error", "No budget selected", parent=inc)
+            return
+        rider.budget_tracker.remove(sel[0])
+        save_budgets(current_user)
+        refresh_budget_list()
+
+    add_budget_btn = create_modern_button(budget_card, "➕ Add Budget", 
+                                        command=add_budget,
+                                        style='success', width=responsive_button_width)
+    add_budget_btn.pack(pady=(0, responsive_config.padding_small))
+    budget_listbox.pack(fill=tk.X, padx=responsive_config.padding_medium)
+    remove_budget_btn = create_modern_button(budget_card, "🗑 Remove Selected", 
+                                           command=remove_budget,
+                                           style='danger', width=responsive_button_width)
+    remove_budget_btn.pack(pady=responsive_config.padding_small)
+    render_tracer.end("income input notebook")
+
     # Display section with tabs
     display_frame = create_modern_frame(scrollable_content, MODERN_COLORS['card'])
     display_frame.pack(fill=tk.X, pady=(0, responsive_config.padding_medium))
@@ -1416,7 +4535,7 @@ def income_screen(day, year, month):
     display_frame.configure(relief='solid', bd=1, height=display_height)
 
     # Create notebook for display tabs
-    display_notebook = ttk.Notebook(display_frame)
+    display_notebook = ttk.Notebook(display_frame, style='Money.TNotebook')
     display_notebook.pack(fill=tk.BOTH, expand=True, 
                          padx=responsive_config.padding_small, 
                          pady=responsive_config.padding_small)
@@ -1501,21 +4620,82 @@ def income_screen(day, year, month):
     # Bind double-click to edit expense
     expense_listbox.bind('<Double-Button-1>', lambda e: edit_expense_selected())
 
+    # Recurring entries falling on this day (read-only; edit them in the Recurring tab)
+    recurring_display_tab = create_modern_frame(display_notebook, MODERN_COLORS['card'])
+    display_notebook.add(recurring_display_tab, text="↻ Recurring")
+
+    recurring_listbox = tk.Listbox(recurring_display_tab, 
+                                  font=MODERN_FONTS['body'],
+                                  bg=MODERN_COLORS['white'], 
+                                  fg=MODERN_COLORS['dark'],
+                                  relief='flat',
+                                  bd=0,
+                                  highlightthickness=0)
+    recurring_listbox.pack(fill=tk.BOTH, expand=True, 
+                          padx=responsive_config.padding_small, 
+                          pady=responsive_config.padding_small)
+
+    def refresh_recurring_today():
+        recurring_listbox.delete(0, tk.END)
+        income_entries, expense_entries = rider.recurring_rules.entries_on(current_date_str)
+        for name, amount in income_entries:
+            recurring_listbox.insert(tk.END, f"+ {name:<28} ₱{amount:>10,.2f}")
+        for name, amount in expense_entries:
+            recurring_listbox.insert(tk.END, f"− {name:<28} ₱{amount:>10,.2f}")
+
+    def refresh_income_list():
+        income_listbox.delete(0, tk.END)
+        for entry in rider.current_entries:
+            income_listbox.insert(tk.END, f"{entry[0]:<30} ₱{entry[1]:>10,.2f}")
+
+    def refresh_expense_list():
+        expense_listbox.delete(0, tk.END)
+        for expense in rider.current_expenses:
+            expense_listbox.insert(tk.END, f"{expense[0]:<30} ₱{expense[1]:>10,.2f}")
+
     # Populate listboxes with existing data
-    for entry in current_entries:
-        income_listbox.insert(tk.END, f"{entry[0]:<30} ₱{entry[1]:>10,.2f}")
-    
-    for expense in current_expenses:
-        expense_listbox.insert(tk.END, f"{expense[0]:<30} ₱{expense[1]:>10,.2f}")
+    render_tracer.begin("income listbox population")
+    refresh_income_list()
+    refresh_expense_list()
+    refresh_rules_list()
+    refresh_recurring_today()
+    refresh_budget_list()
+    render_tracer.end("income listbox population")
+
+    # Ctrl+Z / Ctrl+Y undo and redo entry edits, newest first
+    def replay_edit(action):
+        touched = action()
+        if touched is None:
+            return
+        kind, date_str = touched
+        if date_str != current_date_str:
+            messagebox.showinfo("Undo", f"Changed {kind} entries on {date_str}", parent=inc)
+        elif kind == "income":
+            refresh_income_list()
+        else:
+            refresh_expense_list()
+            refresh_budget_list()
+
+    def refresh_income_screen():
+        """Reload this day's entries when a cached screen is shown again"""
+        if rider.current_buffer_date != current_date_str:
+            load_day_buffers(current_date_str)
+        refresh_income_list()
+        refresh_expense_list()
+        refresh_rules_list()
+        refresh_recurring_today()
+        refresh_budget_list()
+
+    inc.refresh_screen = refresh_income_screen
 
     # === EDIT MODE for income ===
     def edit_income_selected():
         sel = income_listbox.curselection()
         if not sel:
-            messagebox.showinfo("Error", "No income selected to edit")
+            messagebox.showinfo("Error", "No income selected to edit", parent=inc)
             return
         idx = sel[0]
-        old_name, old_amount = current_entries[idx]
+        old_name, old_amount = rider.current_entries[idx]
 
         edit_win = tk.Toplevel(inc)
         edit_win.title("Edit Income Entry")
@@ -1564,20 +4744,17 @@ def income_screen(day, year, month):
             new_name = e_name.get().strip()
             new_income_str = e_income.get().strip()
             if not new_name or not new_income_str:
-                messagebox.showerror("Error", "Fields cannot be empty")
+                messagebox.showerror("Error", "Fields cannot be empty", parent=edit_win)
                 return
             try:
                 new_income = float(new_income_str)
             except ValueError:
-                messagebox.showerror("Error", "Amount must be a valid number")
+                messagebox.showerror("Error", "Amount must be a valid number", parent=edit_win)
                 return
             # Update in-memory entries and listbox
-            current_entries[idx] = (new_name, new_income)
-            income_listbox.delete(0, tk.END)
-            for entry in current_entries:
-                income_listbox.insert(tk.END, f"{entry[0]:<30} ₱{entry[1]:>10,.2f}")
+            edit_day_entry("income", current_date_str, "replace", idx, (new_name, new_income))
+            refresh_income_list()
             edit_win.destroy()
-            save_data(current_date_str)
 
         # Save button
         save_btn = create_modern_button(edit_container, "Save Changes", 
@@ -1589,10 +4766,10 @@ def income_screen(day, year, month):
     def edit_expense_selected():
         sel = expense_listbox.curselection()
         if not sel:
-            messagebox.showinfo("Error", "No expense selected to edit")
+            messagebox.showinfo("Error", "No expense selected to edit", parent=inc)
             return
         idx = sel[0]
-        old_desc, old_amount = current_expenses[idx]
+        old_desc, old_amount = rider.current_expenses[idx]
 
         edit_win = tk.Toplevel(inc)
         edit_win.title("Edit Expense Entry")
@@ -1623,7 +4800,7 @@ def income_screen(day, year, month):
                 bg=MODERN_COLORS['light'], 
                 fg=MODERN_COLORS['dark']).pack(anchor='w', pady=(10, 5))
         
-        cat_var = tk.StringVar()
+        cat_var = tk.StringVar(edit_win)
         categories = ["Food", "Gas", "Maintenance", "Other"]
         cat_menu = ttk.Combobox(edit_container, values=categories, textvariable=cat_var, 
                                state="readonly", font=MODERN_FONTS['body'])
@@ -1634,7 +4811,7 @@ def income_screen(day, year, month):
             cat_menu.set("Other")
         cat_menu.pack(fill=tk.X, pady=(0, 15))
 
-        custom_var = tk.StringVar()
+        custom_var = tk.StringVar(edit_win)
         custom_entry = create_modern_entry(edit_container)
         custom_entry.config(textvariable=custom_var)
         if cat_menu.get() == "Other":
@@ -1665,19 +4842,18 @@ def income_screen(day, year, month):
                 new_desc = cat_menu.get()
             new_amount_str = e_amount.get().strip()
             if not new_desc or not new_amount_str:
-                messagebox.showerror("Error", "Fields cannot be empty")
+                messagebox.showerror("Error", "Fields cannot be empty", parent=edit_win)
                 return
             try:
                 new_amount = float(new_amount_str)
             except ValueError:
-                messagebox.showerror("Error", "Amount must be a valid number")
+                messagebox.showerror("Error", "Amount must be a valid number", parent=edit_win)
                 return
-            current_expenses[idx] = (new_desc, new_amount)
-            expense_listbox.delete(0, tk.END)
-            for expense in current_expenses:
-                expense_listbox.insert(tk.END, f"{expense[0]:<30} ₱{expense[1]:>10,.2f}")
+            alerts = edit_day_entry("expense", current_date_str, "replace", idx, (new_desc, new_amount))
+            refresh_expense_list()
+            refresh_budget_list()
             edit_win.destroy()
-            save_data(current_date_str)
+            warn_budget_alerts(inc, alerts)
 
         # Save button
         save_btn = create_modern_button(edit_container, "Save Changes", 
@@ -1689,52 +4865,52 @@ def income_screen(day, year, month):
     def delete_income_selected():
         sel = income_listbox.curselection()
         if not sel:
-            messagebox.showinfo("Error", "Please select an income entry to delete")
+            messagebox.showinfo("Error", "Please select an income entry to delete", parent=inc)
             return
         idx = sel[0]
-        entry = current_entries[idx]
+        entry = rider.current_entries[idx]
         
         # Show confirmation dialog
         result = messagebox.askyesno("Confirm Delete", 
                                    f"Are you sure you want to delete this income entry?\n\n"
                                    f"Source: {entry[0]}\n"
-                                   f"Amount: ₱{entry[1]:,.2f}")
+                                   f"Amount: ₱{entry[1]:,.2f}", parent=inc)
         
         if result:
-            current_entries.pop(idx)
+            edit_day_entry("income", current_date_str, "delete", idx)
             income_listbox.delete(idx)
-            save_data(current_date_str)
-            messagebox.showinfo("Success", "Income entry deleted successfully!")
+            messagebox.showinfo("Success", "Income entry deleted successfully!", parent=inc)
 
     # Delete selected expense with confirmation
     def delete_expense_selected():
         sel = expense_listbox.curselection()
         if not sel:
-            messagebox.showinfo("Error", "Please select an expense entry to delete")
+            messagebox.showinfo("Error", "Please select an expense entry to delete", parent=inc)
             return
         idx = sel[0]
-        expense = current_expenses[idx]
+        expense = rider.current_expenses[idx]
         
         # Show confirmation dialog
         result = messagebox.askyesno("Confirm Delete", 
                                    f"Are you sure you want to delete this expense entry?\n\n"
                                    f"Category: {expense[0]}\n"
-                                   f"Amount: ₱{expense[1]:,.2f}")
+                                   f"Amount: ₱{expense[1]:,.2f}", parent=inc)
         
         if result:
-            current_expenses.pop(idx)
+            edit_day_entry("expense", current_date_str, "delete", idx)
             expense_listbox.delete(idx)
-            save_data(current_date_str)
-            messagebox.showinfo("Success", "Expense entry deleted successfully!")
+            refresh_budget_list()
+            messagebox.showinfo("Success", "Expense entry deleted successfully!", parent=inc)
 
     # Responsive button section
+    render_tracer.begin("income button cards")
     button_frame = create_modern_frame(scrollable_content, MODERN_COLORS['background'])
     button_frame.pack(fill=tk.X, pady=responsive_config.padding_small)
 
     # Undo button (bottom section) - responsive sizing
     responsive_button_width = max(int(18 * responsive_config.scale_factor), 15)
     undo_btn = create_modern_button(button_frame, "← Back to Calendar", 
-                                   command=lambda: [inc.destroy(), navigate_back()],
+                                   command=lambda: [leave_screen(inc), navigate_back()],
                                    style='warning', width=responsive_button_width)
     undo_btn.pack(pady=responsive_config.padding_tiny)
 
@@ -1801,7 +4977,7 @@ def income_screen(day, year, month):
     # Navigation button - responsive sizing
     responsive_button_width_large = max(int(25 * responsive_config.scale_factor), 20)
     next_btn = create_modern_button(button_frame, "📈 View Summary", 
-                                  command=lambda:[save_data(current_date_str), inc.destroy(), total_screen(day, year, month)],
+                                  command=lambda:[save_data(current_date_str), leave_screen(inc), total_screen(day, year, month)],
                                   style='success', width=responsive_button_width_large)
     next_btn.pack(pady=responsive_config.padding_tiny)
 
@@ -1810,18 +4986,24 @@ def income_screen(day, year, month):
                                       command=lambda:[inc.destroy(), login_screen()],
                                       style='danger', width=responsive_button_width)
     signout_btn.pack(pady=responsive_config.padding_tiny)
+    render_tracer.end("income button cards")
 
     # Add global undo shortcut
-    add_global_undo_shortcut(inc)
+    add_global_undo_shortcut(inc,
+                             undo=lambda: replay_edit(undo_entry_edit),
+                             redo=lambda: replay_edit(redo_entry_edit))
 
+    render_tracer.watch_first_idle(inc)
     inc.mainloop()
 
 # ---------------- Expenses Screen (Edit/Delete + categories dropdown + Other) ----------------
 def expenses_screen(day, year, month):
     # Add to navigation history
     add_to_history('expenses_screen', day, year, month)
+    if show_cached_screen('expenses_screen', day, year, month):
+        return
     
-    exp = tk.Tk()
+    exp = new_screen_window('expenses_screen', day, year, month)
     exp.title("Expense Tracking - Money Rider")
     exp.configure(bg=MODERN_COLORS['background'])
     exp.resizable(False, False)
@@ -1829,12 +5011,16 @@ def expenses_screen(day, year, month):
     # Center the window with responsive sizing
     center_window(exp)
 
-    expense_var = tk.StringVar()
-    amount_var = tk.StringVar()
+    expense_var = tk.StringVar(exp)
+    amount_var = tk.StringVar(exp)
 
     # Store the current date
     current_date_str = f"{year}-{month:02d}-{day:02d}"
 
+    # Make sure the editing buffers hold this day's entries
+    if rider.current_buffer_date != current_date_str:
+        load_day_buffers(current_date_str)
+
     # Main container with responsive scrolling
     main_container = create_scrollable_frame(exp, MODERN_COLORS['background'])
     main_container.pack(fill=tk.BOTH, expand=True, 
@@ -1845,6 +5031,7 @@ def expenses_screen(day, year, month):
     scrollable_content = main_container.scrollable_frame
 
     # Header section
+    render_tracer.begin("expenses header")
     header_frame = create_modern_frame(scrollable_content, MODERN_COLORS['background'])
     header_frame.pack(fill=tk.X, pady=(0, responsive_config.padding_medium))
 
@@ -1861,6 +5048,7 @@ def expenses_screen(day, year, month):
                          bg=MODERN_COLORS['background'], 
                          fg=MODERN_COLORS['text_primary'])
     date_label.pack()
+    render_tracer.end("expenses header")
 
     # Helper to show Add Expense popup with category dropdown + 'Other' option
     def add_option():
@@ -1896,7 +5084,7 @@ def expenses_screen(day, year, month):
                 bg=MODERN_COLORS['light'], 
                 fg=MODERN_COLORS['dark']).pack(anchor='w', pady=(10, 5))
         
-        cat_var = tk.StringVar()
+        cat_var = tk.StringVar(popup)
         categories = ["Food", "Gas", "Maintenance", "Other"]
         cat_menu = ttk.Combobox(popup_container, values=categories, textvariable=cat_var, 
                                state="readonly", font=MODERN_FONTS['body'])
@@ -1904,7 +5092,7 @@ def expenses_screen(day, year, month):
         cat_menu.set(categories[0])
 
         # Custom category entry (hidden by default)
-        custom_var = tk.StringVar()
+        custom_var = tk.StringVar(popup)
         custom_entry = create_modern_entry(popup_container)
         custom_entry.config(textvariable=custom_var)
         
@@ -1932,22 +5120,22 @@ def expenses_screen(day, year, month):
                 category = custom_var.get().strip()
             amount = amount_var.get().strip()
             if not category or not amount:
-                messagebox.showerror("Error", "Please fill in all fields!")
+                messagebox.showerror("Error", "Please fill in all fields!", parent=popup)
                 return
             try:
                 amount_val = float(amount)
             except ValueError:
-                messagebox.showerror("Error", "Amount must be a valid number")
+                messagebox.showerror("Error", "Amount must be a valid number", parent=popup)
                 return
 
             entry = (category, amount_val)
-            current_expenses.append(entry)
+            alerts = edit_day_entry("expense", current_date_str, "insert", len(rider.current_expenses), entry)
             # Format with modern styling
             listbox.insert(tk.END, f"{category:<30} ₱{amount_val:>10,.2f}")
             amount_var.set("")
             custom_var.set("")
             popup.destroy()
-            save_data(current_date_str)
+            warn_budget_alerts(exp, alerts)
 
         # Save button
         save_btn = create_modern_button(popup_container, "Save Expense", 
@@ -1999,18 +5187,42 @@ def expenses_screen(day, year, month):
     # Bind double-click to edit expense
     listbox.bind('<Double-Button-1>', lambda e: edit_selected())
 
+    def refresh_list():
+        listbox.delete(0, tk.END)
+        for expense in rider.current_expenses:
+            listbox.insert(tk.END, f"{expense[0]:<30} ₱{expense[1]:>10,.2f}")
+
     # Populate listbox with existing expenses
-    for expense in current_expenses:
-        listbox.insert(tk.END, f"{expense[0]:<30} ₱{expense[1]:>10,.2f}")
+    render_tracer.begin("expenses listbox population")
+    refresh_list()
+    render_tracer.end("expenses listbox population")
+
+    # Ctrl+Z / Ctrl+Y only touch expense edits on this screen
+    def replay_edit(action):
+        touched = action(("expense",))
+        if touched is None:
+            return
+        if touched[1] == current_date_str:
+            refresh_list()
+        else:
+            messagebox.showinfo("Undo", f"Changed expense entries on {touched[1]}", parent=exp)
+
+    def refresh_expenses_screen():
+        """Reload this day's entries when a cached screen is shown again"""
+        if rider.current_buffer_date != current_date_str:
+            load_day_buffers(current_date_str)
+        refresh_list()
+
+    exp.refresh_screen = refresh_expenses_screen
 
     # === EDIT MODE for expense ===
     def edit_selected():
         sel = listbox.curselection()
         if not sel:
-            messagebox.showinfo("Error", "No expense selected to edit")
+            messagebox.showinfo("Error", "No expense selected to edit", parent=exp)
             return
         idx = sel[0]
-        old_desc, old_amount = current_expenses[idx]
+        old_desc, old_amount = rider.current_expenses[idx]
 
         edit_win = tk.Toplevel(exp)
         edit_win.title("Edit Expense")
@@ -2019,7 +5231,7 @@ def expenses_screen(day, year, month):
 
         tk.Label(edit_win, text="Category", bg="#1C1C1C", fg="white", font=("Bubblegum Sans", 12)).pack(pady=5)
         # show combobox with categories and 'Other' as fallback
-        cat_var = tk.StringVar()
+        cat_var = tk.StringVar(edit_win)
         categories = ["Food", "Gas", "Maintenance", "Other"]
         cat_menu = ttk.Combobox(edit_win, values=categories, textvariable=cat_var, state="readonly", font=("Bubblegum Sans", 12))
         # if old_desc matches one of categories, select it; else select Other and show custom
@@ -2029,7 +5241,7 @@ def expenses_screen(day, year, month):
             cat_menu.set("Other")
         cat_menu.pack(pady=5)
 
-        custom_var = tk.StringVar()
+        custom_var = tk.StringVar(edit_win)
         custom_entry = tk.Entry(edit_win, textvariable=custom_var, font=("Bubblegum Sans", 12))
         if cat_menu.get() == "Other":
             custom_var.set(old_desc)
@@ -2054,19 +5266,17 @@ def expenses_screen(day, year, month):
                 new_desc = cat_menu.get()
             new_amount_str = e_amount.get().strip()
             if not new_desc or not new_amount_str:
-                messagebox.showerror("Error", "Fields cannot be empty")
+                messagebox.showerror("Error", "Fields cannot be empty", parent=edit_win)
                 return
             try:
                 new_amount = float(new_amount_str)
             except ValueError:
-                messagebox.showerror("Error", "Amount must be a number")
+                messagebox.showerror("Error", "Amount must be a number", parent=edit_win)
                 return
-            current_expenses[idx] = (new_desc, new_amount)
-            listbox.delete(0, tk.END)
-            for expense in current_expenses:
-                listbox.insert(tk.END, f"{expense[0].ljust(30)}{str(expense[1]).rjust(10)}")
+            alerts = edit_day_entry("expense", current_date_str, "replace", idx, (new_desc, new_amount))
+            refresh_list()
             edit_win.destroy()
-            save_data(current_date_str)
+            warn_budget_alerts(exp, alerts)
 
         save_btn = create_modern_button(edit_win, "💾 Save", 
                                        command=save_edit,
@@ -2077,24 +5287,24 @@ def expenses_screen(day, year, month):
     def delete_selected():
         sel = listbox.curselection()
         if not sel:
-            messagebox.showinfo("Error", "No expense selected to delete")
+            messagebox.showinfo("Error", "No expense selected to delete", parent=exp)
             return
         idx = sel[0]
-        expense = current_expenses[idx]
+        expense = rider.current_expenses[idx]
         
         # Show confirmation dialog
         result = messagebox.askyesno("Confirm Delete", 
                                    f"Are you sure you want to delete this expense entry?\n\n"
                                    f"Category: {expense[0]}\n"
-                                   f"Amount: ₱{expense[1]:,.2f}")
+                                   f"Amount: ₱{expense[1]:,.2f}", parent=exp)
         
         if result:
-            current_expenses.pop(idx)
+            edit_day_entry("expense", current_date_str, "delete", idx)
             listbox.delete(idx)
-            save_data(current_date_str)
-            messagebox.showinfo("Success", "Expense entry deleted successfully!")
+            messagebox.showinfo("Success", "Expense entry deleted successfully!", parent=exp)
 
     # Button section
+    render_tracer.begin("expenses buttons")
     button_frame = create_modern_frame(scrollable_content, MODERN_COLORS['background'])
     button_frame.pack(fill=tk.X, pady=20)
 
@@ -2104,7 +5314,7 @@ def expenses_screen(day, year, month):
 
     # Undo button (left side)
     undo_btn = create_undo_button(action_frame, 
-                                 command=lambda: [exp.destroy(), navigate_back()],
+                                 command=lambda: [leave_screen(exp), navigate_back()],
                                  style='warning', width=10)
     undo_btn.pack(side=tk.LEFT, padx=5)
 
@@ -2128,7 +5338,7 @@ def expenses_screen(day, year, month):
     nav_frame.pack(pady=15)
 
     next_btn = create_modern_button(nav_frame, "View Summary", 
-                                  command=lambda:[save_data(current_date_str), exp.destroy(), total_screen(day, year, month)],
+                                  command=lambda:[save_data(current_date_str), leave_screen(exp), total_screen(day, year, month)],
                                   style='success', width=20)
     next_btn.pack(pady=5)
 
@@ -2137,36 +5347,199 @@ def expenses_screen(day, year, month):
                                       command=lambda:[exp.destroy(), login_screen()],
                                       style='danger', width=20)
     signout_btn.pack(pady=5)
+    render_tracer.end("expenses buttons")
 
     # Add global undo shortcut
-    add_global_undo_shortcut(exp)
+    add_global_undo_shortcut(exp,
+                             undo=lambda: replay_edit(undo_entry_edit),
+                             redo=lambda: replay_edit(redo_entry_edit))
 
+    render_tracer.watch_first_idle(exp)
     exp.mainloop()
 
 # ---------------- Save data for the current date (per-user) ----------------
 def save_data(date_str):
-    # compute totals from buffers and store into user's financial_data
-    total_income = sum(float(entry[1]) for entry in current_entries) if current_entries else 0.0
-    total_expenses = sum(float(expense[1]) for expense in current_expenses) if current_expenses else 0.0
-
-    # ensure financial_data is a dict for the logged-in user
-    # (financial_data loaded from user's file at login)
-    financial_data[date_str] = {
+    """Entry edits are persisted as they happen; saving only records a day that has none yet"""
+    if get_day(date_str) is None:
+        store_day(date_str, rider.current_entries, rider.current_expenses)
+
+def make_day(entries, expenses):
+    """The stored form of a day: totals plus its income and expense entries"""
+    total_income = sum(entry[1] for entry in entries) if entries else 0.0
+    total_expenses = sum(expense[1] for expense in expenses) if expenses else 0.0
+    return {
         "income": total_income,
         "expenses": total_expenses,
-        "entries": [[e[0], e[1]] for e in current_entries],
-        "expense_entries": [[e[0], e[1]] for e in current_expenses]
+        "entries": [[e[0], e[1]] for e in entries],
+        "expense_entries": [[e[0], e[1]] for e in expenses],
+        "v": LEDGER_SCHEMA_VERSION
     }
-    # persist to current user's file
+
+def store_day(date_str, entries, expenses):
+    # store the entries with their totals into user's financial_data
+    # ensure financial_data is a dict for the logged-in user
+    # (financial_data loaded from user's file at login)
+    if date_str[:4] in rider.archive_index:
+        # Archives are read-only; editing a day brings its year back first
+        restore_archived_year(current_user, date_str[:4])
+    old_day = rider.financial_data.get(date_str)
+    rider.financial_data[date_str] = make_day(entries, expenses)
+    update_ledger_aggregates(date_str, old_day, rider.financial_data[date_str])
+    mark_day_dirty(date_str)
+    # persist just this day to the current user's journal
+    if current_user:
+        append_journal(current_user, {"d": date_str, "day": rider.financial_data[date_str]})
+
+def mark_day_dirty(date_str):
+    """Forget what was derived from a day's old contents"""
+    _day_hash_cache.pop(date_str, None)
+
+def mutate_entry(date_str, kind, op, index, entry=None):
+    """Insert, replace or delete one stored entry; returns the op that reverses it.
+
+    The day's total and the aggregates move by the entry's delta and only
+    the op is journaled, so the cost does not grow with the number of
+    entries already on the day.
+    """
+    global ledger_generation
+    if date_str[:4] in rider.archive_index:
+        # Archives are read-only; editing a day brings its year back first
+        restore_archived_year(current_user, date_str[:4])
+    with aggregates_lock:
+        aggregates = rider.ledger_aggregates
+        if aggregates is None:
+            # A warm-up may be reading this very day; it must not publish
+            # totals that already include the edit below
+            ledger_generation += 1
+    inverse = apply_entry_op(rider.financial_data, date_str, kind, op, index, entry)
+    removed = inverse[2] if op != "insert" else None
+    added = entry if op != "delete" else None
+    if aggregates is not None:
+        aggregates.apply_entry_change(date_str, kind, removed, added)
+    else:
+        start_ledger_warmup()
+    mark_day_dirty(date_str)
     if current_user:
-        save_user_data(current_user)
+        append_journal(current_user, {"d": date_str, "k": kind, "op": op, "i": index,
+                                      "e": None if entry is None else [entry[0], entry[1]]})
+    return inverse
+
+def load_day_buffers(date_str):
+    """Load one day's entries into the editing buffers"""
+    daydata = get_day(date_str, {})
+    rider.current_entries = [tuple(e) for e in daydata.get("entries", [])]
+    rider.current_expenses = [tuple(e) for e in daydata.get("expense_entries", [])]
+    rider.current_buffer_date = date_str
+
+# ---------------- Undo / redo of entry edits ----------------
+# Each stack item is (sequence, date_str, op, index, entry): the inverse of an
+# edit, so undoing is a single list insert/pop/assignment on one day. Income
+# and expense edits have separate stacks; the sequence number orders them.
+
+def _edit_stacks(kind):
+    if kind == "income":
+        return rider.undo_stack, rider.redo_stack
+    return rider.undo_expense_stack, rider.redo_expense_stack
+
+def _apply_entry_op(entries, op, index, entry):
+    """Apply one op to an entry list and return the op that reverses it"""
+    if op == "insert":
+        entries.insert(index, entry)
+        return "delete", index, None
+    if op == "delete":
+        return "insert", index, entries.pop(index)
+    old_entry = entries[index]
+    entries[index] = entry
+    return "replace", index, old_entry
+
+def _edit_entry(kind, date_str, op, index, entry):
+    """Apply one edit to the stored day and, when it is loaded, to the editing buffers"""
+    inverse = mutate_entry(date_str, kind, op, index, entry)
+    if date_str == rider.current_buffer_date:
+        _apply_entry_op(rider.current_entries if kind == "income" else rider.current_expenses,
+                        op, index, None if entry is None else tuple(entry))
+    return inverse
+
+def _prime_budgets(kind, date_str):
+    """Build the budget counters from the ledger as it is before an expense edit"""
+    if kind != "expense":
+        return
+    if date_str[:4] in rider.archive_index:
+        # The counters must include the year the edit is about to bring back
+        restore_archived_year(current_user, date_str[:4])
+    rider.budget_tracker._counters()
+
+def _track_budgets(kind, date_str, op, entry, inverse):
+    """Feed one entry edit to the budget counters; returns any budget alerts"""
+    if kind != "expense":
+        return []
+    removed = inverse[2] if op in ("delete", "replace") else None
+    added = entry if op in ("insert", "replace") else None
+    return rider.budget_tracker.apply_entry_change(date_str, removed, added)
+
+def edit_day_entry(kind, date_str, op, index, entry=None):
+    """Insert, replace or delete an income/expense entry and record its inverse.
+
+    Returns the budgets the edit pushed over their limit as (budget, spent).
+    """
+    _prime_budgets(kind, date_str)
+    inverse = _edit_entry(kind, date_str, op, index, entry)
+    alerts = _track_budgets(kind, date_str, op, entry, inverse)
+
+    rider.edit_sequence += 1
+    undo, _ = _edit_stacks(kind)
+    undo.append((rider.edit_sequence, date_str) + inverse)
+    # A new edit makes every pending redo invalid
+    rider.redo_stack.clear()
+    rider.redo_expense_stack.clear()
+    return alerts
+
+def _replay_edit(kinds, undoing):
+    # Undo takes the newest edit (highest sequence); redo takes the most
+    # recently undone one, which is the lowest sequence on the redo stacks
+    chosen = None
+    for kind in kinds:
+        undo, redo = _edit_stacks(kind)
+        stack = undo if undoing else redo
+        if not stack:
+            continue
+        if (chosen is None or
+                (undoing and stack[-1][0] > chosen[1][-1][0]) or
+                (not undoing and stack[-1][0] < chosen[1][-1][0])):
+            chosen = (kind, stack)
+    if chosen is None:
+        return None
+
+    kind, stack = chosen
+    seq, date_str, op, index, entry = stack.pop()
+    _prime_budgets(kind, date_str)
+    inverse = _edit_entry(kind, date_str, op, index, entry)
+    _track_budgets(kind, date_str, op, entry, inverse)
+    undo, redo = _edit_stacks(kind)
+    (redo if undoing else undo).append((seq, date_str) + inverse)
+    return kind, date_str
+
+def undo_entry_edit(kinds=("income", "expense")):
+    """Undo the latest edit of the given kinds; returns (kind, date_str) or None"""
+    return _replay_edit(kinds, True)
+
+def redo_entry_edit(kinds=("income", "expense")):
+    """Redo the latest undone edit of the given kinds; returns (kind, date_str) or None"""
+    return _replay_edit(kinds, False)
+
+def clear_edit_history():
+    for stack in (rider.undo_stack, rider.redo_stack, rider.undo_expense_stack, rider.redo_expense_stack):
+        stack.clear()
+    rider.edit_sequence = 0
 
 # ---------------- Total Screen (keeps original layout) ----------------
 def total_screen(day, year, month):
     # Add to navigation history
     add_to_history('total_screen', day, year, month)
+    if show_cached_screen('total_screen', day, year, month):
+        return
     
-    total = tk.Tk()
+    total = new_screen_window('total_screen', day, year, month)
     total.title("Financial Summary - Money Rider")
     total.configure(bg=MODERN_COLORS['background'])
     total.resizable(False, False)
@@ -2174,6 +5547,11 @@ def total_screen(day, year, month):
     # Center the window with responsive sizing
     center_window(total)
 
+    # Make sure the editing buffers hold this day's entries
+    date_str = f"{year}-{month:02d}-{day:02d}"
+    if rider.current_buffer_date != date_str:
+        load_day_buffers(date_str)
+
     # Main container with responsive padding and scrolling
     main_container = create_scrollable_frame(total, MODERN_COLORS['background'])
     main_container.pack(fill=tk.BOTH, expand=True, 
@@ -2184,6 +5562,7 @@ def total_screen(day, year, month):
     scrollable_content = main_container.scrollable_frame
 
     # Header section
+    render_tracer.begin("summary header")
     header_frame = create_modern_frame(scrollable_content, MODERN_COLORS['background'])
     header_frame.pack(pady=(0, responsive_config.padding_large))
 
@@ -2195,14 +5574,15 @@ def total_screen(day, year, month):
     title_label.pack(pady=(0, responsive_config.padding_small))
 
     # Date display - responsive styling
-    date_str = f"{year}-{month:02d}-{day:02d}"
     date_label = tk.Label(header_frame, text=f"{date_str}", 
                          font=MODERN_FONTS['subheading'], 
                          bg=MODERN_COLORS['background'], 
                          fg=MODERN_COLORS['text_primary'])
     date_label.pack(pady=responsive_config.padding_tiny)
+    render_tracer.end("summary header")
 
     # Summary container - responsive card style
+    render_tracer.begin("summary cards")
     summary_container = create_modern_frame(scrollable_content, MODERN_COLORS['card'])
     summary_container.pack(fill=tk.X, pady=responsive_config.padding_large)
     summary_container.configure(relief='solid', bd=2)
@@ -2213,16 +5593,20 @@ def total_screen(day, year, month):
                      padx=responsive_config.padding_medium, 
                      pady=responsive_config.padding_large)
 
-    total_income = sum(float(i[1]) for i in current_entries) if current_entries else 0.0
+    total_income = sum(i[1] for i in rider.current_entries) if rider.current_entries else 0.0
+    # Recurring rules that fall on this day count towards its totals
+    recurring_income, recurring_expenses = rider.recurring_rules.range_totals(date_str, date_str)
+    total_income += recurring_income
     income_font_size = max(int(18 * responsive_config.scale_factor), 14)
     tk.Label(income_frame, text="Total Income:", 
             font=('Segoe UI', income_font_size, 'bold'), 
             bg=MODERN_COLORS['card'], 
             fg=MODERN_COLORS['text_primary']).pack(side=tk.LEFT)
-    tk.Label(income_frame, text=f"₱{total_income:,.2f}", 
+    income_value_label = tk.Label(income_frame, text=f"₱{total_income:,.2f}", 
             font=('Segoe UI', income_font_size, 'bold'), 
             bg=MODERN_COLORS['card'], 
-            fg=MODERN_COLORS['success']).pack(side=tk.RIGHT)
+            fg=MODERN_COLORS['success'])
+    income_value_label.pack(side=tk.RIGHT)
 
     # Expenses section - responsive styling
     expenses_frame = create_modern_frame(summary_container, MODERN_COLORS['card'])
@@ -2230,15 +5614,17 @@ def total_screen(day, year, month):
                        padx=responsive_config.padding_medium, 
                        pady=responsive_config.padding_large)
 
-    total_expenses = sum(float(e[1]) for e in current_expenses) if current_expenses else 0.0
+    total_expenses = sum(e[1] for e in rider.current_expenses) if rider.current_expenses else 0.0
+    total_expenses += recurring_expenses
     tk.Label(expenses_frame, text="Total Expenses:", 
             font=('Segoe UI', income_font_size, 'bold'), 
             bg=MODERN_COLORS['card'], 
             fg=MODERN_COLORS['text_primary']).pack(side=tk.LEFT)
-    tk.Label(expenses_frame, text=f"₱{total_expenses:,.2f}", 
+    expenses_value_label = tk.Label(expenses_frame, text=f"₱{total_expenses:,.2f}", 
             font=('Segoe UI', income_font_size, 'bold'), 
             bg=MODERN_COLORS['card'], 
-            fg=MODERN_COLORS['danger']).pack(side=tk.RIGHT)
+            fg=MODERN_COLORS['danger'])
+    expenses_value_label.pack(side=tk.RIGHT)
 
     # Net total section - responsive styling
     net_frame = create_modern_frame(summary_container, MODERN_COLORS['card'])
@@ -2256,35 +5642,134 @@ def total_screen(day, year, month):
             fg=MODERN_COLORS['text_primary']).pack(side=tk.LEFT, 
                                                    padx=net_padding, 
                                                    pady=responsive_config.padding_medium)
-    tk.Label(net_frame, text=f"₱{day_total:,.2f}", 
+    net_value_label = tk.Label(net_frame, text=f"₱{day_total:,.2f}", 
             font=('Segoe UI', net_font_size, 'bold'), 
             bg=MODERN_COLORS['card'], 
-            fg=MODERN_COLORS['success'] if day_total >= 0 else MODERN_COLORS['danger']).pack(side=tk.RIGHT, 
-                                                                                            padx=net_padding, 
-                                                                                            pady=responsive_config.padding_medium)
+            fg=MODERN_COLORS['success'] if day_total >= 0 else MODERN_COLORS['danger'])
+    net_value_label.pack(side=tk.RIGHT, 
+                         padx=net_padding, 
+                         pady=responsive_config.padding_medium)
+    render_tracer.end("summary cards")
+
+    # Forecast panel - where the month and quarter are heading
+    render_tracer.begin("forecast panel")
+    forecast_container = create_modern_frame(scrollable_content, MODERN_COLORS['card'])
+    forecast_container.pack(fill=tk.X, pady=responsive_config.padding_medium)
+    forecast_container.configure(relief='solid', bd=2)
+
+    tk.Label(forecast_container, text=f"📈 {calendar.month_name[month]} Forecast", 
+            font=MODERN_FONTS['subheading'], 
+            bg=MODERN_COLORS['card'], 
+            fg=MODERN_COLORS['text_primary']).pack(pady=(responsive_config.padding_small, 0))
+    forecast_actual_label = tk.Label(forecast_container, 
+                                     font=MODERN_FONTS['body'], 
+                                     bg=MODERN_COLORS['card'], 
+                                     fg=MODERN_COLORS['text_secondary'])
+    forecast_actual_label.pack()
+
+    forecast_grid = create_modern_frame(forecast_container, MODERN_COLORS['card'])
+    forecast_grid.pack(padx=responsive_config.padding_medium, pady=responsive_config.padding_small)
+    for column, heading in enumerate(("Model", "Month", "Quarter")):
+        tk.Label(forecast_grid, text=heading, 
+                font=MODERN_FONTS['body'], 
+                bg=MODERN_COLORS['card'], 
+                fg=MODERN_COLORS['text_primary']).grid(row=0, column=column, sticky='w' if column == 0 else 'e', padx=8)
+    forecast_cells = []
+    for row, model in enumerate(FORECAST_MODELS, start=1):
+        tk.Label(forecast_grid, text=model, 
+                font=MODERN_FONTS['small'], 
+                bg=MODERN_COLORS['card'], 
+                fg=MODERN_COLORS['text_primary']).grid(row=row, column=0, sticky='w', padx=8)
+        cells = []
+        for column in (1, 2):
+            cell = tk.Label(forecast_grid, font=MODERN_FONTS['small'], bg=MODERN_COLORS['card'])
+            cell.grid(row=row, column=column, sticky='e', padx=8)
+            cells.append(cell)
+        forecast_cells.append(cells)
+
+    forecast_target_label = tk.Label(forecast_container, 
+                                     font=MODERN_FONTS['body'], 
+                                     bg=MODERN_COLORS['card'])
+    forecast_target_label.pack()
+
+    def refresh_forecast():
+        forecast = forecast_month(year, month)
+        forecast_actual_label.config(
+            text=f"Net so far: ₱{forecast['month_actual']:,.2f} (through {forecast['as_of']})")
+        projections = forecast["projections"] or [(model, None, None) for model in FORECAST_MODELS]
+        for cells, (_, month_net, quarter_net) in zip(forecast_cells, projections):
+            for cell, value in zip(cells, (month_net, quarter_net)):
+                if value is None:
+                    cell.config(text="—", fg=MODERN_COLORS['text_secondary'])
+                else:
+                    cell.config(text=f"₱{value:,.2f}",
+                                fg=MODERN_COLORS['success'] if value >= 0 else MODERN_COLORS['danger'])
+        if rider.monthly_target is None:
+            forecast_target_label.config(text="No monthly target set", fg=MODERN_COLORS['text_secondary'])
+        elif forecast["projections"] is None:
+            forecast_target_label.config(text=f"Target ₱{rider.monthly_target:,.2f}", fg=MODERN_COLORS['text_secondary'])
+        else:
+            hits = sum(month_net >= rider.monthly_target for _, month_net, _ in forecast["projections"])
+            forecast_target_label.config(
+                text=f"Target ₱{rider.monthly_target:,.2f}: {hits} of {len(FORECAST_MODELS)} models reach it",
+                fg=MODERN_COLORS['success'] if hits * 2 > len(FORECAST_MODELS) else MODERN_COLORS['danger'])
+
+    def set_monthly_target():
+        target = simpledialog.askfloat("Monthly Target", "Net you aim for each month (0 clears it):",
+                                       parent=total, initialvalue=rider.monthly_target)
+        if target is None:
+            return
+        rider.monthly_target = target or None
+        if current_user:
+            save_monthly_target(current_user)
+        refresh_forecast()
+
+    create_modern_button(forecast_container, "🎯 Set Target", command=set_monthly_target,
+                         style='secondary', width=15).pack(pady=responsive_config.padding_small)
+    refresh_forecast()
+    render_tracer.end("forecast panel")
+
+    def refresh_summary():
+        """Recompute the totals when a cached summary is shown again"""
+        if rider.current_buffer_date != date_str:
+            load_day_buffers(date_str)
+        total_income = sum(i[1] for i in rider.current_entries) if rider.current_entries else 0.0
+        total_expenses = sum(e[1] for e in rider.current_expenses) if rider.current_expenses else 0.0
+        recurring_income, recurring_expenses = rider.recurring_rules.range_totals(date_str, date_str)
+        total_income += recurring_income
+        total_expenses += recurring_expenses
+        day_total = total_income - total_expenses
+        income_value_label.config(text=f"₱{total_income:,.2f}")
+        expenses_value_label.config(text=f"₱{total_expenses:,.2f}")
+        net_value_label.config(text=f"₱{day_total:,.2f}",
+                               fg=MODERN_COLORS['success'] if day_total >= 0 else MODERN_COLORS['danger'])
+        refresh_forecast()
+
+    total.refresh_screen = refresh_summary
 
     # Navigation buttons - responsive styling
+    render_tracer.begin("summary buttons")
     button_frame = create_modern_frame(scrollable_content, MODERN_COLORS['background'])
     button_frame.pack(pady=responsive_config.padding_medium)
 
     # Undo button - responsive sizing
     responsive_button_width = max(int(15 * responsive_config.scale_factor), 12)
     undo_btn = create_undo_button(button_frame, 
-                                 command=lambda: [total.destroy(), navigate_back()],
+                                 command=lambda: [leave_screen(total), navigate_back()],
                                  style='warning', width=responsive_button_width)
     undo_btn.pack(pady=responsive_config.padding_small)
 
     # Back to expenses button - responsive sizing
     responsive_button_width_medium = max(int(20 * responsive_config.scale_factor), 15)
     back_btn = create_modern_button(button_frame, "💸 Back to Expenses", 
-                                  command=lambda:[total.destroy(), expenses_screen(day, year, month)],
+                                  command=lambda:[leave_screen(total), expenses_screen(day, year, month)],
                                   style='secondary', width=responsive_button_width_medium)
     back_btn.pack(pady=responsive_config.padding_small)
 
     # Finish button - responsive sizing
     responsive_button_width_large = max(int(25 * responsive_config.scale_factor), 20)
     finish_btn = create_modern_button(button_frame, "✅ Finish & Return to Calendar", 
-                                    command=lambda:[total.destroy(), calendar_screen()],
+                                    command=lambda:[leave_screen(total), calendar_screen()],
                                     style='primary', width=responsive_button_width_large)
     finish_btn.pack(pady=responsive_config.padding_small)
 
@@ -2293,12 +5778,26 @@ def total_screen(day, year, month):
                                       command=lambda:[total.destroy(), login_screen()],
                                       style='danger', width=responsive_button_width_medium)
     signout_btn.pack(pady=responsive_config.padding_tiny)
+    render_tracer.end("summary buttons")
 
     # Add global undo shortcut
     add_global_undo_shortcut(total)
 
+    render_tracer.watch_first_idle(total)
     total.mainloop()
 
 # ---------------- Start the app ----------------
 if __name__ == "__main__":
-    splash_screen()
+    if "--benchmark-snapshot" in sys.argv:
+        benchmark_snapshot()
+    elif "--check-columnar" in sys.argv:
+        check_columnar_ledger()
+    elif "--sync-server" in sys.argv:
+        run_sync_server()
+    elif "--fleet-report" in sys.argv:
+        # --fleet-report START END, dates as YYYY-MM-DD
+        start_arg = sys.argv.index("--fleet-report")
+        print_fleet_report(sys.argv[start_arg + 1], sys.argv[start_arg + 2])
+    else:
+        # --profile-startup prints first-paint/interactive times and quits
+        splash_screen()